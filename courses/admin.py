@@ -1,29 +1,60 @@
+from django import forms
 from django.contrib import admin
-from django.db import models, transaction
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery
 from .models import Course, UserRole, Lesson
 
 
 class LessonInline(admin.TabularInline):
+    """
+    The lessons of a course, in order. Their sparse sort keys are not
+    editable; new lessons are added last.
+    """
+
     model = Lesson
     extra = 0
-    fields = ("title", "order")
+    fields = ("title", "position")
+    readonly_fields = ("position",)
     ordering = ("order",)
 
+    @admin.display(description="Position")
+    def position(self, obj):
+        return obj.get_position() if obj.pk else "-"
+
 
 class CourseAdmin(admin.ModelAdmin):
     list_display = ("title", "created_by", "is_published", "created_at", "updated_at")
     list_filter = ("is_published", "created_by")
     search_fields = ("title", "description")
-    ordering = ("-created_at",)
+    ordering = ("-created_at", "-id")
     actions = ["publish_courses"]
     inlines = [LessonInline]
 
     @transaction.atomic
+    def save_formset(self, request, form, formset, change):
+        if formset.model is not Lesson:
+            return super().save_formset(request, form, formset, change)
+
+        lessons = formset.save(commit=False)
+        for lesson in formset.deleted_objects:
+            lesson.delete()
+        for lesson in lessons:
+            if lesson.pk is None:
+                lesson.order = Lesson.objects.order_for_position(lesson.course)
+            lesson.save()
+        formset.save_m2m()
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Search the stored full-text vector instead of ILIKE over the text columns.
+        """
+        if not search_term:
+            return super().get_search_results(request, queryset, search_term)
+        return queryset.search(search_term), False
+
     def publish_courses(self, request, queryset):
-        for course in queryset:
-            if not course.is_published:
-                course.publish()
-        self.message_user(request, f"{queryset.count()} courses have been published.")
+        published = queryset.publish()
+        self.message_user(request, f"{published} courses have been published.")
 
     publish_courses.short_description = "Mark selected courses as published"
 
@@ -51,28 +82,70 @@ class UserRoleAdmin(admin.ModelAdmin):
         )
 
 
+class LessonAdminForm(forms.ModelForm):
+    """
+    Lesson form taking the position of the lesson, like the API, instead of
+    its sparse sort key.
+    """
+
+    position = forms.IntegerField(
+        min_value=1,
+        required=False,
+        help_text=(
+            "Position of the lesson within the course, starting at 1. Leave "
+            "empty to add the lesson last, or to keep it where it is."
+        ),
+    )
+
+    class Meta:
+        model = Lesson
+        fields = ("course", "title", "content")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.instance.pk:
+            self.fields["position"].initial = self.instance.get_position()
+
+
 class LessonAdmin(admin.ModelAdmin):
-    list_display = ("course", "title", "order", "content")
+    form = LessonAdminForm
+    list_display = ("course", "title", "position", "content")
     list_filter = ("course",)
     search_fields = ("title", "course__title")
     ordering = ("course", "order")
 
+    def get_queryset(self, request):
+        """
+        Annotates the position of each lesson, counted in its whole course
+        whatever the filters of the changelist.
+        """
+        earlier = (
+            Lesson.objects.filter(
+                course=OuterRef("course"), order__lte=OuterRef("order")
+            )
+            .order_by()
+            .values("course")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        return super().get_queryset(request).annotate(position=Subquery(earlier))
+
+    @admin.display(description="Position", ordering="order")
+    def position(self, obj):
+        return obj.get_position()
+
     @transaction.atomic
     def save_model(self, request, obj, form, change):
-        if not change:
-            max_order = Lesson.objects.filter(course=obj.course).aggregate(
-                models.Max("order")
-            )["order__max"]
-            obj.order = (max_order or 0) + 1
-        else:
-            existing = Lesson.objects.filter(course=obj.course, order=obj.order)
-            if existing.exists() and existing.first().id != obj.id:
-                self.message_user(
-                    request,
-                    "A lesson with this order already exists in the course.",
-                    level="error",
-                )
-                return
+        """
+        Places the lesson at the requested position, see
+        `LessonQuerySet.order_for_position`; new lessons without one go last.
+        """
+        position = form.cleaned_data.get("position")
+        moved = position is not None and position != form.fields["position"].initial
+        if not change or moved or "course" in form.changed_data:
+            obj.order = Lesson.objects.order_for_position(
+                obj.course, position, lesson=obj if change else None
+            )
         super().save_model(request, obj, form, change)
 
 
@@ -0,0 +1,94 @@
+import hashlib
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+CATALOG_VERSION_KEY = "courses:catalog:version"
+
+
+def get_catalog_version():
+    """
+    Returns the current version of the public course catalog.
+    """
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        # Start from a fresh value so entries cached before an eviction of the
+        # version key can never be served again.
+        cache.add(CATALOG_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(CATALOG_VERSION_KEY)
+    return version
+
+
+def bump_catalog_version():
+    """
+    Moves the catalog to a new version, orphaning every cached page.
+    """
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        get_catalog_version()
+
+
+def invalidate_catalog():
+    """
+    Invalidates the cached public catalog.
+    - Bumps at once, so the writing transaction never reads a stale page.
+    - Bumps again on commit, dropping any page another request cached from
+      the pre-commit state in between.
+    """
+    bump_catalog_version()
+    transaction.on_commit(bump_catalog_version)
+
+
+def catalog_cache_key(request):
+    """
+    Cache key of an anonymous catalog page, unique per version and query string.
+    """
+    path = hashlib.md5(request.get_full_path().encode()).hexdigest()
+    return f"courses:catalog:{get_catalog_version()}:{path}"
+
+
+def get_cached_catalog(request, key):
+    """
+    Returns the response for a cached catalog page, or None on a cache miss.
+    Conditional requests are answered from the cached validators.
+    """
+    entry = cache.get(key)
+    if entry is None:
+        return None
+
+    response = get_conditional_response(
+        request,
+        etag=entry["etag"],
+        last_modified=parse_http_date_safe(entry["last_modified"] or ""),
+    )
+    if response is None:
+        response = HttpResponse(entry["content"], content_type=entry["content_type"])
+    response["ETag"] = entry["etag"]
+    if entry["last_modified"]:
+        response["Last-Modified"] = entry["last_modified"]
+    return response
+
+
+def cache_catalog(key, response):
+    """
+    Stores the rendered bytes of a catalog page once the response is rendered.
+    """
+
+    def store(rendered):
+        cache.set(
+            key,
+            {
+                "content": rendered.content,
+                "content_type": rendered["Content-Type"],
+                "etag": rendered["ETag"],
+                "last_modified": rendered.get("Last-Modified"),
+            },
+            settings.COURSE_CATALOG_CACHE_TIMEOUT,
+        )
+
+    response.add_post_render_callback(store)
@@ -0,0 +1,77 @@
+import posixpath
+import zipfile
+import zlib
+from django.conf import settings
+
+MARKDOWN_EXTENSIONS = (".md", ".markdown")
+
+# Raised by zipfile for corrupt, truncated or unsupported archives
+ARCHIVE_ERRORS = (zipfile.BadZipFile, RuntimeError, EOFError, OSError, zlib.error)
+
+
+def read_markdown_lesson(text, name):
+    """
+    Returns the lesson of a Markdown file as `{"title": ..., "content": ...}`.
+    - The title is the first line, if it is a `# ` heading; the content is
+      the rest of the file.
+    - Otherwise the title is the file name, and the content the whole file.
+    """
+    first, _, rest = text.lstrip().partition("\n")
+    if first.startswith("# "):
+        return {"title": first[2:].strip(), "content": rest.strip()}
+    title = posixpath.splitext(posixpath.basename(name))[0]
+    return {"title": title, "content": text.strip()}
+
+
+def read_lesson_archive(file, max_lessons):
+    """
+    Returns the lessons of an uploaded zip of UTF-8 Markdown files, ordered
+    by their path in the archive, e.g. `01-intro.md`, `02-setup.md`.
+    Other files are ignored.
+
+    Raises ValueError for an unreadable archive, one holding more than
+    `max_lessons` lessons, or one whose lessons decompress to more than
+    LESSON_IMPORT_MAX_FILE_SIZE bytes each or LESSON_IMPORT_MAX_SIZE in all.
+    The sizes are checked before decompressing; zipfile never decompresses
+    an entry past the size it declares.
+    """
+    try:
+        archive = zipfile.ZipFile(file)
+    except ARCHIVE_ERRORS:
+        raise ValueError("Not a zip archive.")
+
+    with archive:
+        entries = sorted(
+            (
+                info
+                for info in archive.infolist()
+                if not info.is_dir()
+                and info.filename.lower().endswith(MARKDOWN_EXTENSIONS)
+                and not info.filename.startswith("__MACOSX/")
+            ),
+            key=lambda info: info.filename,
+        )
+        if not entries:
+            raise ValueError("The archive holds no Markdown files.")
+        if len(entries) > max_lessons:
+            raise ValueError(f"The archive holds more than {max_lessons} lessons.")
+        for info in entries:
+            if info.file_size > settings.LESSON_IMPORT_MAX_FILE_SIZE:
+                raise ValueError(
+                    f"{info.filename} is larger than "
+                    f"{settings.LESSON_IMPORT_MAX_FILE_SIZE} bytes."
+                )
+        if sum(info.file_size for info in entries) > settings.LESSON_IMPORT_MAX_SIZE:
+            raise ValueError(
+                f"The lessons are larger than {settings.LESSON_IMPORT_MAX_SIZE} bytes."
+            )
+
+        try:
+            return [
+                read_markdown_lesson(
+                    archive.read(info).decode("utf-8-sig"), info.filename
+                )
+                for info in entries
+            ]
+        except (*ARCHIVE_ERRORS, UnicodeDecodeError) as error:
+            raise ValueError(f"Cannot read the archive: {error}")
@@ -0,0 +1,123 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q
+from django.contrib.auth import get_user_model
+from courses.models import Course
+
+
+class Rollback(Exception):
+    """Raised to discard the benchmark data once the report is printed."""
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the authenticated course-list query on a synthetic catalog. "
+        "All generated rows are rolled back when the command finishes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--courses",
+            type=int,
+            default=1_000_000,
+            help="Number of courses to generate (default: 1,000,000).",
+        )
+        parser.add_argument(
+            "--published-ratio",
+            type=float,
+            default=0.9,
+            help="Fraction of generated courses that are published (default: 0.9).",
+        )
+        parser.add_argument(
+            "--page-size",
+            type=int,
+            default=20,
+            help="Number of rows fetched per query (default: 20).",
+        )
+        parser.add_argument(
+            "--runs",
+            type=int,
+            default=20,
+            help="Number of timed executions per query (default: 20).",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                user = self._seed(options["courses"], options["published_ratio"])
+                self._report(user, options["page_size"], options["runs"])
+                raise Rollback
+        except Rollback:
+            self.stdout.write(self.style.NOTICE("Benchmark data rolled back."))
+
+    def _seed(self, courses, published_ratio):
+        """Insert the synthetic catalog with a single INSERT ... SELECT."""
+        self.stdout.write(self.style.NOTICE(f"Generating {courses} courses..."))
+        User = get_user_model()
+        owner = User.objects.create_user(username="benchmark_owner")
+        other = User.objects.create_user(username="benchmark_other")
+
+        # One course in a thousand belongs to the benchmarked user
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {Course._meta.db_table}
+                    (title, description, created_by_id, is_published,
+                     created_at, updated_at, lesson_count, student_count)
+                SELECT
+                    'Course ' || g,
+                    'Description of course ' || g,
+                    CASE WHEN g %% 1000 = 0 THEN %s ELSE %s END,
+                    random() < %s,
+                    now() - g * interval '1 second',
+                    now(),
+                    0,
+                    0
+                FROM generate_series(1, %s) AS g
+                """,
+                [owner.pk, other.pk, published_ratio, courses],
+            )
+            cursor.execute(f"ANALYZE {Course._meta.db_table}")
+        return owner
+
+    def _report(self, user, page_size, runs):
+        ordering = ("-created_at", "-id")
+        middle = Course.objects.order_by(*ordering).values_list(
+            "created_at", flat=True
+        )[Course.objects.count() // 2]
+
+        queries = {
+            "OR + DISTINCT (previous)": Course.objects.filter(
+                Q(is_published=True) | Q(created_by=user)
+            ).distinct(),
+            "visible_to (OR, no DISTINCT)": Course.objects.visible_to(user),
+            "UNION ALL of published and own drafts": Course.objects.filter(
+                is_published=True
+            ).union(
+                Course.objects.filter(created_by=user, is_published=False), all=True
+            ),
+        }
+        for name, queryset in queries.items():
+            self._run(
+                f"{name}, first page", queryset.order_by(*ordering), page_size, runs
+            )
+            if not queryset.query.combinator:
+                deep = queryset.filter(created_at__lt=middle).order_by(*ordering)
+                self._run(f"{name}, middle page", deep, page_size, runs)
+
+    def _run(self, name, queryset, page_size, runs):
+        queryset = queryset[: page_size + 1]
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            list(queryset.all())
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+
+        self.stdout.write(self.style.SUCCESS(f"\n== {name}"))
+        self.stdout.write(queryset.explain(analyze=True, buffers=True))
+        self.stdout.write(
+            f"median {timings[len(timings) // 2]:.2f} ms, "
+            f"max {timings[-1]:.2f} ms over {runs} runs"
+        )
@@ -0,0 +1,89 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+from courses.models import Course, EnrollmentRequest, UserRole
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark synchronous enrollment against the asynchronous queue, with "
+        "concurrent enrolls into one course. The generated users and course "
+        "are deleted when the command finishes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=5000,
+            help="Number of enroll requests, one per user (default: 5000).",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=16,
+            help="Number of concurrent database connections (default: 16).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Batch size used to drain the queue (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        prefix = f"benchmark_enroll_{time.time_ns()}"
+        owner = User.objects.create_user(username=prefix)
+        course = Course.objects.create(
+            title="Benchmark", description="Launch day.", created_by=owner
+        )
+        users = User.objects.bulk_create(
+            User(username=f"{prefix}_{i}", email=f"{prefix}_{i}@example.com")
+            for i in range(options["requests"])
+        )
+        try:
+            elapsed = self._run(options["concurrency"], users, course.enroll_student)
+            self._report("sync enroll", len(users), elapsed)
+
+            UserRole.objects.filter(course=course).delete()
+            enqueue = partial(EnrollmentRequest.objects.enqueue, course=course)
+            accepted = self._run(options["concurrency"], users, enqueue)
+            self._report("async accept", len(users), accepted)
+
+            start = time.perf_counter()
+            while EnrollmentRequest.objects.drain(options["batch_size"])[0]:
+                pass
+            drained = time.perf_counter() - start
+            self._report("async drain", len(users), drained)
+            self._report("async end to end", len(users), accepted + drained)
+
+            course.refresh_from_db()
+            assert course.student_count == len(users)
+        finally:
+            course.delete()
+            User.objects.filter(username__startswith=prefix).delete()
+
+    def _run(self, concurrency, users, enroll):
+        """Enrolls the users from `concurrency` threads, returning the wall time."""
+
+        def worker(chunk):
+            try:
+                for user in chunk:
+                    enroll(user)
+            finally:
+                connection.close()
+
+        chunks = [users[i::concurrency] for i in range(concurrency)]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(worker, chunks))
+        return time.perf_counter() - start
+
+    def _report(self, label, count, elapsed):
+        self.stdout.write(
+            f"{label:<18} {elapsed:8.2f}s  {count / elapsed:10.0f} enrollments/s"
+        )
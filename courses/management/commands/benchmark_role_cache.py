@@ -0,0 +1,105 @@
+import random
+import time
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from courses.models import Course, UserRole
+from courses.roles import (
+    get_user_roles,
+    local_roles,
+    reset_role_cache_stats,
+    role_cache_stats,
+)
+
+
+class Rollback(Exception):
+    """Raised to discard the benchmark data once the report is printed."""
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark role lookups with and without the role cache, on random "
+        "users and courses. All generated rows are rolled back when the "
+        "command finishes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=200,
+            help="Number of users to generate (default: 200).",
+        )
+        parser.add_argument(
+            "--courses",
+            type=int,
+            default=20,
+            help="Number of courses to generate (default: 20).",
+        )
+        parser.add_argument(
+            "--lookups",
+            type=int,
+            default=20000,
+            help="Number of role lookups per run (default: 20000).",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                users, courses = self._seed(options["users"], options["courses"])
+                rng = random.Random(0)
+                pairs = [
+                    (rng.choice(users), rng.choice(courses))
+                    for _ in range(options["lookups"])
+                ]
+                self._run("database", pairs, self._query_roles)
+                local_roles.clear()
+                reset_role_cache_stats()
+                self._run("role cache", pairs, get_user_roles)
+                self.stdout.write(f"role cache stats   {role_cache_stats()}")
+                raise Rollback
+        except Rollback:
+            self.stdout.write(self.style.NOTICE("Benchmark data rolled back."))
+
+    def _seed(self, users, courses):
+        """Generate the users and courses, each user enrolled in half of them."""
+        User = get_user_model()
+        prefix = f"benchmark_roles_{time.time_ns()}"
+        owner = User.objects.create_user(username=prefix)
+        courses = Course.objects.bulk_create(
+            Course(title=f"Benchmark {i}", description="Roles.", created_by=owner)
+            for i in range(courses)
+        )
+        users = User.objects.bulk_create(
+            User(username=f"{prefix}_{i}", email=f"{prefix}_{i}@example.com")
+            for i in range(users)
+        )
+        UserRole.objects.bulk_create(
+            UserRole(user=user, course=course, role=UserRole.ROLE_STUDENT)
+            for user in users
+            for course in courses[::2]
+        )
+        return users, courses
+
+    def _query_roles(self, user, course):
+        return frozenset(
+            user.roles.filter(course=course).values_list("role", flat=True)
+        )
+
+    def _run(self, label, pairs, lookup):
+        queries = 0
+
+        def count_queries(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count_queries):
+            start = time.perf_counter()
+            for user, course in pairs:
+                lookup(user, course)
+            elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f"{label:<18} {elapsed:8.2f}s  {len(pairs) / elapsed:10.0f} lookups/s"
+            f"  {queries:8d} queries"
+        )
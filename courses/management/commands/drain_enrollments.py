@@ -0,0 +1,54 @@
+import time
+from django.core.management.base import BaseCommand
+
+from courses.models import EnrollmentRequest
+
+
+class Command(BaseCommand):
+    help = (
+        "Drain the asynchronous enrollment queue into student roles, in batches. "
+        "Several workers can run side by side."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of queued enrollments written per statement (default: 1000).",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait when the queue is empty (default: 1.0).",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once the queue is empty instead of waiting for more.",
+        )
+
+    def handle(self, *args, **options):
+        total_drained = total_enrolled = 0
+        while True:
+            drained, enrolled = EnrollmentRequest.objects.drain(options["batch_size"])
+            total_drained += drained
+            total_enrolled += enrolled
+            if drained:
+                self.stdout.write(
+                    self.style.NOTICE(
+                        f"Drained {drained} requests, {enrolled} new enrollments."
+                    )
+                )
+            elif options["once"]:
+                break
+            else:
+                time.sleep(options["interval"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Queue empty: drained {total_drained} requests, "
+                f"{total_enrolled} new enrollments."
+            )
+        )
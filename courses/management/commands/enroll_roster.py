@@ -0,0 +1,50 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+
+from courses.models import Course
+from courses.roster import ENROLLED, ALREADY_ENROLLED, enroll_roster, read_roster
+
+
+class Command(BaseCommand):
+    help = (
+        "Enroll a roster of usernames or emails as students of a course. "
+        "The roster is a CSV file (a `username`/`email` column, or the first "
+        "one) or a `.json` list, read and enrolled in batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("course_id", type=int, help="Id of the course.")
+        parser.add_argument("path", help="Path of the CSV or JSON roster.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows enrolled per batch (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            course = Course.objects.get(pk=options["course_id"])
+        except Course.DoesNotExist:
+            raise CommandError(f"Course {options['course_id']} does not exist.")
+
+        verbosity = options["verbosity"]
+        with open(options["path"], "rb") as file:
+            try:
+                identifiers = read_roster(file, options["path"])
+            except ValueError as error:
+                raise CommandError(f"Cannot read the roster: {error}")
+
+            for result in enroll_roster(course, identifiers, options["batch_size"]):
+                if "error" in result:
+                    raise CommandError(result["error"])
+                if "progress" in result:
+                    self.stdout.write(self.style.NOTICE(json.dumps(result["progress"])))
+                # Rows that could not be enrolled are always listed
+                elif verbosity > 1 or result["status"] not in (
+                    ENROLLED,
+                    ALREADY_ENROLLED,
+                ):
+                    self.stdout.write(json.dumps(result))
+
+        self.stdout.write(self.style.SUCCESS("Roster imported."))
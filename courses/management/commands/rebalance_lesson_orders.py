@@ -0,0 +1,45 @@
+import time
+from django.core.management.base import BaseCommand
+
+from courses.models import Lesson
+
+
+class Command(BaseCommand):
+    help = (
+        "Spread out the lesson sort keys of courses whose gaps are running out, "
+        "so that inserting a lesson keeps writing a single row."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-gap",
+            type=int,
+            default=16,
+            help="Rebalance courses with keys closer than this (default: 16).",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=60.0,
+            help="Seconds to wait between checks (default: 60.0).",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit after one check instead of checking periodically.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            for course_id in Lesson.objects.courses_to_rebalance(options["min_gap"]):
+                moved = Lesson.objects.rebalance(course_id)
+                self.stdout.write(
+                    self.style.NOTICE(
+                        f"Rebalanced course {course_id}: {moved} lessons moved."
+                    )
+                )
+            if options["once"]:
+                break
+            time.sleep(options["interval"])
+
+        self.stdout.write(self.style.SUCCESS("Lesson keys rebalanced."))
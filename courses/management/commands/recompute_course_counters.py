@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from courses.cache import invalidate_catalog
+from courses.models import Course
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the lesson and student counters of every course, in batches. "
+        "The counters are kept current by database triggers; this repairs them "
+        "after manual data fixes or restores."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of courses recomputed per transaction (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_pk = 0
+        checked = corrected = 0
+
+        while True:
+            with transaction.atomic():
+                # Locking the batch makes concurrent enrollments wait, so the
+                # recount sees every row whose trigger has already run.
+                batch = list(
+                    Course.objects.select_for_update()
+                    .filter(pk__gt=last_pk)
+                    .order_by("pk")
+                    .values_list("pk", flat=True)[:batch_size]
+                )
+                if not batch:
+                    break
+                corrected += Course.objects.filter(pk__in=batch).recompute_counters()
+            checked += len(batch)
+            last_pk = batch[-1]
+
+        if corrected:
+            invalidate_catalog()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Checked {checked} courses, corrected {corrected} counters."
+            )
+        )
@@ -0,0 +1,64 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from courses.models import Lesson
+from courses.rendering import content_digest, render_markdown
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the content of lessons to sanitized HTML and measure it, in "
+        "batches. Lessons are rendered when saved; this fills in the lessons "
+        "saved before rendering or measuring existed, or re-renders all of them "
+        "after the renderer changed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of lessons rendered per batch (default: 500).",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Re-render every lesson, not only those never rendered or measured.",
+        )
+
+    def handle(self, *args, **options):
+        fields = ["content_html", "content_digest", "content_length"]
+        lessons = Lesson.objects.only("content", *fields)
+        if not options["all"]:
+            lessons = lessons.filter(Q(content_digest="") | Q(content_length=None))
+
+        last_pk = 0
+        checked = rendered = 0
+        while True:
+            with transaction.atomic():
+                # Locking the batch keeps concurrent edits from being overwritten
+                # with HTML rendered from their previous content.
+                batch = list(
+                    lessons.select_for_update()
+                    .filter(pk__gt=last_pk)
+                    .order_by("pk")[: options["batch_size"]]
+                )
+                if not batch:
+                    break
+                changed = []
+                for lesson in batch:
+                    before = [getattr(lesson, field) for field in fields]
+                    lesson.content_html = render_markdown(lesson.content)
+                    lesson.content_digest = content_digest(lesson.content)
+                    lesson.content_length = len(lesson.content)
+                    if [getattr(lesson, field) for field in fields] != before:
+                        changed.append(lesson)
+                Lesson.objects.bulk_update(changed, fields)
+            checked += len(batch)
+            rendered += len(changed)
+            last_pk = batch[-1].pk
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Checked {checked} lessons, rendered {rendered}.")
+        )
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0002_alter_course_options_alter_lesson_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='course',
+            options={'ordering': ['-created_at', '-id'], 'verbose_name': 'Course', 'verbose_name_plural': 'Courses'},
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['created_at', 'id'], name='course_created_at_id_idx'),
+        ),
+    ]
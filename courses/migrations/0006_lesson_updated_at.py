@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:45
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0005_course_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="lesson",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                default=django.utils.timezone.now,
+                help_text="Timestamp when the lesson was last updated.",
+            ),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,131 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:53
+
+from django.db import migrations, models
+
+# Statement-level triggers: one UPDATE per statement, whatever the number of
+# rows it inserted or deleted (bulk_create, queryset deletes and cascades).
+COUNTER_TRIGGER_SQL = """
+CREATE FUNCTION courses_course_{counter}() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE courses_course AS course
+        SET {counter} = course.{counter} + delta.n, updated_at = now()
+        FROM (
+            SELECT course_id, count(*) AS n FROM new_rows WHERE {condition}
+            GROUP BY course_id
+        ) AS delta
+        WHERE course.id = delta.course_id;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE courses_course AS course
+        SET {counter} = course.{counter} - delta.n, updated_at = now()
+        FROM (
+            SELECT course_id, count(*) AS n FROM old_rows WHERE {condition}
+            GROUP BY course_id
+        ) AS delta
+        WHERE course.id = delta.course_id;
+    ELSE
+        UPDATE courses_course AS course
+        SET {counter} = course.{counter} + delta.n, updated_at = now()
+        FROM (
+            SELECT course_id, sum(n) AS n FROM (
+                SELECT course_id, 1 AS n FROM new_rows WHERE {condition}
+                UNION ALL
+                SELECT course_id, -1 AS n FROM old_rows WHERE {condition}
+            ) AS changes
+            GROUP BY course_id
+        ) AS delta
+        WHERE course.id = delta.course_id AND delta.n <> 0;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER courses_course_{counter}_insert
+AFTER INSERT ON {table} REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION courses_course_{counter}();
+
+CREATE TRIGGER courses_course_{counter}_delete
+AFTER DELETE ON {table} REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION courses_course_{counter}();
+
+CREATE TRIGGER courses_course_{counter}_update
+AFTER UPDATE ON {table} REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION courses_course_{counter}();
+"""
+
+DROP_COUNTER_TRIGGER_SQL = """
+DROP TRIGGER courses_course_{counter}_insert ON {table};
+DROP TRIGGER courses_course_{counter}_delete ON {table};
+DROP TRIGGER courses_course_{counter}_update ON {table};
+DROP FUNCTION courses_course_{counter}();
+"""
+
+COUNTERS = [
+    {"counter": "lesson_count", "table": "courses_lesson", "condition": "true"},
+    {
+        "counter": "student_count",
+        "table": "courses_userrole",
+        "condition": "role = 'student'",
+    },
+]
+
+BACKFILL_SQL = """
+UPDATE courses_course AS course
+SET lesson_count = (
+        SELECT count(*) FROM courses_lesson WHERE course_id = course.id
+    ),
+    student_count = (
+        SELECT count(*) FROM courses_userrole
+        WHERE course_id = course.id AND role = 'student'
+    );
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0006_lesson_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="course",
+            name="lesson_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of lessons in the course, maintained by a database trigger.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="course",
+            name="student_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of students enrolled, maintained by a database trigger.",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="course",
+            index=models.Index(
+                fields=["lesson_count", "created_at", "id"],
+                name="course_lesson_count_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="course",
+            index=models.Index(
+                fields=["student_count", "created_at", "id"],
+                name="course_student_count_idx",
+            ),
+        ),
+        *[
+            migrations.RunSQL(
+                COUNTER_TRIGGER_SQL.format(**counter),
+                DROP_COUNTER_TRIGGER_SQL.format(**counter),
+            )
+            for counter in COUNTERS
+        ],
+        migrations.RunSQL(BACKFILL_SQL, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:47
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("courses", "0007_course_counters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EnrollmentRequest",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="Timestamp when the enrollment was requested.",
+                    ),
+                ),
+                (
+                    "course",
+                    models.ForeignKey(
+                        help_text="The course to enroll the user in.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="enrollment_requests",
+                        to="courses.course",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        help_text="The user asking to be enrolled.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="enrollment_requests",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Enrollment Request",
+                "verbose_name_plural": "Enrollment Requests",
+                "unique_together": {("user", "course")},
+            },
+        ),
+    ]
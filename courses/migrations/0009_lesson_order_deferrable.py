@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:28
+
+from django.db import migrations, models
+import django.db.models.constraints
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0008_enrollmentrequest"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="lesson",
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name="lesson",
+            constraint=models.UniqueConstraint(
+                deferrable=django.db.models.constraints.Deferrable["IMMEDIATE"],
+                fields=("course", "order"),
+                name="lesson_course_order_uniq",
+            ),
+        ),
+    ]
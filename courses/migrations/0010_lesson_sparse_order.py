@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:36
+
+from django.db import migrations, models
+
+# Numbers the lessons of each course in their current order, `step` apart.
+SPREAD_ORDER_SQL = """
+UPDATE courses_lesson
+SET "order" = ranked.position * {step}
+FROM (
+    SELECT id, row_number() OVER (PARTITION BY course_id ORDER BY "order", id)
+        AS position
+    FROM courses_lesson
+) AS ranked
+WHERE courses_lesson.id = ranked.id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0009_lesson_order_deferrable"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="lesson",
+            name="order",
+            field=models.PositiveBigIntegerField(
+                help_text="Sort key of the lesson within the course. Keys are sparse; the API shows the 1-based position instead."
+            ),
+        ),
+        migrations.RunSQL(
+            SPREAD_ORDER_SQL.format(step=1 << 16),
+            reverse_sql=SPREAD_ORDER_SQL.format(step=1),
+        ),
+    ]
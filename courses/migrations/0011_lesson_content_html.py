@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0010_lesson_sparse_order"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="lesson",
+            name="content_digest",
+            field=models.CharField(
+                default="",
+                editable=False,
+                help_text="SHA-256 digest of the content `content_html` was rendered from.",
+                max_length=64,
+            ),
+        ),
+        migrations.AddField(
+            model_name="lesson",
+            name="content_html",
+            field=models.TextField(
+                default="",
+                editable=False,
+                help_text="Content of the lesson rendered from Markdown to sanitized HTML.",
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("courses", "0011_lesson_content_html"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="lesson",
+            name="content_length",
+            field=models.PositiveIntegerField(
+                editable=False,
+                help_text="Length of the content in characters, measured when it was saved.",
+                null=True,
+            ),
+        ),
+    ]
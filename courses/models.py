@@ -1,7 +1,181 @@
 from django.conf import settings
-from django.db import models
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorField,
+)
+from django.db import connections, models, transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery, Value, Window
+from django.db.models.functions import Coalesce, Now, RowNumber
 from django.core.exceptions import ValidationError
 
+from .cache import invalidate_catalog
+from .rendering import content_digest, render_markdown
+from .roles import forget_user_roles, get_user_roles
+
+
+def course_search_vector(title="title", description="description"):
+    """
+    The full-text document of a course, from its title and description
+    columns or expressions. Titles are weighted above descriptions.
+    """
+    return SearchVector(title, weight="A", config="english") + SearchVector(
+        description, weight="B", config="english"
+    )
+
+
+class CourseQuerySet(models.QuerySet):
+    """
+    QuerySet for the Course model, providing visibility filters.
+    """
+
+    def published(self):
+        """
+        Filters published courses.
+        """
+        return self.filter(is_published=True)
+
+    def visible_to(self, user):
+        """
+        Filters the courses the user is allowed to see:
+        - Authenticated users: Published courses and the courses they created.
+        - Unauthenticated users: Published courses only.
+
+        Both predicates are on the course row itself, so the result has no
+        duplicates and needs no DISTINCT. That keeps the query eligible for the
+        (created_at, id) index scans and for a BitmapOr of the partial
+        published index and the created_by index.
+        """
+        if not user.is_authenticated:
+            return self.published()
+        return self.filter(Q(is_published=True) | Q(created_by=user))
+
+    def with_roles_of(self, user):
+        """
+        Filters the courses the user has a role in, annotated with the user's
+        roles as `user_roles`:
+        - Courses the user teaches, published or not.
+        - Courses the user studies, once published, as for their lessons.
+
+        UserRole is joined once and grouped by course, so there is one row per
+        course whatever the number of roles.
+        """
+        return (
+            self.filter(roles__user=user)
+            .annotate(user_roles=ArrayAgg("roles__role", ordering="roles__role"))
+            .filter(
+                Q(is_published=True)
+                | Q(user_roles__contains=[UserRole.ROLE_INSTRUCTOR])
+            )
+        )
+
+    def with_user_roles(self, user):
+        """
+        Annotates the courses with the user's roles in each as `user_roles`,
+        an empty list where the user has none.
+        """
+        return self.annotate(
+            user_roles=ArrayAgg(
+                "roles__role",
+                filter=Q(roles__user=user),
+                ordering="roles__role",
+                default=Value([]),
+            )
+        )
+
+    def publish(self):
+        """
+        Publishes the courses and assigns each creator as the instructor:
+        - One INSERT ... SELECT ... ON CONFLICT DO NOTHING adds the missing
+          instructor roles.
+        - One UPDATE marks the unpublished courses as published.
+        Returns the number of newly published courses.
+        """
+        courses = self.order_by().values_list("created_by_id", "pk")
+        sql, params = courses.query.sql_with_params()
+        with transaction.atomic(using=self.db):
+            with connections[self.db].cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    INSERT INTO {UserRole._meta.db_table}
+                        (user_id, course_id, role, date_assigned)
+                    SELECT course.created_by_id, course.id, %s, now()
+                    FROM ({sql}) AS course (created_by_id, id)
+                    ON CONFLICT DO NOTHING
+                    RETURNING user_id, course_id
+                    """,
+                    [UserRole.ROLE_INSTRUCTOR, *params],
+                )
+                forget_user_roles(cursor.fetchall())
+            published = self.filter(is_published=False).update(
+                is_published=True, updated_at=Now()
+            )
+            invalidate_catalog()
+        return published
+
+    def bulk_create_for_instructor(self, user, courses):
+        """
+        Creates the courses with the user as their creator and instructor.
+        - One INSERT for the courses and one for the instructor roles, in a
+          single transaction.
+        - Fills the search vectors and invalidates the catalog, which
+          `bulk_create` does not do by itself.
+        """
+        for course in courses:
+            course.created_by = user
+        with transaction.atomic():
+            courses = self.bulk_create(courses)
+            UserRole.objects.bulk_create(
+                UserRole(user=user, course=course, role=UserRole.ROLE_INSTRUCTOR)
+                for course in courses
+            )
+            self.filter(pk__in=[course.pk for course in courses]).update_search_vector()
+            forget_user_roles((user.pk, course.pk) for course in courses)
+            invalidate_catalog()
+        return courses
+
+    def update_search_vector(self):
+        """
+        Recomputes the stored full-text document of the courses.
+        """
+        return self.update(search_vector=course_search_vector())
+
+    def recompute_counters(self):
+        """
+        Recounts the lessons and students of the courses from scratch.
+        Only the courses whose counters drifted are written.
+        Returns the number of corrected courses.
+        """
+        counts = {
+            "lesson_count": Lesson.objects.filter(course=OuterRef("pk")),
+            "student_count": UserRole.objects.filter(
+                course=OuterRef("pk"), role=UserRole.ROLE_STUDENT
+            ),
+        }
+        for field, rows in counts.items():
+            counts[field] = Coalesce(
+                Subquery(
+                    rows.order_by().values("course").annotate(n=Count("pk")).values("n")
+                ),
+                0,
+            )
+        return self.exclude(**counts).update(**counts, updated_at=Now())
+
+    def search(self, text):
+        """
+        Filters the courses matching a web-style search query, best match first.
+        Uses the GIN index on the stored search vector.
+        """
+        query = SearchQuery(text, search_type="websearch", config="english")
+        return (
+            self.filter(search_vector=query)
+            .annotate(rank=SearchRank(F("search_vector"), query))
+            .order_by("-rank", "-created_at", "-id")
+        )
+
 
 class Course(models.Model):
     """
@@ -26,38 +200,107 @@ class Course(models.Model):
     updated_at = models.DateTimeField(
         auto_now=True, help_text="Timestamp when the course was last updated."
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Weighted full-text document built from the title and description.",
+    )
+    lesson_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of lessons in the course, maintained by a database trigger.",
+    )
+    student_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of students enrolled, maintained by a database trigger.",
+    )
+
+    # Written by triggers on Lesson and UserRole, never by Course.save()
+    COUNTER_FIELDS = ("lesson_count", "student_count")
+
+    objects = CourseQuerySet.as_manager()
 
     class Meta:
         verbose_name = "Course"
         verbose_name_plural = "Courses"
-        ordering = ["-created_at"]
+        ordering = ["-created_at", "-id"]
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="course_created_at_id_idx"),
+            models.Index(
+                fields=["created_at", "id"],
+                name="course_published_idx",
+                condition=Q(is_published=True),
+            ),
+            models.Index(
+                fields=["created_by", "created_at", "id"],
+                name="course_created_by_idx",
+            ),
+            GinIndex(fields=["search_vector"], name="course_search_vector_idx"),
+            models.Index(
+                fields=["lesson_count", "created_at", "id"],
+                name="course_lesson_count_idx",
+            ),
+            models.Index(
+                fields=["student_count", "created_at", "id"],
+                name="course_student_count_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        """
+        Saves the course and keeps its full-text search vector current, in
+        the same INSERT or UPDATE.
+        Updates leave the counters alone, so a stale instance cannot overwrite
+        lessons or enrollments added since it was loaded.
+        """
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            skipped = {*self.COUNTER_FIELDS, *self.get_deferred_fields()}
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in skipped
+                and field.attname not in skipped
+            ]
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and not {"title", "description"} & set(
+            update_fields
+        ):
+            return super().save(*args, **kwargs)
+
+        self.search_vector = course_search_vector(
+            Value(self.title), Value(self.description)
+        )
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "search_vector"}
+        super().save(*args, **kwargs)
+        # Deferred, so the stored vector is read back if it is ever accessed
+        del self.search_vector
+
     def publish(self):
         """
         Publishes the course and assigns the creator as the instructor.
         """
+        Course.objects.filter(pk=self.pk).publish()
         self.is_published = True
-        self.save()
-        self.assign_instructor(self.created_by)
 
     def assign_instructor(self, user):
         """
         Assigns the 'instructor' role to the user for this course.
+        Returns True if the user was not an instructor yet.
         """
-        UserRole.objects.get_or_create(
-            user=user, course=self, role=UserRole.ROLE_INSTRUCTOR
-        )
+        return UserRole.objects.assign(user, self, UserRole.ROLE_INSTRUCTOR)
 
     def enroll_student(self, user):
         """
         Enrolls the user as a 'student' in this course.
+        Returns True if the user was newly enrolled, False if already enrolled.
         """
-        UserRole.objects.get_or_create(
-            user=user, course=self, role=UserRole.ROLE_STUDENT
-        )
+        return UserRole.objects.assign(user, self, UserRole.ROLE_STUDENT)
 
 
 class RoleManager(models.Manager):
@@ -74,8 +317,34 @@ class RoleManager(models.Manager):
     def is_role(self, user, course, role):
         """
         Checks if the user has the specified role in the course.
+        Within a request, the user's roles in the course are loaded once.
         """
-        return self.for_user_and_course(user, course).filter(role=role).exists()
+        return role in get_user_roles(user, course)
+
+    def assign(self, user, course, role):
+        """
+        Gives the user the role in the course, unless they already have it.
+        Returns True if the role was created.
+
+        A single INSERT ... ON CONFLICT DO NOTHING RETURNING, so concurrent
+        assignments never race on the unique constraint. No signals are sent.
+        """
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {self.model._meta.db_table}
+                    (user_id, course_id, role, date_assigned)
+                VALUES (%s, %s, %s, now())
+                ON CONFLICT DO NOTHING
+                RETURNING id
+                """,
+                [user.pk, course.pk, role],
+            )
+            created = cursor.fetchone() is not None
+        if created:
+            forget_user_roles([(user.pk, course.pk)])
+            invalidate_catalog()
+        return created
 
 
 class UserRole(models.Model):
@@ -138,6 +407,198 @@ class UserRole(models.Model):
         return f"{self.user.username} - {self.role} in {self.course.title}"
 
 
+LESSON_ORDER_CONSTRAINT = "lesson_course_order_uniq"
+
+# Gap between the sort keys of consecutive lessons, once spread out.
+LESSON_ORDER_STEP = 1 << 16
+
+
+class LessonQuerySet(models.QuerySet):
+    """
+    Custom QuerySet for the Lesson model.
+    """
+
+    def with_content_summary(self):
+        """
+        Defers the content and its HTML, leaving the `content_length` and
+        `content_digest` stored when the lesson was saved: the content itself
+        is never read, not even by the database.
+        """
+        return self.defer("content", "content_html")
+
+    def with_positions(self):
+        """
+        Annotates the 1-based position of each lesson in its course as
+        `position`, with a window over the fetched rows. Only valid when every
+        lesson of the fetched courses is fetched.
+        """
+        return self.annotate(
+            position=Window(RowNumber(), partition_by=F("course"), order_by="order")
+        )
+
+    def lock_course(self, course):
+        """
+        Locks the course row against concurrent changes of its lesson keys,
+        until the end of the transaction. Returns the course id.
+        """
+        course_id = getattr(course, "pk", course)
+        list(
+            Course.objects.using(self.db)
+            .select_for_update(no_key=True)
+            .filter(pk=course_id)
+            .values_list("pk")
+        )
+        return course_id
+
+    def order_for_position(self, course, position=None, lesson=None):
+        """
+        Returns a sort key placing a lesson at the 1-based `position` among
+        the other lessons of the course, or last without one. `lesson` is the
+        lesson (or its pk) being moved, if it already exists.
+        - Keys are sparse: the new key falls halfway between its neighbours,
+          so no other lesson is written.
+        - When the neighbours leave no gap, the later lessons are shifted by
+          LESSON_ORDER_STEP first; `rebalance_lesson_orders` spreads the keys
+          out again in the background, before that happens often.
+
+        Locks the course, so that concurrent inserts never pick the same key;
+        call within a transaction.
+        """
+        course_id = self.lock_course(course)
+        lessons = self.filter(course_id=course_id)
+        others = lessons.order_by("order")
+        lesson_id = getattr(lesson, "pk", lesson)
+        if lesson_id is not None:
+            others = others.exclude(pk=lesson_id)
+        keys = others.values_list("order", flat=True)
+
+        if position == 1:
+            before, after = 0, keys.first()
+        else:
+            neighbours = list(keys[position - 2 : position]) if position else []
+            if neighbours:
+                before, after = (neighbours + [None])[:2]
+            else:
+                before, after = keys.last() or 0, None
+
+        if after is None:
+            return before + LESSON_ORDER_STEP
+        if after - before < 2:
+            lessons.filter(order__gte=after).update(
+                order=F("order") + LESSON_ORDER_STEP
+            )
+            after += LESSON_ORDER_STEP
+        return (before + after) // 2
+
+    def reorder(self, lesson_ids):
+        """
+        Places the lessons in the order of `lesson_ids`, which must list every
+        lesson of a course once, with a single UPDATE:
+        - The keys are spread out again, LESSON_ORDER_STEP apart.
+        - Only the lessons whose key changes are written, and their
+          `updated_at` touched.
+        - The (course, order) constraint is deferrable, so it is checked at
+          the end of the statement rather than for each row.
+        """
+        table = self.model._meta.db_table
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                f"""
+                UPDATE {table}
+                SET "order" = target.position * %s, updated_at = now()
+                FROM unnest(%s::bigint[]) WITH ORDINALITY AS target (id, position)
+                WHERE {table}.id = target.id
+                    AND {table}."order" <> target.position * %s
+                """,
+                [LESSON_ORDER_STEP, lesson_ids, LESSON_ORDER_STEP],
+            )
+            moved = cursor.rowcount
+        if moved:
+            invalidate_catalog()
+        return moved
+
+    def move(self, lesson_id, position):
+        """
+        Moves a lesson to the 1-based `position` in its course, writing its
+        row only, see `order_for_position`. Returns whether it moved.
+        """
+        lesson = self.filter(pk=lesson_id)
+        with transaction.atomic(using=self.db):
+            course_id = self.lock_course(
+                lesson.values_list("course_id", flat=True).get()
+            )
+            order = lesson.values_list("order", flat=True).get()
+            if (
+                self.filter(course_id=course_id, order__lt=order).count() + 1
+                == position
+            ):
+                return False
+            lesson.update(
+                order=self.order_for_position(course_id, position, lesson=lesson_id),
+                updated_at=Now(),
+            )
+        invalidate_catalog()
+        return True
+
+    def bulk_import(self, course, lessons):
+        """
+        Appends the lessons to the course, in order, with a single INSERT.
+        - Their sort keys follow the last lesson, LESSON_ORDER_STEP apart.
+        - Their positions are set on the returned lessons.
+        - Renders their content to HTML, as `Lesson.save` would.
+        - Invalidates the catalog, which `bulk_create` does not do by itself.
+        """
+        with transaction.atomic(using=self.db):
+            first_order = self.order_for_position(course)
+            first_position = self.filter(course=course).count() + 1
+            for index, lesson in enumerate(lessons):
+                lesson.course = course
+                lesson.order = first_order + index * LESSON_ORDER_STEP
+                lesson.render_content_html()
+            lessons = self.bulk_create(lessons)
+            invalidate_catalog()
+        for index, lesson in enumerate(lessons):
+            lesson.position = first_position + index
+        return lessons
+
+    def rebalance(self, course):
+        """
+        Spreads out the sort keys of the lessons of the course, keeping their
+        order. Returns the number of lessons written.
+        """
+        with transaction.atomic(using=self.db):
+            lesson_ids = (
+                self.filter(course_id=self.lock_course(course))
+                .order_by("order")
+                .values_list("pk", flat=True)
+            )
+            return self.reorder(list(lesson_ids))
+
+    def courses_to_rebalance(self, min_gap):
+        """
+        Returns the ids of the courses in which two consecutive lessons, or
+        the first lesson and zero, have sort keys less than `min_gap` apart.
+        """
+        table = self.model._meta.db_table
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT DISTINCT course_id FROM (
+                    SELECT
+                        course_id,
+                        "order" - lag("order", 1, 0::bigint) OVER (
+                            PARTITION BY course_id ORDER BY "order"
+                        ) AS gap
+                    FROM {table}
+                ) AS lesson
+                WHERE gap < %s
+                ORDER BY course_id
+                """,
+                [min_gap],
+            )
+            return [course_id for (course_id,) in cursor.fetchall()]
+
+
 class Lesson(models.Model):
     """
     Represents a lesson in a course.
@@ -152,15 +613,188 @@ class Lesson(models.Model):
     )
     title = models.CharField(max_length=255, help_text="Title of the lesson.")
     content = models.TextField(help_text="Content of the lesson.")
-    order = models.PositiveIntegerField(
-        help_text="Order of the lesson within the course."
+    content_html = models.TextField(
+        default="",
+        editable=False,
+        help_text="Content of the lesson rendered from Markdown to sanitized HTML.",
+    )
+    content_digest = models.CharField(
+        max_length=64,
+        default="",
+        editable=False,
+        help_text="SHA-256 digest of the content `content_html` was rendered from.",
+    )
+    content_length = models.PositiveIntegerField(
+        null=True,
+        editable=False,
+        help_text="Length of the content in characters, measured when it was saved.",
     )
+    order = models.PositiveBigIntegerField(
+        help_text=(
+            "Sort key of the lesson within the course. Keys are sparse; the "
+            "API shows the 1-based position instead."
+        )
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True, help_text="Timestamp when the lesson was last updated."
+    )
+
+    objects = LessonQuerySet.as_manager()
 
     class Meta:
         verbose_name = "Lesson"
         verbose_name_plural = "Lessons"
         ordering = ["order"]
-        unique_together = ("course", "order")
+        constraints = [
+            # Deferrable, so that lessons can swap orders in one statement
+            models.UniqueConstraint(
+                fields=["course", "order"],
+                name=LESSON_ORDER_CONSTRAINT,
+                deferrable=models.Deferrable.IMMEDIATE,
+            )
+        ]
+
+    def __str__(self):
+        return self.title
+
+    def save(self, *args, **kwargs):
+        """
+        Saves the lesson, rendering and measuring its content if it changed.
+        """
+        update_fields = kwargs.get("update_fields")
+        if "content" not in self.get_deferred_fields() and (
+            update_fields is None or "content" in update_fields
+        ):
+            if self.render_content_html() and update_fields is not None:
+                kwargs["update_fields"] = {
+                    *update_fields,
+                    "content_html",
+                    "content_digest",
+                    "content_length",
+                }
+        super().save(*args, **kwargs)
+
+    def render_content_html(self):
+        """
+        Renders the content to `content_html` and measures it into
+        `content_length`, unless it was already done for the same content.
+        Returns whether it rendered.
+        """
+        digest = content_digest(self.content)
+        if digest == self.content_digest and self.content_length is not None:
+            return False
+        self.content_html = render_markdown(self.content)
+        self.content_digest = digest
+        self.content_length = len(self.content)
+        return True
+
+    def get_position(self):
+        """
+        The 1-based position of the lesson in its course, as annotated by
+        `with_positions()`, or counted.
+        """
+        if getattr(self, "position", None) is None:
+            self.position = Lesson.objects.filter(
+                course_id=self.course_id, order__lte=self.order
+            ).count()
+        return self.position
+
+
+class EnrollmentRequestManager(models.Manager):
+    """
+    Manager for the EnrollmentRequest queue.
+    """
+
+    def enqueue(self, user, course):
+        """
+        Queues the enrollment of the user in the course.
+        Returns False if the same enrollment was already queued.
+        """
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {self.model._meta.db_table}
+                    (user_id, course_id, created_at)
+                VALUES (%s, %s, now())
+                ON CONFLICT DO NOTHING
+                RETURNING id
+                """,
+                [user.pk, course.pk],
+            )
+            return cursor.fetchone() is not None
+
+    def drain(self, batch_size=1000):
+        """
+        Enrolls up to `batch_size` of the oldest queued requests and removes
+        them from the queue, in a single statement.
+        - `SKIP LOCKED` lets several workers drain the queue side by side.
+        - The counter triggers run once per batch rather than per enrollment.
+        Returns the number of drained requests and of new enrollments.
+        The cached roles of the new enrollments are dropped.
+        """
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH batch AS (
+                    DELETE FROM {self.model._meta.db_table}
+                    WHERE id IN (
+                        SELECT id FROM {self.model._meta.db_table}
+                        ORDER BY id
+                        LIMIT %s
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    RETURNING user_id, course_id
+                ), enrolled AS (
+                    INSERT INTO {UserRole._meta.db_table}
+                        (user_id, course_id, role, date_assigned)
+                    SELECT user_id, course_id, %s, now() FROM batch
+                    ON CONFLICT DO NOTHING
+                    RETURNING user_id, course_id
+                )
+                SELECT
+                    (SELECT count(*) FROM batch),
+                    array_agg(user_id),
+                    array_agg(course_id)
+                FROM enrolled
+                """,
+                [batch_size, UserRole.ROLE_STUDENT],
+            )
+            drained, user_ids, course_ids = cursor.fetchone()
+        enrolled = list(zip(user_ids or [], course_ids or []))
+        if enrolled:
+            forget_user_roles(enrolled)
+            invalidate_catalog()
+        return drained, len(enrolled)
+
+
+class EnrollmentRequest(models.Model):
+    """
+    A queued enrollment, written by asynchronous enroll requests and drained
+    into UserRole by the `drain_enrollments` command.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="enrollment_requests",
+        help_text="The user asking to be enrolled.",
+    )
+    course = models.ForeignKey(
+        Course,
+        on_delete=models.CASCADE,
+        related_name="enrollment_requests",
+        help_text="The course to enroll the user in.",
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True, help_text="Timestamp when the enrollment was requested."
+    )
+
+    objects = EnrollmentRequestManager()
+
+    class Meta:
+        verbose_name = "Enrollment Request"
+        verbose_name_plural = "Enrollment Requests"
+        unique_together = ("user", "course")
 
     def __str__(self):
-        return f"{self.order}. {self.title}"
+        return f"{self.user.username} requested {self.course.title}"
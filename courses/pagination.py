@@ -0,0 +1,167 @@
+import json
+from datetime import datetime
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    CursorPagination,
+    PageNumberPagination,
+    _reverse_ordering,
+)
+
+
+class CourseCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the course catalog.
+    - Pages are addressed by an opaque cursor holding the full sort key of the
+      last row instead of an OFFSET, so every page costs the same index range scan.
+    - `?ordering=` sorts by `created_at`, `lesson_count` or `student_count`,
+      prefixed with `-` for descending. `created_at` and `id` break ties, so the
+      sort key is unique and long runs of equal counters page correctly.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-created_at", "-id")
+    ordering_param = "ordering"
+    ordering_fields = ("created_at", "lesson_count", "student_count")
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Unknown or missing `?ordering=` values fall back to the newest first.
+        """
+        value = request.query_params.get(self.ordering_param, "")
+        field = value.removeprefix("-")
+        if field not in self.ordering_fields:
+            return self.ordering
+
+        prefix = "-" if value.startswith("-") else ""
+        return tuple(
+            prefix + name for name in dict.fromkeys((field, "created_at", "id"))
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Same as `CursorPagination.paginate_queryset`, but the cursor position
+        is compared on every ordering field rather than the first one only.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            offset, reverse, current_position = (0, False, None)
+        else:
+            offset, reverse, current_position = self.cursor
+
+        if reverse:
+            queryset = queryset.order_by(*_reverse_ordering(self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if current_position is not None:
+            queryset = queryset.filter(
+                self.get_position_filter(queryset.model, current_position, reverse)
+            )
+
+        results = list(queryset[offset : offset + self.page_size + 1])
+        self.page = list(results[: self.page_size])
+
+        if len(results) > len(self.page):
+            has_following_position = True
+            following_position = self._get_position_from_instance(
+                results[-1], self.ordering
+            )
+        else:
+            has_following_position = False
+            following_position = None
+
+        if reverse:
+            self.page = list(reversed(self.page))
+            self.has_next = (current_position is not None) or (offset > 0)
+            self.has_previous = has_following_position
+            if self.has_next:
+                self.next_position = current_position
+            if self.has_previous:
+                self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = (current_position is not None) or (offset > 0)
+            if self.has_next:
+                self.next_position = following_position
+            if self.has_previous:
+                self.previous_position = current_position
+
+        return self.page
+
+    def get_position_filter(self, model, position, reverse):
+        """
+        Rows strictly after the position in the page direction:
+        `a < x OR (a = x AND (b < y OR (b = y AND c < z)))` for `-a, -b, -c`.
+        The leading `a <= x` bound lets the index scan start at the position.
+        """
+        values = self.decode_position(model, position)
+
+        condition = None
+        for order, value in reversed(list(zip(self.ordering, values))):
+            field = order.removeprefix("-")
+            lookup = "lt" if order.startswith("-") != reverse else "gt"
+            after = Q(**{f"{field}__{lookup}": value})
+            condition = (
+                after
+                if condition is None
+                else after | (Q(**{field: value}) & condition)
+            )
+
+        field = self.ordering[0].removeprefix("-")
+        lookup = "lte" if self.ordering[0].startswith("-") != reverse else "gte"
+        return Q(**{f"{field}__{lookup}": values[0]}) & condition
+
+    def decode_position(self, model, position):
+        """
+        The values of the ordering fields held by a cursor position.
+        - Each value is cleaned by its model field; a tampered position
+          raises NotFound rather than reaching the query.
+        """
+        try:
+            values = json.loads(position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        try:
+            values = [
+                model._meta.get_field(order.removeprefix("-")).clean(value, None)
+                for order, value in zip(self.ordering, values)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        # `clean()` skips the null check of non-editable fields
+        if None in values:
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = []
+        for order in ordering:
+            value = getattr(instance, order.removeprefix("-"))
+            # Full precision: a truncated timestamp would skip or repeat rows
+            values.append(value.isoformat() if isinstance(value, datetime) else value)
+        return json.dumps(values)
+
+
+class CourseSearchPagination(PageNumberPagination):
+    """
+    Page-number pagination for ranked search results.
+    - Search results are ordered by relevance, which has no stable keyset.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
@@ -0,0 +1,61 @@
+import json
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Renders newline-delimited JSON: one compact JSON document per line.
+    - A list is rendered as one line per item, anything else as a single line.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        items = data if isinstance(data, list) else [data]
+        return b"".join(self.render_line(item) for item in items)
+
+    def render_line(self, item):
+        """
+        Renders a single item as one line of UTF-8 encoded JSON.
+        """
+        return (
+            json.dumps(item, cls=JSONEncoder, ensure_ascii=False, separators=(",", ":"))
+            + "\n"
+        ).encode()
+
+
+class LessonHTMLRenderer(BaseRenderer):
+    """
+    Renders lessons as HTML, from the content they were saved with rendered.
+    - A lesson is an `<article>` headed by its title.
+    - A list is its lessons one after another.
+    - Anything else, e.g. an error, is rendered escaped.
+    """
+
+    media_type = "text/html"
+    format = "html"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if isinstance(data, list):
+            return "".join(self.render_lesson(lesson) for lesson in data).encode()
+        if "content_html" in data:
+            return self.render_lesson(data).encode()
+        return format_html("<p>{}</p>", data.get("detail", data)).encode()
+
+    def render_lesson(self, lesson):
+        return format_html(
+            '<article id="lesson-{}"><h1>{}</h1>\n{}</article>\n',
+            lesson["id"],
+            lesson["title"],
+            mark_safe(lesson["content_html"]),
+        )
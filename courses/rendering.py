@@ -0,0 +1,28 @@
+import hashlib
+import markdown
+import nh3
+
+MARKDOWN_EXTENSIONS = ["fenced_code", "tables", "sane_lists"]
+
+# The sanitizer defaults, plus the language classes of fenced code blocks
+ALLOWED_ATTRIBUTES = {
+    **nh3.ALLOWED_ATTRIBUTES,
+    "code": {*nh3.ALLOWED_ATTRIBUTES.get("code", ()), "class"},
+}
+
+
+def content_digest(content):
+    """
+    The SHA-256 hex digest of lesson content, identifying what its HTML was
+    rendered from.
+    """
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def render_markdown(content):
+    """
+    Renders Markdown to sanitized HTML: scripts, styles, event handlers and
+    `javascript:` links are removed, including from raw HTML in the source.
+    """
+    html = markdown.markdown(content, extensions=MARKDOWN_EXTENSIONS)
+    return nh3.clean(html, attributes=ALLOWED_ATTRIBUTES)
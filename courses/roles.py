@@ -0,0 +1,199 @@
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from contextvars import ContextVar
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# {(user_id, course_id): frozenset of roles}, set for the duration of a request
+# by RoleCacheMiddleware; None outside of one.
+_request_roles = ContextVar("courses_request_roles", default=None)
+
+
+class LocalRoleCache:
+    """
+    Bounded in-process LRU of roles, in front of the shared Django cache.
+    - Holds at most COURSE_ROLE_CACHE_LOCAL_SIZE entries.
+    - Entries expire after COURSE_ROLE_CACHE_LOCAL_TIMEOUT seconds, which
+      bounds how long another process may serve roles changed elsewhere.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            roles, expires = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return roles
+
+    def set(self, key, roles):
+        expires = time.monotonic() + settings.COURSE_ROLE_CACHE_LOCAL_TIMEOUT
+        with self._lock:
+            self._entries[key] = (roles, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > settings.COURSE_ROLE_CACHE_LOCAL_SIZE:
+                self._entries.popitem(last=False)
+
+    def delete_many(self, keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+local_roles = LocalRoleCache()
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def role_cache_stats():
+    """
+    Returns the lookups of this process answered by each tier of the role
+    cache since it started or since `reset_role_cache_stats()`:
+    `local_hits`, `shared_hits` and `misses`, the latter read from the database.
+    """
+    with _stats_lock:
+        return {name: _stats[name] for name in ("local_hits", "shared_hits", "misses")}
+
+
+def reset_role_cache_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+def role_cache_key(user_id, course_id):
+    return f"courses:roles:{user_id}:{course_id}"
+
+
+def role_generation_key(user_id, course_id):
+    return f"courses:roles:generation:{user_id}:{course_id}"
+
+
+def _key(user, course):
+    return user.pk, getattr(course, "pk", course)
+
+
+def _load_roles(user, course):
+    """
+    Reads the roles through the in-process and the shared caches, then the
+    database, filling the tiers it missed.
+    - Shared entries hold the generation of the pair they were read under,
+      and only count while it is current: roles read before a change, but
+      cached after it was forgotten, are never served.
+    """
+    key = _key(user, course)
+    roles = local_roles.get(key)
+    if roles is not None:
+        _count("local_hits")
+        return roles
+
+    roles_key, generation_key = role_cache_key(*key), role_generation_key(*key)
+    cached = cache.get_many([roles_key, generation_key])
+    generation = cached.get(generation_key)
+    if generation is None:
+        cache.add(generation_key, uuid.uuid4().hex, None)
+        generation = cache.get(generation_key)
+
+    entry = cached.get(roles_key)
+    if entry is not None and entry[0] == generation:
+        _count("shared_hits")
+        roles = entry[1]
+    else:
+        _count("misses")
+        roles = frozenset(
+            user.roles.filter(course=course).values_list("role", flat=True)
+        )
+        cache.set(roles_key, (generation, roles), settings.COURSE_ROLE_CACHE_TIMEOUT)
+    local_roles.set(key, roles)
+    return roles
+
+
+def get_user_roles(user, course):
+    """
+    Returns the roles of the user in the course (an instance or a pk) as a
+    frozenset.
+    - Within a request, the roles are looked up once and reused.
+    - Across requests, they are cached in process and in the Django cache,
+      until a role of the user in the course changes.
+    """
+    if not user.is_authenticated:
+        return frozenset()
+
+    request_roles = _request_roles.get()
+    key = _key(user, course)
+    if request_roles is not None and key in request_roles:
+        return request_roles[key]
+
+    roles = _load_roles(user, course)
+    if request_roles is not None:
+        request_roles[key] = roles
+    return roles
+
+
+def set_user_roles(user, course, roles):
+    """
+    Stores roles already fetched with the course, e.g. by
+    `CourseQuerySet.with_user_roles`, for the rest of the request.
+    """
+    request_roles = _request_roles.get()
+    if request_roles is not None and user.is_authenticated:
+        request_roles[_key(user, course)] = frozenset(roles)
+
+
+def _forget(keys):
+    request_roles = _request_roles.get()
+    if request_roles is not None:
+        for key in keys:
+            request_roles.pop(key, None)
+    local_roles.delete_many(keys)
+    # A new generation voids the entries of reads still in flight
+    cache.set_many({role_generation_key(*key): uuid.uuid4().hex for key in keys}, None)
+    cache.delete_many([role_cache_key(*key) for key in keys])
+
+
+def forget_user_roles(pairs):
+    """
+    Drops the cached roles of `(user_id, course_id)` pairs whose roles changed.
+    - Drops them at once, so the writing request reads its own changes.
+    - Drops them again on commit, discarding roles another request cached
+      from the pre-commit state in between.
+    """
+    keys = list(pairs)
+    if keys:
+        _forget(keys)
+        transaction.on_commit(lambda: _forget(keys))
+
+
+class RoleCacheMiddleware:
+    """
+    Scopes the roles looked up by `get_user_roles` to a single request.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = _request_roles.set({})
+        try:
+            return self.get_response(request)
+        finally:
+            _request_roles.reset(token)
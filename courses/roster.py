@@ -0,0 +1,149 @@
+import codecs
+import csv
+import json
+from itertools import chain, islice
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+
+from .cache import invalidate_catalog
+from .models import UserRole
+from .roles import forget_user_roles
+
+ENROLLED = "enrolled"
+ALREADY_ENROLLED = "already_enrolled"
+NOT_FOUND = "not_found"
+AMBIGUOUS = "ambiguous"
+INVALID = "invalid"
+
+STATUSES = (ENROLLED, ALREADY_ENROLLED, NOT_FOUND, AMBIGUOUS, INVALID)
+
+HEADER_COLUMNS = ("username", "email")
+
+
+def read_csv_roster(lines):
+    """
+    Yields the identifiers of a CSV roster, one per row, lazily.
+    - With a header, the `username` or `email` column is read.
+    - Without one, the first column is read.
+    """
+    rows = csv.reader(lines)
+    first = next(rows, None)
+    if first is None:
+        return
+
+    header = [cell.strip().lower() for cell in first]
+    column = next(
+        (header.index(name) for name in HEADER_COLUMNS if name in header), None
+    )
+    if column is None:
+        column = 0
+        rows = chain([first], rows)
+
+    for row in rows:
+        yield row[column].strip() if len(row) > column else ""
+
+
+def read_json_roster(items):
+    """
+    Yields the identifiers of a JSON list of usernames or emails.
+    """
+    if not isinstance(items, list):
+        raise ValueError("A JSON roster must be a list of usernames or emails.")
+    return ("" if item is None else str(item).strip() for item in items)
+
+
+def read_roster(file, name):
+    """
+    Yields the identifiers of an uploaded or opened binary roster file.
+    - `.json` files hold a list of usernames or emails.
+    - Anything else is read as UTF-8 CSV, one row at a time.
+    """
+    if name.lower().endswith(".json"):
+        return read_json_roster(json.load(codecs.getreader("utf-8-sig")(file)))
+    return read_csv_roster(codecs.iterdecode(file, "utf-8-sig"))
+
+
+def enroll_roster(course, identifiers, batch_size=1000):
+    """
+    Enrolls the users of a roster as students of the course, `batch_size`
+    rows at a time, yielding a result per row and a progress report per batch.
+    - Identifiers match a username or an email address.
+    - Each batch costs one query resolving the users, one reading the
+      existing enrollments and one `bulk_create(ignore_conflicts=True)`,
+      so memory use does not grow with the roster.
+
+    Row results look like `{"row": 1, "identifier": "...", "status": "..."}`,
+    progress reports like `{"progress": {"processed": 1000, "enrolled": ...}}`.
+    A file that cannot be read past some row ends the import with an
+    `{"error": "..."}` report; the batches before it stay enrolled.
+    """
+    totals = dict.fromkeys(STATUSES, 0)
+    processed = 0
+    rows = enumerate(identifiers, start=1)
+
+    while True:
+        try:
+            batch = list(islice(rows, batch_size))
+        except (ValueError, csv.Error) as error:
+            yield {"error": f"Cannot read the roster after row {processed}: {error}"}
+            break
+        if not batch:
+            break
+
+        statuses = _enroll_batch(course, [identifier for _, identifier in batch])
+        for (number, identifier), status in zip(batch, statuses):
+            totals[status] += 1
+            yield {"row": number, "identifier": identifier, "status": status}
+        processed += len(batch)
+        yield {"progress": {"processed": processed, **totals}}
+
+    if totals[ENROLLED]:
+        invalidate_catalog()
+
+
+def _enroll_batch(course, identifiers):
+    """
+    Enrolls a batch of identifiers, returning the status of each.
+    """
+    names = {identifier for identifier in identifiers if identifier}
+    users = {}
+    for user_id, username, email in (
+        get_user_model()
+        .objects.filter(Q(username__in=names) | Q(email__in=names))
+        .values_list("pk", "username", "email")
+    ):
+        for key in {username, email} & names:
+            users.setdefault(key, set()).add(user_id)
+
+    matched = {
+        next(iter(user_ids)) for user_ids in users.values() if len(user_ids) == 1
+    }
+    enrolled = set(
+        UserRole.objects.filter(
+            course=course, role=UserRole.ROLE_STUDENT, user__in=matched
+        ).values_list("user", flat=True)
+    )
+    UserRole.objects.bulk_create(
+        [
+            UserRole(user_id=user_id, course=course, role=UserRole.ROLE_STUDENT)
+            for user_id in matched - enrolled
+        ],
+        ignore_conflicts=True,
+    )
+    forget_user_roles((user_id, course.pk) for user_id in matched - enrolled)
+
+    statuses = []
+    for identifier in identifiers:
+        user_ids = users.get(identifier, set())
+        if not identifier:
+            statuses.append(INVALID)
+        elif not user_ids:
+            statuses.append(NOT_FOUND)
+        elif len(user_ids) > 1:
+            statuses.append(AMBIGUOUS)
+        else:
+            (user_id,) = user_ids
+            # A user listed twice is enrolled by the first row only
+            statuses.append(ALREADY_ENROLLED if user_id in enrolled else ENROLLED)
+            enrolled.add(user_id)
+    return statuses
@@ -1,16 +1,74 @@
-from rest_framework import serializers
+from django.db import transaction
+from rest_framework import permissions, serializers
+from users.serializers import PublicProfileSerializer
 from .models import Course, Lesson
 
 
-class CourseSerializer(serializers.ModelSerializer):
+def parse_field_list(value):
+    """
+    Splits a comma-separated query parameter into a set of field names.
+    """
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin letting clients pick the fields of read responses:
+    - `?fields=a,b` keeps only the listed fields.
+    - `?omit=a,b` drops the listed fields.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        if request is None or request.method not in permissions.SAFE_METHODS:
+            return
+
+        requested = {}
+        for param in ("fields", "omit"):
+            if param in request.query_params:
+                requested[param] = parse_field_list(request.query_params[param])
+
+        unknown = set().union(*requested.values()) - set(self.fields)
+        if unknown:
+            raise serializers.ValidationError(
+                {"fields": f"Unknown fields: {', '.join(sorted(unknown))}."}
+            )
+
+        keep = requested.get("fields", set(self.fields)) - requested.get("omit", set())
+        for name in set(self.fields) - keep:
+            self.fields.pop(name)
+
+
+class CourseListSerializer(serializers.ListSerializer):
+    """
+    List serializer creating many courses at once.
+    - Errors are reported per item, in the order of the input.
+    """
+
+    def create(self, validated_data):
+        """
+        Create the courses in bulk, with the request user as their creator and instructor.
+        """
+        user = self.context["request"].user
+        return Course.objects.bulk_create_for_instructor(
+            user, [Course(**attrs) for attrs in validated_data]
+        )
+
+
+class CourseSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for the Course model.
     - Excludes `created_by` from user input, automatically assigning it to the request user.
+    - Excludes the internal `search_vector`.
+    - `lesson_count` and `student_count` are read-only denormalized counters.
+    - `many=True` creates the courses in bulk.
     """
 
     class Meta:
         model = Course
-        exclude = ["created_by"]
+        exclude = ["created_by", "search_vector"]
+        list_serializer_class = CourseListSerializer
 
     def create(self, validated_data):
         """
@@ -23,23 +81,233 @@ class CourseSerializer(serializers.ModelSerializer):
         return course
 
 
-class LessonSerializer(serializers.ModelSerializer):
+class LessonOrderField(serializers.IntegerField):
     """
-    Serializer for the Lesson model.
-    - Ensures lesson order is unique within a course.
+    The 1-based position of a lesson in its course, rather than its sparse
+    sort key. Written, it is the position to move the lesson to.
     """
 
+    def __init__(self, **kwargs):
+        kwargs.setdefault("min_value", 1)
+        super().__init__(**kwargs)
+
+    def get_attribute(self, lesson):
+        return lesson.get_position()
+
+
+class LessonSummarySerializer(serializers.ModelSerializer):
+    """
+    Serializer for the outline of a course: lessons without their content.
+    """
+
+    order = LessonOrderField(read_only=True)
+
     class Meta:
         model = Lesson
-        fields = "__all__"
+        fields = ["id", "title", "order"]
+
+
+class LessonHTMLSerializer(LessonSummarySerializer):
+    """
+    Serializer for lessons with their content pre-rendered to sanitized HTML,
+    for `LessonHTMLRenderer`.
+    """
+
+    class Meta(LessonSummarySerializer.Meta):
+        fields = LessonSummarySerializer.Meta.fields + ["content_html"]
+
+
+class LessonDigestSerializer(SparseFieldsetMixin, LessonSummarySerializer):
+    """
+    Serializer for the table of contents of a course: lesson summaries with
+    the length and SHA-256 hash of their content, stored when it was saved,
+    see `Lesson.objects.with_content_summary()`.
+    """
+
+    content_hash = serializers.CharField(source="content_digest", read_only=True)
+
+    class Meta(LessonSummarySerializer.Meta):
+        fields = LessonSummarySerializer.Meta.fields + [
+            "content_length",
+            "content_hash",
+        ]
+
+
+class LessonReorderSerializer(serializers.Serializer):
+    """
+    Serializer for a new order of the lessons of a course, either:
+    - `lessons`: the ids of every lesson of the course, in their new order.
+    - `lesson` and `position`: a lesson moved to a 1-based position.
+    """
+
+    lessons = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, required=False
+    )
+    lesson = serializers.IntegerField(min_value=1, required=False)
+    position = serializers.IntegerField(min_value=1, required=False)
 
     def validate(self, attrs):
+        move = "lesson" in attrs or "position" in attrs
+        if ("lessons" in attrs) == move:
+            raise serializers.ValidationError(
+                "Provide either `lessons`, or `lesson` and `position`."
+            )
+        if move and not ("lesson" in attrs and "position" in attrs):
+            raise serializers.ValidationError(
+                "Both `lesson` and `position` are required to move a lesson."
+            )
+        return attrs
+
+    def get_lesson_ids(self, current_ids):
         """
-        Validate lesson order to ensure uniqueness within the course.
+        The ids of the lessons in their new order, given the current one.
         """
-        course = attrs.get("course")
-        if Lesson.objects.filter(course=course, order=attrs["order"]).exists():
+        if "lessons" in self.validated_data:
+            lesson_ids = self.validated_data["lessons"]
+            if sorted(lesson_ids) != sorted(current_ids):
+                raise serializers.ValidationError(
+                    {"lessons": "Must list every lesson of the course exactly once."}
+                )
+            return lesson_ids
+
+        lesson, position = (
+            self.validated_data["lesson"],
+            self.validated_data["position"],
+        )
+        if lesson not in current_ids:
             raise serializers.ValidationError(
-                "Lesson order must be unique within the course."
+                {"lesson": "Not a lesson of this course."}
             )
-        return attrs
+        if position > len(current_ids):
+            raise serializers.ValidationError(
+                {"position": f"Must be at most {len(current_ids)}."}
+            )
+        lesson_ids = [pk for pk in current_ids if pk != lesson]
+        lesson_ids.insert(position - 1, lesson)
+        return lesson_ids
+
+
+class CourseDetailSerializer(CourseSerializer):
+    """
+    Serializer for a course with its related objects embedded.
+    - `lessons`: the ordered lesson summaries.
+    - `instructor`: the public profile of the first assigned instructor, or null.
+    - Only the fields listed in `?expand=` are kept.
+    """
+
+    expandable_fields = ("lessons", "instructor")
+
+    lessons = LessonSummarySerializer(many=True, read_only=True)
+    instructor = serializers.SerializerMethodField()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        expand = self.context.get("expand", set())
+        for name in set(self.expandable_fields) - expand:
+            self.fields.pop(name, None)
+
+    def get_instructor(self, course):
+        """
+        Reads the instructor from the `instructor_roles` prefetched by the view.
+        """
+        roles = course.instructor_roles
+        if not roles:
+            return None
+        return PublicProfileSerializer(roles[0].user, context=self.context).data
+
+
+class CoursePublishSerializer(serializers.Serializer):
+    """
+    Serializer for the ids of the courses to publish in bulk.
+    """
+
+    courses = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=1000,
+    )
+
+
+class MyCourseSerializer(CourseSerializer):
+    """
+    Serializer for the courses of the request user.
+    - `roles` lists the user's roles in the course.
+    """
+
+    roles = serializers.ListField(
+        child=serializers.CharField(), source="user_roles", read_only=True
+    )
+
+
+class LessonSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """
+    Serializer for the Lesson model.
+    - `order` is the position of the lesson in the course. A lesson created or
+      moved there goes before the lesson holding it, which is not rewritten;
+      positions past the end place it last.
+    - The course is set when the lesson is created; updates keep it.
+    """
+
+    order = LessonOrderField(
+        help_text="Position of the lesson within the course, starting at 1."
+    )
+
+    class Meta:
+        model = Lesson
+        exclude = ["content_html", "content_digest", "content_length"]
+        # The (course, order) constraint applies to sort keys, not positions
+        validators = []
+
+    def create(self, validated_data):
+        with transaction.atomic():
+            validated_data["order"] = Lesson.objects.order_for_position(
+                validated_data["course"], validated_data["order"]
+            )
+            return super().create(validated_data)
+
+    def update(self, instance, validated_data):
+        with transaction.atomic():
+            validated_data.pop("course", None)
+            position = validated_data.pop("order", None)
+            if position is not None and position != instance.get_position():
+                validated_data["order"] = Lesson.objects.order_for_position(
+                    instance.course, position, lesson=instance
+                )
+            instance.position = None
+            return super().update(instance, validated_data)
+
+
+class LessonImportListSerializer(serializers.ListSerializer):
+    """
+    List serializer importing many lessons into a course at once.
+    - The lessons are appended to the course in the order of the input, see
+      `LessonQuerySet.bulk_import`.
+    """
+
+    def create(self, validated_data):
+        course = validated_data[0]["course"]
+        return Lesson.objects.bulk_import(
+            course,
+            [
+                Lesson(title=item["title"], content=item["content"])
+                for item in validated_data
+            ],
+        )
+
+
+class LessonImportSerializer(LessonSerializer):
+    """
+    Serializer for a lesson imported with the others of a course, which
+    comes from the URL.
+    - `order` is read-only: the position the lesson was imported at.
+    - `many=True` imports the lessons in bulk.
+    """
+
+    order = LessonOrderField(
+        read_only=True,
+        help_text="Position of the lesson within the course, starting at 1.",
+    )
+
+    class Meta(LessonSerializer.Meta):
+        exclude = LessonSerializer.Meta.exclude + ["course"]
+        list_serializer_class = LessonImportListSerializer
@@ -0,0 +1,31 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_catalog
+from .models import Course, Lesson, UserRole
+from .roles import forget_user_roles
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+@receiver(post_save, sender=Lesson)
+@receiver(post_delete, sender=Lesson)
+@receiver(post_save, sender=UserRole)
+@receiver(post_delete, sender=UserRole)
+def invalidate_catalog_on_change(sender, **kwargs):
+    """
+    Invalidates the cached public catalog whenever a course, lesson or role
+    changes, as the catalog shows the lesson and student counters.
+    Bulk paths do not send signals and call `invalidate_catalog()` themselves.
+    """
+    invalidate_catalog()
+
+
+@receiver(post_save, sender=UserRole)
+@receiver(post_delete, sender=UserRole)
+def forget_user_roles_on_change(sender, instance, **kwargs):
+    """
+    Drops the cached roles of the user in the course once one of them changes.
+    Bulk paths do not send signals and call `forget_user_roles()` themselves.
+    """
+    forget_user_roles([(instance.user_id, instance.course_id)])
@@ -1,8 +1,21 @@
 import pytest
 import random
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from rest_framework.test import APIClient
 from courses.models import Course, Lesson, UserRole
+from courses.roles import local_roles
+
+
+# Start every test with an empty cache
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Clears the caches so cached pages and roles never leak between tests."""
+    cache.clear()
+    local_roles.clear()
+    yield
+    cache.clear()
+    local_roles.clear()
 
 
 # API client fixture
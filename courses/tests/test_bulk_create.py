@@ -0,0 +1,95 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from courses.models import Course, UserRole
+from courses.views import CourseViewSet
+
+
+@pytest.mark.django_db
+def test_course_bulk_create(api_client, create_user, django_assert_num_queries):
+    instructor_user = create_user(
+        "instructor_user", "instructor@example.com", "1234.qaz"
+    )
+    api_client.force_authenticate(user=instructor_user)
+    data = [
+        {"title": f"Course {i}", "description": "Imported.", "is_published": True}
+        for i in range(50)
+    ]
+
+    # Courses, roles and search vectors are written with one statement each,
+    # inside a savepoint
+    with django_assert_num_queries(5):
+        response = api_client.post(reverse("course-bulk-create"), data, format="json")
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [course["title"] for course in response.data] == [
+        course["title"] for course in data
+    ]
+    courses = Course.objects.filter(created_by=instructor_user)
+    assert courses.count() == 50
+    assert (
+        UserRole.objects.filter(
+            user=instructor_user, role=UserRole.ROLE_INSTRUCTOR, course__in=courses
+        ).count()
+        == 50
+    )
+    assert Course.objects.search("course 7").filter(created_by=instructor_user).exists()
+
+
+@pytest.mark.django_db
+def test_course_bulk_create_reports_errors_per_item(api_client, create_user):
+    instructor_user = create_user(
+        "instructor_user", "instructor@example.com", "1234.qaz"
+    )
+    api_client.force_authenticate(user=instructor_user)
+    data = [
+        {"title": "Valid Course", "description": "Imported."},
+        {"title": "No Description"},
+        {"title": "", "description": "Imported."},
+    ]
+
+    response = api_client.post(reverse("course-bulk-create"), data, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data[0] == {}
+    assert set(response.data[1]) == {"description"}
+    assert set(response.data[2]) == {"title"}
+    # All or nothing
+    assert not Course.objects.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("data", [[], {"title": "Not a list"}])
+def test_course_bulk_create_requires_a_list(api_client, create_user, data):
+    instructor_user = create_user(
+        "instructor_user", "instructor@example.com", "1234.qaz"
+    )
+    api_client.force_authenticate(user=instructor_user)
+
+    response = api_client.post(reverse("course-bulk-create"), data, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_course_bulk_create_limits_items(api_client, create_user, monkeypatch):
+    monkeypatch.setattr(CourseViewSet, "bulk_create_max_items", 2)
+    instructor_user = create_user(
+        "instructor_user", "instructor@example.com", "1234.qaz"
+    )
+    api_client.force_authenticate(user=instructor_user)
+    data = [{"title": f"Course {i}", "description": "Imported."} for i in range(3)]
+
+    response = api_client.post(reverse("course-bulk-create"), data, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not Course.objects.exists()
+
+
+@pytest.mark.django_db
+def test_course_bulk_create_requires_authentication(api_client):
+    data = [{"title": "Course", "description": "Imported."}]
+
+    response = api_client.post(reverse("course-bulk-create"), data, format="json")
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
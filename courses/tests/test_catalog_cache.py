@@ -0,0 +1,98 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from courses.cache import CATALOG_VERSION_KEY, bump_catalog_version, get_catalog_version
+
+
+@pytest.mark.django_db
+def test_anonymous_catalog_is_served_from_cache(
+    api_client, setup_users_and_courses, django_assert_num_queries
+):
+    url = reverse("course-list")
+    response = api_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+
+    # The second request does not touch the database
+    with django_assert_num_queries(0):
+        cached = api_client.get(url)
+
+    assert cached.status_code == status.HTTP_200_OK
+    assert cached.content == response.content
+    assert cached["Content-Type"] == response["Content-Type"]
+    assert cached["ETag"] == response["ETag"]
+
+
+@pytest.mark.django_db
+def test_cached_catalog_answers_conditional_requests(
+    api_client, setup_users_and_courses, django_assert_num_queries
+):
+    url = reverse("course-list")
+    etag = api_client.get(url)["ETag"]
+
+    with django_assert_num_queries(0):
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "change", ["edit_course", "delete_course", "add_lesson", "enroll_student"]
+)
+def test_catalog_cache_is_invalidated(
+    api_client, setup_users_and_courses, create_lesson, change
+):
+    url = reverse("course-list")
+    course1 = setup_users_and_courses["course1"]
+    response = api_client.get(url)
+
+    if change == "edit_course":
+        course1.title = "Renamed Course"
+        course1.save()
+    elif change == "delete_course":
+        course1.delete()
+    elif change == "add_lesson":
+        create_lesson(course1, "Lesson 3", order=3)
+    else:
+        course1.enroll_student(setup_users_and_courses["regular_user"])
+
+    fresh = api_client.get(url)
+    assert fresh.content != response.content
+
+
+@pytest.mark.django_db
+def test_catalog_cache_varies_by_query_string(api_client, setup_users_and_courses):
+    url = reverse("course-list")
+    api_client.get(url)
+
+    response = api_client.get(url, {"page_size": 1})
+
+    assert len(response.json()["results"]) == 1
+
+
+@pytest.mark.django_db
+def test_authenticated_catalog_is_not_cached(api_client, setup_users_and_courses):
+    api_client.force_authenticate(user=setup_users_and_courses["instructor_user"])
+    url = reverse("course-list")
+    api_client.get(url)
+
+    # Authenticated users see their own drafts, so every request is computed
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(url)
+
+    assert len(response.data["results"]) == 3
+    assert len(context.captured_queries) == 1
+
+
+def test_catalog_version_survives_eviction():
+    version = get_catalog_version()
+    bump_catalog_version()
+    assert get_catalog_version() == version + 1
+
+    # A missing version key restarts from a value never used before
+    cache.delete(CATALOG_VERSION_KEY)
+    bump_catalog_version()
+    assert get_catalog_version() > version + 1
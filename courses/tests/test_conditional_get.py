@@ -0,0 +1,158 @@
+import pytest
+from datetime import timedelta
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework import status
+from courses.models import Course, Lesson
+
+
+@pytest.mark.django_db
+def test_course_list_etag(api_client, setup_users_and_courses):
+    url = reverse("course-list")
+
+    response = api_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response["ETag"]
+
+    # Unchanged catalog
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response["ETag"] == etag
+    assert not response.content
+
+    # Editing a listed course changes the validator
+    course1 = setup_users_and_courses["course1"]
+    course1.title = "Renamed Course"
+    course1.save()
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_course_list_etag_varies_by_user_and_page(api_client, setup_users_and_courses):
+    url = reverse("course-list")
+    anonymous_etag = api_client.get(url)["ETag"]
+
+    # The creator also sees unpublished courses
+    api_client.force_authenticate(user=setup_users_and_courses["instructor_user"])
+    assert api_client.get(url)["ETag"] != anonymous_etag
+
+    # Another page or field selection is another representation
+    assert api_client.get(url, {"page_size": 1})["ETag"] != anonymous_etag
+    assert api_client.get(url, {"fields": "id"})["ETag"] != anonymous_etag
+
+
+@pytest.mark.django_db
+def test_course_list_no_last_modified(api_client, setup_users_and_courses):
+    # Unpublishing a listed course would not advance the latest `updated_at`
+    url = reverse("course-list")
+
+    response = api_client.get(url)
+    assert "Last-Modified" not in response
+
+    response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=http_date())
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_course_detail_etag(api_client, setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    url = reverse("course-detail", kwargs={"pk": course1.id})
+
+    etag = api_client.get(url)["ETag"]
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    course1.description = "Updated description."
+    course1.save()
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["description"] == "Updated description."
+
+
+@pytest.mark.django_db
+def test_course_detail_not_found_is_not_conditional(
+    api_client, setup_users_and_courses
+):
+    # Unpublished courses are hidden from anonymous users
+    course2 = setup_users_and_courses["course2"]
+    url = reverse("course-detail", kwargs={"pk": course2.id})
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH="*")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert "ETag" not in response
+
+
+@pytest.mark.django_db
+def test_lesson_list_etag(api_client, setup_users_and_courses, create_lesson):
+    course1 = setup_users_and_courses["course1"]
+    api_client.force_authenticate(user=setup_users_and_courses["student_user"])
+    url = reverse("course-lessons-list", kwargs={"course_pk": course1.id})
+
+    etag = api_client.get(url)["ETag"]
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    # Adding a lesson changes the validator
+    lesson = create_lesson(course1, "Lesson 3", order=3)
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response["ETag"]
+
+    # So does deleting one
+    lesson.delete()
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+def test_lesson_list_last_modified(api_client, setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    lesson1 = setup_users_and_courses["lesson1"]
+    an_hour_ago = timezone.now() - timedelta(hours=1)
+    Course.objects.filter(pk=course1.pk).update(updated_at=an_hour_ago)
+    Lesson.objects.filter(course=course1).update(updated_at=an_hour_ago)
+    api_client.force_authenticate(user=setup_users_and_courses["student_user"])
+    url = reverse("course-lessons-list", kwargs={"course_pk": course1.id})
+
+    last_modified = api_client.get(url)["Last-Modified"]
+    response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    # Deleting a lesson leaves the others as they were, but touches the course
+    lesson1.delete()
+    response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data) == 1
+
+
+@pytest.mark.django_db
+def test_lesson_detail_etag(api_client, setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    lesson1 = setup_users_and_courses["lesson1"]
+    api_client.force_authenticate(user=setup_users_and_courses["student_user"])
+    url = reverse(
+        "course-lessons-detail", kwargs={"course_pk": course1.id, "pk": lesson1.id}
+    )
+
+    etag = api_client.get(url)["ETag"]
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    lesson1.content = "Updated content."
+    lesson1.save()
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert "updated_at" in response.data
+
+
+@pytest.mark.django_db
+def test_course_detail_malformed_pk(api_client, setup_users_and_courses):
+    url = reverse("course-detail", kwargs={"pk": "abc"})
+
+    response = api_client.get(url)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
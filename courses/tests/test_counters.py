@@ -0,0 +1,160 @@
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from courses.models import Course, Lesson, UserRole
+from courses.serializers import CourseSerializer
+
+
+def counters(course):
+    course.refresh_from_db()
+    return course.lesson_count, course.student_count
+
+
+@pytest.mark.django_db
+def test_counters_follow_lessons_and_enrollments(setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    course2 = setup_users_and_courses["course2"]
+    course3 = setup_users_and_courses["course3"]
+
+    # The instructor role is not counted as a student
+    assert counters(course1) == (2, 1)
+    assert counters(course2) == (1, 1)
+    assert counters(course3) == (1, 0)
+
+    course1.enroll_student(setup_users_and_courses["regular_user"])
+    setup_users_and_courses["lesson1"].delete()
+    assert counters(course1) == (1, 2)
+
+
+@pytest.mark.django_db
+def test_counters_follow_bulk_paths(setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    course3 = setup_users_and_courses["course3"]
+
+    Lesson.objects.bulk_create(
+        [
+            Lesson(course=course, title="Extra", content="Content", order=order)
+            for course in (course1, course3)
+            for order in (10, 11, 12)
+        ]
+    )
+    assert counters(course1) == (5, 1)
+    assert counters(course3) == (4, 0)
+
+    Lesson.objects.filter(order__gte=11).delete()
+    assert counters(course1) == (3, 1)
+    assert counters(course3) == (2, 0)
+
+    # Changing the role of an enrollment moves it out of the student count
+    UserRole.objects.filter(course=course1, role=UserRole.ROLE_STUDENT).update(
+        role=UserRole.ROLE_INSTRUCTOR
+    )
+    assert counters(course1) == (3, 0)
+
+    # Moving lessons between courses moves their counts
+    Lesson.objects.filter(course=course1, order=10).update(course=course3, order=20)
+    assert counters(course1) == (2, 0)
+    assert counters(course3) == (3, 0)
+
+
+@pytest.mark.django_db
+def test_stale_course_save_keeps_counters(setup_users_and_courses, create_lesson):
+    course1 = Course.objects.get(pk=setup_users_and_courses["course1"].pk)
+    create_lesson(course1, "Lesson 3", order=3)
+
+    # The instance still holds the old count
+    course1.title = "Renamed Course"
+    course1.save()
+
+    assert counters(course1) == (3, 1)
+    assert course1.title == "Renamed Course"
+
+
+@pytest.mark.django_db
+def test_counters_in_course_serializer(api_client, setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    url = reverse("course-detail", kwargs={"pk": course1.id})
+
+    response = api_client.get(url)
+
+    assert response.data["lesson_count"] == 2
+    assert response.data["student_count"] == 1
+    fields = CourseSerializer().fields
+    assert fields["lesson_count"].read_only
+    assert fields["student_count"].read_only
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "ordering, expected_titles",
+    [
+        ("-lesson_count", ["Course 1", "Course 3"]),
+        ("lesson_count", ["Course 3", "Course 1"]),
+        ("-student_count", ["Course 1", "Course 3"]),
+        ("student_count", ["Course 3", "Course 1"]),
+        # Unknown fields fall back to the newest first
+        ("title", ["Course 3", "Course 1"]),
+    ],
+)
+def test_course_list_ordering(
+    api_client, setup_users_and_courses, ordering, expected_titles
+):
+    response = api_client.get(reverse("course-list"), {"ordering": ordering})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [course["title"] for course in response.data["results"]] == expected_titles
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("ordering", ["-lesson_count", "student_count"])
+def test_course_list_ordering_pages_through_ties(
+    api_client, create_user, create_course, create_lesson, ordering
+):
+    instructor_user = create_user(
+        "instructor_user", "instructor@example.com", "1234.qaz"
+    )
+    courses = [
+        create_course(instructor_user, f"Course {i}", "Description", is_published=True)
+        for i in range(7)
+    ]
+    for course in courses[::3]:
+        create_lesson(course, "Lesson 1")
+
+    # Forwards, then back again
+    url = f"{reverse('course-list')}?page_size=2&ordering={ordering}"
+    pages = []
+    while url:
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        pages.append([course["id"] for course in response.data["results"]])
+        url = response.data["next"]
+    seen = [pk for page in pages for pk in page]
+    assert sorted(seen) == sorted(course.id for course in courses)
+
+    url = response.data["previous"]
+    for expected in reversed(pages[:-1]):
+        response = api_client.get(url)
+        assert [course["id"] for course in response.data["results"]] == expected
+        url = response.data["previous"]
+    assert url is None
+
+
+@pytest.mark.django_db
+def test_course_list_rejects_malformed_cursor(api_client):
+    response = api_client.get(reverse("course-list"), {"cursor": "cD1mb28="})
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_recompute_course_counters(setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    course3 = setup_users_and_courses["course3"]
+    Course.objects.filter(pk=course1.pk).update(lesson_count=7, student_count=0)
+
+    call_command("recompute_course_counters", batch_size=2)
+
+    assert counters(course1) == (2, 1)
+    assert counters(course3) == (1, 0)
+    assert Course.objects.recompute_counters() == 0
@@ -1,4 +1,6 @@
 import pytest
+from base64 import b64encode
+from urllib.parse import urlencode
 from django.urls import reverse
 from rest_framework import status
 from courses.models import Course, UserRole
@@ -83,11 +85,65 @@ def test_course_list(
 
     # Check response
     assert response.status_code == status.HTTP_200_OK
-    assert len(response.data) == num_courses
+    results = response.data["results"]
+    assert len(results) == num_courses
 
     # Verify that the expected courses are in the response
     for course_title in expected_courses:
-        assert any(course["title"] == course_title for course in response.data)
+        assert any(course["title"] == course_title for course in results)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("page_size", [1, 2, 7])
+def test_course_list_cursor_pagination(
+    api_client, create_user, create_course, page_size
+):
+    instructor_user = create_user(
+        "instructor_user", "instructor@example.com", "1234.qaz"
+    )
+    courses = [
+        create_course(instructor_user, f"Course {i}", "Description", is_published=True)
+        for i in range(10)
+    ]
+
+    # Walk every page by following the `next` cursor
+    url = f"{reverse('course-list')}?page_size={page_size}"
+    seen = []
+    while url:
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert "count" not in response.data
+        assert len(response.data["results"]) <= page_size
+        seen.extend(course["id"] for course in response.data["results"])
+        url = response.data["next"]
+
+    # Newest first, every course exactly once
+    assert seen == [course.id for course in reversed(courses)]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "position, ordering",
+    [
+        ("not json", None),
+        ('["2024-01-01T00:00:00+00:00"]', None),
+        ('["garbage", "x"]', None),
+        ("[null, null]", None),
+        ('["2024-01-01T00:00:00+00:00", 99999999999999999999]', None),
+        ('["garbage", "x", "y"]', "lesson_count"),
+    ],
+)
+def test_course_list_invalid_cursor(
+    api_client, setup_users_and_courses, position, ordering
+):
+    cursor = b64encode(urlencode({"p": position}).encode()).decode()
+    params = {"cursor": cursor}
+    if ordering:
+        params["ordering"] = ordering
+
+    response = api_client.get(reverse("course-list"), params)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
 @pytest.mark.django_db
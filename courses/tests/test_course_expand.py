@@ -0,0 +1,145 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+
+def course_url(course):
+    return reverse("course-detail", kwargs={"pk": course.id})
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "expand, expected_fields, expected_queries",
+    [
+        ("", set(), 2),
+        ("lessons", {"lessons"}, 3),
+        ("instructor", {"instructor"}, 2),
+        ("lessons,instructor", {"lessons", "instructor"}, 4),
+    ],
+)
+def test_course_detail_expand(
+    api_client,
+    setup_users_and_courses,
+    django_assert_num_queries,
+    expand,
+    expected_fields,
+    expected_queries,
+):
+    course1 = setup_users_and_courses["course1"]
+    course1.publish()
+    api_client.force_authenticate(user=setup_users_and_courses["student_user"])
+
+    with django_assert_num_queries(expected_queries):
+        response = api_client.get(course_url(course1), {"expand": expand})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert {"lessons", "instructor"} & set(response.data) == expected_fields
+    if "lessons" in expected_fields:
+        assert response.data["lessons"] == [
+            {
+                "id": setup_users_and_courses["lesson1"].id,
+                "title": "Lesson 1",
+                "order": 1,
+            },
+            {
+                "id": setup_users_and_courses["lesson2"].id,
+                "title": "Lesson 2",
+                "order": 2,
+            },
+        ]
+    if "instructor" in expected_fields:
+        instructor = response.data["instructor"]
+        assert instructor["username"] == course1.created_by.username
+        assert "email" not in instructor
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "user_role, expected_status",
+    [
+        (None, status.HTTP_401_UNAUTHORIZED),
+        ("regular_user", status.HTTP_403_FORBIDDEN),
+        ("another_instructor", status.HTTP_403_FORBIDDEN),
+        # Enrolled in another course only
+        ("another_student", status.HTTP_403_FORBIDDEN),
+        ("instructor_user", status.HTTP_200_OK),
+        ("student_user", status.HTTP_200_OK),
+    ],
+)
+def test_course_detail_expand_lessons_permissions(
+    api_client, setup_users_and_courses, user_role, expected_status
+):
+    course1 = setup_users_and_courses["course1"]
+    course1.assign_instructor(setup_users_and_courses["instructor_user"])
+    if user_role:
+        api_client.force_authenticate(user=setup_users_and_courses[user_role])
+
+    response = api_client.get(course_url(course1), {"expand": "lessons"})
+
+    assert response.status_code == expected_status
+    assert ("lessons" in response.data) == (expected_status == status.HTTP_200_OK)
+
+
+@pytest.mark.django_db
+def test_course_detail_expand_without_instructor(api_client, setup_users_and_courses):
+    # Course 3 has no instructor role
+    course3 = setup_users_and_courses["course3"]
+
+    response = api_client.get(course_url(course3), {"expand": "instructor"})
+
+    assert response.data["instructor"] is None
+
+
+@pytest.mark.django_db
+def test_course_detail_expand_first_instructor(api_client, setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    instructor_user = setup_users_and_courses["instructor_user"]
+    course1.assign_instructor(instructor_user)
+    course1.assign_instructor(setup_users_and_courses["another_instructor"])
+
+    for _ in range(3):
+        response = api_client.get(course_url(course1), {"expand": "instructor"})
+        assert response.data["instructor"]["username"] == instructor_user.username
+
+
+@pytest.mark.django_db
+def test_course_detail_expand_with_sparse_fieldsets(
+    api_client, setup_users_and_courses
+):
+    course1 = setup_users_and_courses["course1"]
+    api_client.force_authenticate(user=setup_users_and_courses["student_user"])
+
+    response = api_client.get(
+        course_url(course1), {"expand": "lessons", "fields": "id,lessons"}
+    )
+
+    assert set(response.data) == {"id", "lessons"}
+
+
+@pytest.mark.django_db
+def test_course_detail_expand_unknown(api_client, setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+
+    response = api_client.get(course_url(course1), {"expand": "students"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "expand" in response.data
+
+
+@pytest.mark.django_db
+def test_course_detail_expand_etag_follows_lessons(api_client, setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    lesson1 = setup_users_and_courses["lesson1"]
+    api_client.force_authenticate(user=setup_users_and_courses["student_user"])
+    url = course_url(course1)
+
+    etag = api_client.get(url, {"expand": "lessons"})["ETag"]
+    response = api_client.get(url, {"expand": "lessons"}, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    # Renaming a lesson does not touch the course row
+    lesson1.title = "Renamed Lesson"
+    lesson1.save()
+    response = api_client.get(url, {"expand": "lessons"}, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["lessons"][0]["title"] == "Renamed Lesson"
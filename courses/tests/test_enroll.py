@@ -0,0 +1,77 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from courses.models import Course, UserRole
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_enroll_reports_new_and_existing_enrollments(
+    api_client, setup_users_and_courses
+):
+    course1 = setup_users_and_courses["course1"]
+    api_client.force_authenticate(user=setup_users_and_courses["regular_user"])
+    url = reverse("course-enroll", kwargs={"pk": course1.id})
+
+    response = api_client.post(url)
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.data == {"status": "enrolled"}
+
+    response = api_client.post(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == {"status": "already_enrolled"}
+
+    course1.refresh_from_db()
+    assert course1.student_count == 2
+
+
+@pytest.mark.django_db
+def test_enroll_student_is_one_statement(
+    setup_users_and_courses, django_assert_num_queries
+):
+    course1 = setup_users_and_courses["course1"]
+    regular_user = setup_users_and_courses["regular_user"]
+
+    with django_assert_num_queries(1):
+        assert course1.enroll_student(regular_user) is True
+    with django_assert_num_queries(1):
+        assert course1.enroll_student(regular_user) is False
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_enrollments(create_user, create_course):
+    instructor_user = create_user(
+        "instructor_user", "instructor@example.com", "1234.qaz"
+    )
+    course = create_course(instructor_user, "Launch", "Popular course.", True)
+    users = [
+        User.objects.create_user(
+            username=f"learner{i}", email=f"learner{i}@example.com"
+        )
+        for i in range(8)
+    ]
+    # Every user enrolls four times, all requests released at once
+    attempts = users * 4
+    barrier = Barrier(len(attempts))
+
+    def enroll(user):
+        try:
+            barrier.wait()
+            return user.pk, Course.objects.get(pk=course.pk).enroll_student(user)
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=len(attempts)) as executor:
+        results = list(executor.map(enroll, attempts))
+
+    # Exactly one attempt per user enrolled, the others saw the enrollment
+    created = [user_id for user_id, newly in results if newly]
+    assert sorted(created) == sorted(user.pk for user in users)
+    assert UserRole.objects.filter(course=course).count() == len(users)
+    course.refresh_from_db()
+    assert course.student_count == len(users)
@@ -0,0 +1,85 @@
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from courses.models import EnrollmentRequest, UserRole
+
+
+@pytest.mark.django_db
+def test_async_enrollment(api_client, setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    regular_user = setup_users_and_courses["regular_user"]
+    api_client.force_authenticate(user=regular_user)
+    url = reverse("course-enroll", kwargs={"pk": course1.id})
+
+    assert api_client.get(url).data == {"status": "not_enrolled"}
+
+    response = api_client.post(url, HTTP_PREFER="respond-async")
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.data["status"] == "pending"
+    assert response["Location"] == response.data["status_url"]
+    assert response["Location"].endswith(url)
+    assert api_client.get(url).data == {"status": "pending"}
+    assert not UserRole.objects.is_role(regular_user, course1, UserRole.ROLE_STUDENT)
+
+    call_command("drain_enrollments", once=True)
+
+    assert api_client.get(url).data == {"status": "enrolled"}
+    course1.refresh_from_db()
+    assert course1.student_count == 2
+
+
+@pytest.mark.django_db
+def test_async_enrollment_setting(api_client, setup_users_and_courses, settings):
+    settings.COURSE_ENROLLMENT_ASYNC = True
+    course1 = setup_users_and_courses["course1"]
+    api_client.force_authenticate(user=setup_users_and_courses["regular_user"])
+
+    response = api_client.post(reverse("course-enroll", kwargs={"pk": course1.id}))
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+
+
+@pytest.mark.django_db
+def test_async_enrollment_already_enrolled(
+    api_client, setup_users_and_courses, settings
+):
+    settings.COURSE_ENROLLMENT_ASYNC = True
+    course1 = setup_users_and_courses["course1"]
+    api_client.force_authenticate(user=setup_users_and_courses["student_user"])
+
+    response = api_client.post(reverse("course-enroll", kwargs={"pk": course1.id}))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == {"status": "already_enrolled"}
+    assert not EnrollmentRequest.objects.exists()
+
+
+@pytest.mark.django_db
+def test_enqueue_collapses_repeated_requests(setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    regular_user = setup_users_and_courses["regular_user"]
+
+    assert EnrollmentRequest.objects.enqueue(regular_user, course1) is True
+    assert EnrollmentRequest.objects.enqueue(regular_user, course1) is False
+    assert EnrollmentRequest.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_drain_in_batches(setup_users_and_courses, django_assert_num_queries):
+    course1 = setup_users_and_courses["course1"]
+    course3 = setup_users_and_courses["course3"]
+    for name in ("regular_user", "another_student"):
+        EnrollmentRequest.objects.enqueue(setup_users_and_courses[name], course1)
+    # Already enrolled: drained without a new enrollment
+    EnrollmentRequest.objects.enqueue(setup_users_and_courses["student_user"], course1)
+    EnrollmentRequest.objects.enqueue(setup_users_and_courses["regular_user"], course3)
+
+    with django_assert_num_queries(1):
+        assert EnrollmentRequest.objects.drain(batch_size=3) == (3, 2)
+    assert EnrollmentRequest.objects.drain(batch_size=3) == (1, 1)
+    assert EnrollmentRequest.objects.drain(batch_size=3) == (0, 0)
+
+    course1.refresh_from_db()
+    course3.refresh_from_db()
+    assert (course1.student_count, course3.student_count) == (3, 1)
@@ -0,0 +1,136 @@
+import json
+import pytest
+from datetime import timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from courses.models import Course, Lesson
+from courses.views import CourseViewSet
+
+
+def read_lines(response):
+    content = b"".join(response.streaming_content)
+    return [json.loads(line) for line in content.decode().splitlines()]
+
+
+@pytest.mark.django_db
+def test_course_export_ndjson(api_client, setup_users_and_courses):
+    response = api_client.get(reverse("course-export"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.streaming
+    assert response["Content-Type"] == "application/x-ndjson"
+    assert 'filename="courses.ndjson"' in response["Content-Disposition"]
+    courses = read_lines(response)
+    assert [course["title"] for course in courses] == ["Course 1", "Course 3"]
+    assert "lessons" not in courses[0]
+
+
+@pytest.mark.django_db
+def test_course_export_json_array(api_client, setup_users_and_courses):
+    api_client.force_authenticate(user=setup_users_and_courses["instructor_user"])
+
+    response = api_client.get(reverse("course-export"), {"format": "json"})
+
+    assert response["Content-Type"] == "application/json"
+    courses = json.loads(b"".join(response.streaming_content))
+    assert [course["title"] for course in courses] == [
+        "Course 1",
+        "Course 2",
+        "Course 3",
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "user_role, expected_lessons",
+    [
+        # Lessons of the courses the user has a role in
+        ("student_user", {"Course 1": ["Lesson 1", "Lesson 2"], "Course 3": []}),
+        ("regular_user", {"Course 1": [], "Course 3": []}),
+    ],
+)
+def test_course_export_lessons(
+    api_client, setup_users_and_courses, user_role, expected_lessons
+):
+    api_client.force_authenticate(user=setup_users_and_courses[user_role])
+
+    response = api_client.get(
+        reverse("course-export"), {"expand": "lessons", "fields": "id,title"}
+    )
+
+    courses = read_lines(response)
+    assert {
+        course["title"]: [lesson["title"] for lesson in course["lessons"]]
+        for course in courses
+    } == expected_lessons
+    assert set(courses[0]) == {"id", "title", "lessons"}
+
+
+@pytest.mark.django_db
+def test_course_export_streams_in_chunks(
+    api_client, setup_users_and_courses, monkeypatch
+):
+    monkeypatch.setattr(CourseViewSet, "export_chunk_size", 2)
+    # Staff creator: every course and lesson is exported
+    instructor_user = setup_users_and_courses["instructor_user"]
+    instructor_user.is_staff = True
+    instructor_user.save()
+    api_client.force_authenticate(user=instructor_user)
+
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(reverse("course-export"), {"expand": "lessons"})
+        courses = read_lines(response)
+
+    # One lesson query per chunk of courses, never one per course
+    lesson_queries = [
+        query
+        for query in context.captured_queries
+        if 'FROM "courses_lesson"' in query["sql"]
+    ]
+    assert len(courses) == 3
+    assert len(lesson_queries) == 2
+    assert sum(len(course["lessons"]) for course in courses) == 4
+
+
+@pytest.mark.django_db
+def test_course_export_updated_since(api_client, setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    lesson4 = setup_users_and_courses["lesson4"]
+    since = timezone.now() + timedelta(minutes=1)
+    Course.objects.filter(pk=course1.pk).update(updated_at=since)
+    Lesson.objects.filter(pk=lesson4.pk).update(updated_at=since)
+
+    response = api_client.get(
+        reverse("course-export"), {"updated_since": since.isoformat()}
+    )
+
+    # Course 3 changed through its lesson
+    assert [course["title"] for course in read_lines(response)] == [
+        "Course 1",
+        "Course 3",
+    ]
+
+    response = api_client.get(
+        reverse("course-export"),
+        {"updated_since": (since + timedelta(seconds=1)).isoformat()},
+    )
+    assert read_lines(response) == []
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "params, error_field",
+    [
+        ({"updated_since": "yesterday"}, "updated_since"),
+        ({"updated_since": "2024-02-30T00:00:00"}, "updated_since"),
+        ({"expand": "instructor"}, "expand"),
+    ],
+)
+def test_course_export_invalid_params(api_client, params, error_field):
+    response = api_client.get(reverse("course-export"), params)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert error_field in json.loads(response.content)
@@ -630,3 +630,21 @@ def test_delete_lesson(
     else:
         # Ensure that the expected detail is returned when deletion is not allowed
         assert expected_detail in str(response.data)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("user_role", ["student_user", "instructor_user"])
+def test_list_lessons_num_queries(
+    api_client, setup_users_and_courses, django_assert_num_queries, user_role
+):
+    course1 = setup_users_and_courses["course1"]
+    course1.assign_instructor(setup_users_and_courses["instructor_user"])
+    api_client.force_authenticate(user=setup_users_and_courses[user_role])
+    url = reverse("course-lessons-list", kwargs={"course_pk": course1.id})
+
+    # One query for the course and the user's roles, one for the lessons
+    with django_assert_num_queries(2):
+        response = api_client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data) == 2
@@ -0,0 +1,142 @@
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from courses import models
+from courses.models import Lesson
+
+MARKDOWN = """# Variables
+
+Assign with `=`. <script>alert("x")</script>
+
+[Docs](javascript:alert(1)) <img src="a.png" onerror="alert(1)">
+
+```python
+x = 1
+```
+"""
+
+
+@pytest.fixture
+def lesson(setup_users_and_courses, create_lesson):
+    return create_lesson(
+        setup_users_and_courses["course1"], "Lesson 3", MARKDOWN, order=3
+    )
+
+
+@pytest.fixture
+def render_count(monkeypatch):
+    """Counts the Markdown renders of lesson content."""
+    calls = []
+
+    def render_markdown(content):
+        calls.append(content)
+        return render(content)
+
+    render = models.render_markdown
+    monkeypatch.setattr(models, "render_markdown", render_markdown)
+    return calls
+
+
+@pytest.mark.django_db
+def test_lesson_html_rendered_on_save(lesson):
+    assert "<h1>Variables</h1>" in lesson.content_html
+    assert '<code class="language-python">x = 1' in lesson.content_html
+    for unsafe in ("<script", "alert", "onerror", "javascript:"):
+        assert unsafe not in lesson.content_html
+
+
+@pytest.mark.django_db
+def test_lesson_html_rendered_once(lesson, render_count):
+    lesson.title = "Renamed"
+    lesson.save()
+    assert render_count == []
+
+    lesson.content = "**Updated**"
+    lesson.save(update_fields=["content"])
+    assert render_count == ["**Updated**"]
+    lesson.refresh_from_db()
+    assert lesson.content_html == "<p><strong>Updated</strong></p>"
+    assert lesson.content_length == len("**Updated**")
+
+
+@pytest.mark.django_db
+def test_lesson_html_rendered_on_import(api_client, setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    instructor_user = setup_users_and_courses["instructor_user"]
+    course1.assign_instructor(instructor_user)
+    api_client.force_authenticate(user=instructor_user)
+
+    response = api_client.post(
+        reverse("course-lessons-import", kwargs={"course_pk": course1.id}),
+        [{"title": "Imported", "content": "*Imported*"}],
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert "content_html" not in response.data[0]
+    assert (
+        Lesson.objects.get(pk=response.data[0]["id"]).content_html
+        == "<p><em>Imported</em></p>"
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("detail", [True, False])
+def test_lesson_html_format(
+    api_client, setup_users_and_courses, lesson, render_count, detail
+):
+    course1 = setup_users_and_courses["course1"]
+    api_client.force_authenticate(user=setup_users_and_courses["student_user"])
+    if detail:
+        url = reverse(
+            "course-lessons-detail", kwargs={"course_pk": course1.id, "pk": lesson.id}
+        )
+    else:
+        url = reverse("course-lessons-list", kwargs={"course_pk": course1.id})
+
+    response = api_client.get(url, {"format": "html"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "text/html; charset=utf-8"
+    body = response.content.decode()
+    assert f'<article id="lesson-{lesson.id}"><h1>Lesson 3</h1>' in body
+    assert lesson.content_html in body
+    assert body.count("<article") == (1 if detail else 3)
+    # Served from the stored HTML, without rendering
+    assert render_count == []
+    assert response["ETag"] != api_client.get(url)["ETag"]
+
+
+@pytest.mark.django_db
+def test_lesson_html_format_error(api_client, setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    api_client.force_authenticate(user=setup_users_and_courses["regular_user"])
+    url = reverse("course-lessons-list", kwargs={"course_pk": course1.id})
+
+    response = api_client.get(url, {"format": "html"})
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert response.content.decode().startswith("<p>")
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("render_all", [False, True])
+def test_render_lesson_html(lesson, render_all):
+    # Lessons saved before rendering or measuring existed, and one rendered by
+    # an older renderer
+    Lesson.objects.exclude(pk=lesson.pk).update(
+        content_html="", content_digest="", content_length=None
+    )
+    Lesson.objects.filter(pk=lesson.pk).update(content_html="<p>Stale</p>")
+
+    call_command("render_lesson_html", all=render_all, stdout=StringIO())
+
+    for other in Lesson.objects.exclude(pk=lesson.pk):
+        assert other.content_html.startswith("<p>")
+        assert other.content_digest
+    lesson.refresh_from_db()
+    assert (lesson.content_html == "<p>Stale</p>") is not render_all
+    for measured in Lesson.objects.all():
+        assert measured.content_length == len(measured.content)
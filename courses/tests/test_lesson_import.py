@@ -0,0 +1,196 @@
+import io
+import pytest
+import struct
+import zipfile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from courses.models import Lesson
+
+
+@pytest.fixture
+def course1(api_client, setup_users_and_courses):
+    """Course 1, with its two lessons, as its instructor."""
+    course1 = setup_users_and_courses["course1"]
+    instructor_user = setup_users_and_courses["instructor_user"]
+    course1.assign_instructor(instructor_user)
+    api_client.force_authenticate(user=instructor_user)
+    return course1
+
+
+def import_lessons(api_client, course, data, format="json"):
+    return api_client.post(
+        reverse("course-lessons-import", kwargs={"course_pk": course.id}),
+        data,
+        format=format,
+    )
+
+
+def make_archive(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, text in files.items():
+            archive.writestr(name, text)
+    return SimpleUploadedFile("lessons.zip", buffer.getvalue())
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("count", [3, 50])
+def test_import_lessons(api_client, course1, count):
+    data = [{"title": f"Imported {i}", "content": f"Content {i}"} for i in range(count)]
+
+    with CaptureQueriesContext(connection) as context:
+        response = import_lessons(api_client, course1, data)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [lesson["title"] for lesson in response.data] == [
+        item["title"] for item in data
+    ]
+    assert [lesson["order"] for lesson in response.data] == list(range(3, count + 3))
+    inserts = [
+        query["sql"]
+        for query in context.captured_queries
+        if query["sql"].startswith('INSERT INTO "courses_lesson"')
+    ]
+    assert len(inserts) == 1
+    assert list(
+        Lesson.objects.filter(course=course1).values_list("title", flat=True)
+    ) == ["Lesson 1", "Lesson 2"] + [item["title"] for item in data]
+    course1.refresh_from_db()
+    assert course1.lesson_count == count + 2
+
+
+@pytest.mark.django_db
+def test_import_lessons_ignores_order(api_client, course1):
+    data = [
+        {"title": "First", "content": "Content", "order": 30},
+        {"title": "Second", "content": "Content"},
+        {"title": "Third", "content": "Content", "order": 1},
+    ]
+
+    response = import_lessons(api_client, course1, data)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [(lesson["title"], lesson["order"]) for lesson in response.data] == [
+        ("First", 3),
+        ("Second", 4),
+        ("Third", 5),
+    ]
+
+
+@pytest.mark.django_db
+def test_import_lesson_archive(api_client, course1):
+    upload = make_archive(
+        {
+            "course/02-setup.md": "# Setup\n\nInstall Django.\n",
+            "course/01-intro.md": "Welcome to the course.\n",
+            "course/images/logo.png": "not a lesson",
+        }
+    )
+
+    response = import_lessons(api_client, course1, {"file": upload}, "multipart")
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [
+        (lesson["title"], lesson["content"], lesson["order"])
+        for lesson in response.data
+    ] == [
+        ("01-intro", "Welcome to the course.", 3),
+        ("Setup", "Install Django.", 4),
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "make_data, format, error_field",
+    [
+        (lambda: [], "json", "non_field_errors"),
+        (lambda: {"title": "Lesson"}, "json", "non_field_errors"),
+        (
+            lambda: [{"title": "Lesson", "content": "Content"}, {"title": "Lesson"}],
+            "json",
+            1,
+        ),
+        (
+            lambda: {"file": SimpleUploadedFile("lessons.zip", b"not a zip")},
+            "multipart",
+            "file",
+        ),
+        (
+            lambda: {"file": make_archive({"notes.txt": "Not Markdown"})},
+            "multipart",
+            "file",
+        ),
+    ],
+)
+def test_import_lessons_invalid(api_client, course1, make_data, format, error_field):
+    response = import_lessons(api_client, course1, make_data(), format)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    if isinstance(error_field, int):
+        assert response.data[error_field]
+    else:
+        assert error_field in response.data
+    assert Lesson.objects.filter(course=course1).count() == 2
+
+
+def make_stored_archive(compress_type):
+    """A zip of one lesson, stored uncompressed but labelled `compress_type`."""
+    data = bytearray(make_archive({"lesson.md": "# Lesson\n\nContent."}).read())
+    # The method is in the local file header and in the central directory
+    for header, offset in ((b"PK\x03\x04", 8), (b"PK\x01\x02", 10)):
+        start = data.find(header) + offset
+        data[start : start + 2] = struct.pack("<H", compress_type)
+    return SimpleUploadedFile("lessons.zip", bytes(data))
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "make_upload, max_size, error",
+    [
+        (
+            lambda: make_stored_archive(99),
+            10_000,
+            "compression method",
+        ),
+        # Deflated, but the data is not a deflate stream
+        (
+            lambda: make_stored_archive(zipfile.ZIP_DEFLATED),
+            10_000,
+            "Cannot read",
+        ),
+        (lambda: make_archive({"lesson.md": "x" * 101}), 100, "lesson.md"),
+        (
+            lambda: make_archive({"a.md": "x" * 60, "b.md": "x" * 60}),
+            100,
+            "The lessons are larger",
+        ),
+    ],
+)
+def test_import_lesson_archive_invalid(
+    api_client, course1, settings, make_upload, max_size, error
+):
+    settings.LESSON_IMPORT_MAX_FILE_SIZE = max_size
+    settings.LESSON_IMPORT_MAX_SIZE = max_size
+
+    response = import_lessons(api_client, course1, {"file": make_upload()}, "multipart")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert error in str(response.data["file"])
+    assert Lesson.objects.filter(course=course1).count() == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("user_role", ["student_user", "another_instructor"])
+def test_import_lessons_permissions(api_client, setup_users_and_courses, user_role):
+    course1 = setup_users_and_courses["course1"]
+    api_client.force_authenticate(user=setup_users_and_courses[user_role])
+
+    response = import_lessons(
+        api_client, course1, [{"title": "Lesson", "content": "Content"}]
+    )
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert Lesson.objects.filter(course=course1).count() == 2
@@ -0,0 +1,247 @@
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from courses.models import LESSON_ORDER_STEP, Lesson
+
+
+@pytest.fixture
+def course1(api_client, setup_users_and_courses):
+    """Course 1, with its lesson keys spread out, as its instructor."""
+    course1 = setup_users_and_courses["course1"]
+    instructor_user = setup_users_and_courses["instructor_user"]
+    course1.assign_instructor(instructor_user)
+    Lesson.objects.rebalance(course1)
+    api_client.force_authenticate(user=instructor_user)
+    return course1
+
+
+def lesson_titles(api_client, course):
+    response = api_client.get(
+        reverse("course-lessons-list", kwargs={"course_pk": course.id})
+    )
+    assert [lesson["order"] for lesson in response.data] == list(
+        range(1, len(response.data) + 1)
+    )
+    return [lesson["title"] for lesson in response.data]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "position, expected_position, expected_titles",
+    [
+        (1, 1, ["New Lesson", "Lesson 1", "Lesson 2"]),
+        (2, 2, ["Lesson 1", "New Lesson", "Lesson 2"]),
+        (3, 3, ["Lesson 1", "Lesson 2", "New Lesson"]),
+        (10, 3, ["Lesson 1", "Lesson 2", "New Lesson"]),
+    ],
+)
+def test_insert_lesson(
+    api_client, course1, position, expected_position, expected_titles
+):
+    keys = list(Lesson.objects.filter(course=course1).values_list("id", "order"))
+    url = reverse("course-lessons-list", kwargs={"course_pk": course1.id})
+    data = {"title": "New Lesson", "content": "Content", "order": position}
+
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.post(url, data={**data, "course": course1.id})
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.data["order"] == expected_position
+    assert lesson_titles(api_client, course1) == expected_titles
+    # Only the new lesson is written
+    assert not [
+        query["sql"]
+        for query in context.captured_queries
+        if query["sql"].lstrip().startswith("UPDATE courses_lesson")
+    ]
+    assert (
+        list(
+            Lesson.objects.filter(course=course1)
+            .exclude(title="New Lesson")
+            .values_list("id", "order")
+        )
+        == keys
+    )
+
+
+@pytest.mark.django_db
+def test_insert_lesson_without_gap(api_client, setup_users_and_courses):
+    # The fixture lessons have adjacent keys 1 and 2
+    course1 = setup_users_and_courses["course1"]
+    instructor_user = setup_users_and_courses["instructor_user"]
+    course1.assign_instructor(instructor_user)
+    api_client.force_authenticate(user=instructor_user)
+    url = reverse("course-lessons-list", kwargs={"course_pk": course1.id})
+    data = {"title": "New Lesson", "content": "Content", "order": 2}
+
+    response = api_client.post(url, data={**data, "course": course1.id})
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.data["order"] == 2
+    assert lesson_titles(api_client, course1) == ["Lesson 1", "New Lesson", "Lesson 2"]
+    assert course1.id in Lesson.objects.courses_to_rebalance(16)
+
+
+@pytest.mark.django_db
+def test_move_lesson_position(api_client, course1):
+    lesson1, lesson2 = Lesson.objects.filter(course=course1)
+    url = reverse(
+        "course-lessons-detail", kwargs={"course_pk": course1.id, "pk": lesson1.id}
+    )
+
+    response = api_client.patch(url, data={"order": 2})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["order"] == 2
+    assert api_client.get(url).data["order"] == 2
+    assert lesson_titles(api_client, course1) == ["Lesson 2", "Lesson 1"]
+    # The other lesson keeps its key
+    assert Lesson.objects.get(pk=lesson2.pk).order == lesson2.order
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("data", [{}, {"order": 1}])
+def test_move_lesson_to_other_course(
+    api_client, setup_users_and_courses, course1, data
+):
+    course2 = setup_users_and_courses["course2"]
+    lesson2 = Lesson.objects.filter(course=course1).last()
+    url = reverse(
+        "course-lessons-detail", kwargs={"course_pk": course1.id, "pk": lesson2.id}
+    )
+
+    response = api_client.patch(url, data={**data, "course": course2.id})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["course"] == course1.id
+    assert Lesson.objects.get(pk=lesson2.pk).course_id == course1.id
+
+
+@pytest.mark.django_db
+def test_rebalance_lesson_orders(setup_users_and_courses, create_lesson):
+    course1 = setup_users_and_courses["course1"]
+    create_lesson(course1, "Lesson 3", order=LESSON_ORDER_STEP)
+    assert course1.id in Lesson.objects.courses_to_rebalance(16)
+
+    call_command("rebalance_lesson_orders", once=True, stdout=StringIO())
+
+    assert Lesson.objects.courses_to_rebalance(16) == []
+    assert list(
+        Lesson.objects.filter(course=course1).values_list("title", "order")
+    ) == [
+        ("Lesson 1", LESSON_ORDER_STEP),
+        ("Lesson 2", 2 * LESSON_ORDER_STEP),
+        ("Lesson 3", 3 * LESSON_ORDER_STEP),
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "position, expected_titles",
+    [
+        ("1", ["New Lesson", "Lesson 1", "Lesson 2"]),
+        ("", ["Lesson 1", "Lesson 2", "New Lesson"]),
+    ],
+)
+def test_admin_add_lesson(admin_client, course1, position, expected_titles):
+    keys = list(Lesson.objects.filter(course=course1).values_list("order", flat=True))
+
+    response = admin_client.post(
+        reverse("admin:courses_lesson_add"),
+        {
+            "course": course1.id,
+            "title": "New Lesson",
+            "content": "Content",
+            "position": position,
+        },
+    )
+
+    assert response.status_code == status.HTTP_302_FOUND
+    lessons = Lesson.objects.filter(course=course1)
+    assert [lesson.title for lesson in lessons] == expected_titles
+    assert [lesson.order for lesson in lessons if lesson.title != "New Lesson"] == keys
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "position, expected_titles",
+    [
+        ("2", ["Lesson 2", "Renamed"]),
+        ("1", ["Renamed", "Lesson 2"]),
+        ("", ["Renamed", "Lesson 2"]),
+    ],
+)
+def test_admin_change_lesson(admin_client, course1, position, expected_titles):
+    lesson1, lesson2 = Lesson.objects.filter(course=course1)
+    url = reverse("admin:courses_lesson_change", args=[lesson1.id])
+    assert 'name="position" value="1"' in admin_client.get(url).content.decode()
+
+    response = admin_client.post(
+        url,
+        {
+            "course": course1.id,
+            "title": "Renamed",
+            "content": "Content",
+            "position": position,
+        },
+    )
+
+    assert response.status_code == status.HTTP_302_FOUND
+    assert [
+        lesson.title for lesson in Lesson.objects.filter(course=course1)
+    ] == expected_titles
+    # Only the edited lesson is written
+    assert Lesson.objects.get(pk=lesson2.pk).order == lesson2.order
+    if expected_titles[0] == "Renamed":
+        assert Lesson.objects.get(pk=lesson1.pk).order == lesson1.order
+
+
+@pytest.mark.django_db
+def test_admin_lesson_changelist_positions(admin_client, course1):
+    response = admin_client.get(
+        reverse("admin:courses_lesson_changelist"), {"course__id__exact": course1.id}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [lesson.position for lesson in response.context["cl"].result_list] == [
+        1,
+        2,
+    ]
+
+
+@pytest.mark.django_db
+def test_admin_course_inline_adds_lesson_last(admin_client, course1):
+    lesson1, lesson2 = Lesson.objects.filter(course=course1)
+    data = {
+        "title": course1.title,
+        "description": course1.description,
+        "created_by": course1.created_by_id,
+        "is_published": "on",
+        "lessons-TOTAL_FORMS": "3",
+        "lessons-INITIAL_FORMS": "2",
+        "lessons-0-id": lesson1.id,
+        "lessons-0-course": course1.id,
+        "lessons-0-title": lesson1.title,
+        "lessons-1-id": lesson2.id,
+        "lessons-1-course": course1.id,
+        "lessons-1-title": lesson2.title,
+        "lessons-2-course": course1.id,
+        "lessons-2-title": "New Lesson",
+    }
+
+    response = admin_client.post(
+        reverse("admin:courses_course_change", args=[course1.id]), data
+    )
+
+    assert response.status_code == status.HTTP_302_FOUND
+    assert list(
+        Lesson.objects.filter(course=course1).values_list("title", "order")
+    ) == [
+        ("Lesson 1", lesson1.order),
+        ("Lesson 2", lesson2.order),
+        ("New Lesson", lesson2.order + LESSON_ORDER_STEP),
+    ]
@@ -0,0 +1,128 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from courses.models import Lesson
+
+
+@pytest.fixture
+def course_lessons(setup_users_and_courses, create_lesson):
+    """Course 1 with four lessons, taught by the instructor user."""
+    course1 = setup_users_and_courses["course1"]
+    course1.assign_instructor(setup_users_and_courses["instructor_user"])
+    create_lesson(course1, "Lesson 3", order=3)
+    create_lesson(course1, "Lesson 4", order=7)
+    return course1, list(Lesson.objects.filter(course=course1))
+
+
+def reorder(api_client, course, data):
+    return api_client.post(
+        reverse("course-lessons-reorder", kwargs={"course_pk": course.id}),
+        data,
+        format="json",
+    )
+
+
+@pytest.mark.django_db
+def test_reorder_lessons(api_client, setup_users_and_courses, course_lessons):
+    course1, lessons = course_lessons
+    api_client.force_authenticate(user=setup_users_and_courses["instructor_user"])
+    new_order = [lessons[3].id, lessons[1].id, lessons[0].id, lessons[2].id]
+
+    with CaptureQueriesContext(connection) as context:
+        response = reorder(api_client, course1, {"lessons": new_order})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [lesson["id"] for lesson in response.data] == new_order
+    assert [lesson["order"] for lesson in response.data] == [1, 2, 3, 4]
+    updates = [
+        query["sql"]
+        for query in context.captured_queries
+        if query["sql"].lstrip().startswith("UPDATE courses_lesson")
+    ]
+    assert len(updates) == 1
+
+
+@pytest.mark.django_db
+def test_move_lesson(api_client, setup_users_and_courses, course_lessons):
+    course1, lessons = course_lessons
+    api_client.force_authenticate(user=setup_users_and_courses["instructor_user"])
+
+    response = reorder(api_client, course1, {"lesson": lessons[3].id, "position": 3})
+
+    assert response.status_code == status.HTTP_200_OK
+    new_order = [lessons[0].id, lessons[1].id, lessons[3].id, lessons[2].id]
+    assert [lesson["id"] for lesson in response.data] == new_order
+    assert [lesson["order"] for lesson in response.data] == [1, 2, 3, 4]
+    assert (
+        list(Lesson.objects.filter(course=course1).values_list("id", flat=True))
+        == new_order
+    )
+    # The lessons before the moved one are not touched
+    unchanged = Lesson.objects.filter(pk__in=[lessons[0].id, lessons[1].id])
+    assert [(lesson.order, lesson.updated_at) for lesson in unchanged] == [
+        (lessons[0].order, lessons[0].updated_at),
+        (lessons[1].order, lessons[1].updated_at),
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "user_role, expected_status",
+    [
+        ("student_user", status.HTTP_403_FORBIDDEN),
+        ("another_instructor", status.HTTP_403_FORBIDDEN),
+        ("regular_user", status.HTTP_403_FORBIDDEN),
+    ],
+)
+def test_reorder_lessons_permissions(
+    api_client, setup_users_and_courses, course_lessons, user_role, expected_status
+):
+    course1, lessons = course_lessons
+    api_client.force_authenticate(user=setup_users_and_courses[user_role])
+
+    response = reorder(
+        api_client, course1, {"lessons": [lesson.id for lesson in reversed(lessons)]}
+    )
+
+    assert response.status_code == expected_status
+    assert list(Lesson.objects.filter(course=course1).values_list("id", "order")) == [
+        (lesson.id, lesson.order) for lesson in lessons
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "make_data, error_field",
+    [
+        (lambda lessons: {}, "non_field_errors"),
+        (lambda lessons: {"lessons": []}, "lessons"),
+        (lambda lessons: {"lessons": [lessons[0].id, lessons[1].id]}, "lessons"),
+        (lambda lessons: {"lessons": [lessons[0].id] * 4}, "lessons"),
+        (
+            lambda lessons: {
+                "lessons": [lesson.id for lesson in lessons],
+                "position": 1,
+            },
+            "non_field_errors",
+        ),
+        (lambda lessons: {"lesson": lessons[0].id}, "non_field_errors"),
+        (lambda lessons: {"lesson": lessons[0].id, "position": 5}, "position"),
+        (lambda lessons: {"lesson": lessons[0].id, "position": 0}, "position"),
+        (lambda lessons: {"lesson": 10**9, "position": 1}, "lesson"),
+    ],
+)
+def test_reorder_lessons_invalid(
+    api_client, setup_users_and_courses, course_lessons, make_data, error_field
+):
+    course1, lessons = course_lessons
+    api_client.force_authenticate(user=setup_users_and_courses["instructor_user"])
+
+    response = reorder(api_client, course1, make_data(lessons))
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert error_field in response.data
+    assert list(Lesson.objects.filter(course=course1).values_list("id", "order")) == [
+        (lesson.id, lesson.order) for lesson in lessons
+    ]
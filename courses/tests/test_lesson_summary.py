@@ -0,0 +1,75 @@
+import hashlib
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+
+@pytest.mark.django_db
+def test_lesson_list_summary(api_client, setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    api_client.force_authenticate(user=setup_users_and_courses["student_user"])
+    url = reverse("course-lessons-list", kwargs={"course_pk": course1.id})
+
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(url, {"view": "summary"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == [
+        {
+            "id": lesson.id,
+            "title": lesson.title,
+            "order": lesson.order,
+            "content_length": len(lesson.content),
+            "content_hash": hashlib.sha256(lesson.content.encode()).hexdigest(),
+        }
+        for lesson in (
+            setup_users_and_courses["lesson1"],
+            setup_users_and_courses["lesson2"],
+        )
+    ]
+    # The length and hash were stored with the lesson; the content is not read
+    (statement,) = [
+        query["sql"]
+        for query in context.captured_queries
+        if 'FROM "courses_lesson"' in query["sql"]
+    ]
+    assert '"courses_lesson"."content"' not in statement
+    assert '"courses_lesson"."content_html"' not in statement
+
+
+@pytest.mark.django_db
+def test_lesson_summary_fields_and_detail(api_client, setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    lesson1 = setup_users_and_courses["lesson1"]
+    api_client.force_authenticate(user=setup_users_and_courses["student_user"])
+
+    response = api_client.get(
+        reverse("course-lessons-list", kwargs={"course_pk": course1.id}),
+        {"view": "summary", "fields": "id,content_hash"},
+    )
+    assert [set(lesson) for lesson in response.data] == [{"id", "content_hash"}] * 2
+
+    # The detail keeps the full content
+    response = api_client.get(
+        reverse(
+            "course-lessons-detail", kwargs={"course_pk": course1.id, "pk": lesson1.id}
+        ),
+        {"view": "summary"},
+    )
+    assert response.data["content"] == lesson1.content
+
+
+@pytest.mark.django_db
+def test_lesson_list_invalid_view(api_client, setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    api_client.force_authenticate(user=setup_users_and_courses["student_user"])
+
+    response = api_client.get(
+        reverse("course-lessons-list", kwargs={"course_pk": course1.id}),
+        {"view": "outline"},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "view" in response.data
@@ -0,0 +1,105 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from courses.models import UserRole
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "user_role, expected_courses",
+    [
+        # Creators are instructors once a course is published
+        ("instructor_user", {"Course 1": ["instructor"]}),
+        ("student_user", {"Course 1": ["student"]}),
+        # Students do not see their unpublished courses
+        ("another_student", {}),
+        ("regular_user", {}),
+    ],
+)
+def test_my_courses(api_client, setup_users_and_courses, user_role, expected_courses):
+    setup_users_and_courses["course1"].publish()
+    api_client.force_authenticate(user=setup_users_and_courses[user_role])
+
+    response = api_client.get(reverse("course-mine"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert {
+        course["title"]: course["roles"] for course in response.data["results"]
+    } == expected_courses
+
+
+@pytest.mark.django_db
+def test_my_courses_lists_every_role_once(api_client, setup_users_and_courses):
+    course2 = setup_users_and_courses["course2"]
+    another_student = setup_users_and_courses["another_student"]
+    course2.assign_instructor(another_student)
+    api_client.force_authenticate(user=another_student)
+
+    response = api_client.get(reverse("course-mine"))
+
+    # Instructors see their unpublished courses
+    assert [
+        (course["title"], course["roles"]) for course in response.data["results"]
+    ] == [("Course 2", ["instructor", "student"])]
+
+
+@pytest.mark.django_db
+def test_my_courses_requires_authentication(api_client):
+    response = api_client.get(reverse("course-mine"))
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("course_count", [1, 30])
+def test_my_courses_query_count(
+    api_client,
+    create_user,
+    create_course,
+    django_assert_num_queries,
+    course_count,
+):
+    student = create_user("student", "student@example.com", "1234.qaz")
+    instructor_user = create_user(
+        "instructor_user", "instructor@example.com", "1234.qaz"
+    )
+    courses = [
+        create_course(instructor_user, f"Course {i}", "Description", is_published=True)
+        for i in range(course_count)
+    ]
+    UserRole.objects.bulk_create(
+        UserRole(user=student, course=course, role=UserRole.ROLE_STUDENT)
+        for course in courses
+    )
+    api_client.force_authenticate(user=student)
+
+    # One query for the whole page, whatever the number of courses
+    with django_assert_num_queries(1):
+        response = api_client.get(reverse("course-mine"), {"page_size": 20})
+
+    assert len(response.data["results"]) == min(course_count, 20)
+    assert (response.data["next"] is not None) == (course_count > 20)
+
+
+@pytest.mark.django_db
+def test_my_courses_pagination(api_client, create_user, create_course):
+    student = create_user("student", "student@example.com", "1234.qaz")
+    instructor_user = create_user(
+        "instructor_user", "instructor@example.com", "1234.qaz"
+    )
+    courses = [
+        create_course(instructor_user, f"Course {i}", "Description", is_published=True)
+        for i in range(5)
+    ]
+    for course in courses:
+        course.enroll_student(student)
+    api_client.force_authenticate(user=student)
+
+    url = f"{reverse('course-mine')}?page_size=2"
+    seen = []
+    while url:
+        response = api_client.get(url)
+        seen.extend(course["id"] for course in response.data["results"])
+        url = response.data["next"]
+
+    assert seen == [course.id for course in reversed(courses)]
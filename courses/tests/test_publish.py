@@ -0,0 +1,121 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from courses.models import Course, UserRole
+
+
+@pytest.fixture
+def drafts(create_user, create_course):
+    """Unpublished courses of two instructors, without instructor roles yet."""
+    instructor_user = create_user(
+        "instructor_user", "instructor@example.com", "1234.qaz"
+    )
+    another_instructor = create_user(
+        "another_instructor", "another_instructor@example.com", "1234.qaz"
+    )
+    courses = [
+        create_course(instructor_user, f"Course {i}", "Description") for i in range(3)
+    ]
+    courses.append(create_course(another_instructor, "Course 3", "Description"))
+    return courses
+
+
+def instructors(courses):
+    return set(
+        UserRole.objects.filter(
+            course__in=courses, role=UserRole.ROLE_INSTRUCTOR
+        ).values_list("course", "user")
+    )
+
+
+@pytest.mark.django_db
+def test_queryset_publish(drafts, django_assert_num_queries):
+    drafts[0].assign_instructor(drafts[0].created_by)
+
+    # One INSERT and one UPDATE, inside a savepoint
+    with django_assert_num_queries(4):
+        published = Course.objects.filter(pk__in=[c.pk for c in drafts]).publish()
+
+    assert published == 4
+    assert Course.objects.filter(is_published=True).count() == 4
+    assert instructors(drafts) == {(c.pk, c.created_by_id) for c in drafts}
+
+    # Publishing again changes nothing
+    assert Course.objects.publish() == 0
+    assert UserRole.objects.count() == 4
+
+
+@pytest.mark.django_db
+def test_queryset_publish_filtered_on_is_published(drafts):
+    published = Course.objects.filter(is_published=False, pk=drafts[0].pk).publish()
+
+    assert published == 1
+    assert instructors(drafts) == {(drafts[0].pk, drafts[0].created_by_id)}
+
+
+@pytest.mark.django_db
+def test_course_bulk_publish(api_client, drafts):
+    instructor_user = drafts[0].created_by
+    for course in drafts:
+        course.assign_instructor(course.created_by)
+    api_client.force_authenticate(user=instructor_user)
+    url = reverse("course-bulk-publish")
+
+    response = api_client.post(
+        url, {"courses": [c.pk for c in drafts[:2]]}, format="json"
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == {"published": 2}
+    assert set(Course.objects.filter(is_published=True)) == set(drafts[:2])
+
+    # Anonymous users now see the published courses
+    api_client.force_authenticate(user=None)
+    response = api_client.get(reverse("course-list"))
+    assert len(response.data["results"]) == 2
+
+
+@pytest.mark.django_db
+def test_course_bulk_publish_requires_instructor_of_every_course(api_client, drafts):
+    for course in drafts:
+        course.assign_instructor(course.created_by)
+    api_client.force_authenticate(user=drafts[0].created_by)
+
+    response = api_client.post(
+        reverse("course-bulk-publish"),
+        {"courses": [drafts[0].pk, drafts[3].pk, 999999]},
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+    assert f"{drafts[3].pk}, 999999" in response.data["detail"]
+    assert not Course.objects.filter(is_published=True).exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("data", [{}, {"courses": []}, {"courses": ["abc"]}])
+def test_course_bulk_publish_invalid(api_client, drafts, data):
+    api_client.force_authenticate(user=drafts[0].created_by)
+
+    response = api_client.post(reverse("course-bulk-publish"), data, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_admin_publish_courses(admin_client, drafts):
+    url = reverse("admin:courses_course_changelist")
+
+    response = admin_client.post(
+        url,
+        {
+            "action": "publish_courses",
+            "_selected_action": [c.pk for c in drafts[:3]],
+        },
+        follow=True,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "3 courses have been published." in response.content.decode()
+    assert Course.objects.filter(is_published=True).count() == 3
+    assert instructors(drafts) == {(c.pk, c.created_by_id) for c in drafts[:3]}
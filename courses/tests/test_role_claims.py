@@ -0,0 +1,126 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+from courses.models import UserRole
+from users.tokens import COURSE_ROLES_CLAIM, CourseRoleRefreshToken
+
+
+@pytest.fixture
+def role_claims(settings):
+    settings.COURSE_ROLE_CLAIMS = True
+
+
+def authenticate(api_client, user):
+    access = CourseRoleRefreshToken.for_user(user).access_token
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+    return access
+
+
+@pytest.mark.django_db
+def test_token_endpoints_claim_roles(api_client, setup_users_and_courses, role_claims):
+    student_user = setup_users_and_courses["student_user"]
+    course1 = setup_users_and_courses["course1"]
+    course3 = setup_users_and_courses["course3"]
+
+    response = api_client.post(
+        reverse("token_obtain_pair"),
+        {"username": student_user.username, "password": "1234.qaz"},
+    )
+    assert AccessToken(response.data["access"])[COURSE_ROLES_CLAIM] == {
+        UserRole.ROLE_STUDENT: [course1.id]
+    }
+
+    # Refreshed access tokens claim the current roles
+    course3.enroll_student(student_user)
+    response = api_client.post(
+        reverse("token_refresh"), {"refresh": response.data["refresh"]}
+    )
+    assert AccessToken(response.data["access"])[COURSE_ROLES_CLAIM] == {
+        UserRole.ROLE_STUDENT: [course1.id, course3.id]
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"COURSE_ROLE_CLAIMS": False},
+        # Too many roles for the token
+        {"COURSE_ROLE_CLAIMS": True, "COURSE_ROLE_CLAIMS_MAX_ROLES": 0},
+    ],
+)
+def test_token_without_role_claims(setup_users_and_courses, settings, overrides):
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    student_user = setup_users_and_courses["student_user"]
+
+    access = CourseRoleRefreshToken.for_user(student_user).access_token
+
+    assert COURSE_ROLES_CLAIM not in access
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("enabled, expected_queries", [(True, 2), (False, 3)])
+def test_list_lessons_trusts_role_claims(
+    api_client,
+    setup_users_and_courses,
+    settings,
+    django_assert_num_queries,
+    enabled,
+    expected_queries,
+):
+    settings.COURSE_ROLE_CLAIMS = enabled
+    course1 = setup_users_and_courses["course1"]
+    authenticate(api_client, setup_users_and_courses["student_user"])
+    url = reverse("course-lessons-list", kwargs={"course_pk": course1.id})
+
+    # The user, then the lessons; without claims, the course and roles too
+    with django_assert_num_queries(expected_queries):
+        response = api_client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data) == 2
+
+
+@pytest.mark.django_db
+def test_roles_missing_from_claims_are_looked_up(
+    api_client, setup_users_and_courses, role_claims
+):
+    course1 = setup_users_and_courses["course1"]
+    lesson1 = setup_users_and_courses["lesson1"]
+    regular_user = setup_users_and_courses["regular_user"]
+    authenticate(api_client, regular_user)
+
+    course1.enroll_student(regular_user)
+    response = api_client.get(
+        reverse(
+            "course-lessons-detail",
+            kwargs={"course_pk": course1.id, "pk": lesson1.id},
+        )
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "enabled, expected_status",
+    [(True, status.HTTP_200_OK), (False, status.HTTP_403_FORBIDDEN)],
+)
+def test_course_update_trusts_role_claims(
+    api_client, setup_users_and_courses, settings, enabled, expected_status
+):
+    settings.COURSE_ROLE_CLAIMS = enabled
+    instructor_user = setup_users_and_courses["instructor_user"]
+    course1 = setup_users_and_courses["course1"]
+    course1.assign_instructor(instructor_user)
+    authenticate(api_client, instructor_user)
+
+    # Claimed roles hold until the access token expires
+    UserRole.objects.filter(user=instructor_user, course=course1).delete()
+    response = api_client.patch(
+        reverse("course-detail", kwargs={"pk": course1.id}), {"title": "Renamed"}
+    )
+
+    assert response.status_code == expected_status
@@ -0,0 +1,177 @@
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import reverse
+from rest_framework import status
+from courses.models import Course, EnrollmentRequest, UserRole
+from courses.roles import (
+    RoleCacheMiddleware,
+    get_user_roles,
+    local_roles,
+    reset_role_cache_stats,
+    role_cache_stats,
+)
+from courses.roster import enroll_roster
+
+
+def run_in_request(func):
+    """
+    Runs the function as the view of a request, within RoleCacheMiddleware.
+    """
+    results = []
+
+    def view(request):
+        results.append(func())
+        return HttpResponse()
+
+    RoleCacheMiddleware(view)(RequestFactory().get("/"))
+    return results[0]
+
+
+@pytest.mark.django_db
+def test_roles_loaded_once_per_request(
+    setup_users_and_courses, django_assert_num_queries
+):
+    course1 = setup_users_and_courses["course1"]
+    student_user = setup_users_and_courses["student_user"]
+
+    def lookups():
+        with django_assert_num_queries(1):
+            return [
+                UserRole.objects.is_role(student_user, course1, UserRole.ROLE_STUDENT),
+                student_user.is_student_in_course(course1),
+                student_user.is_instructor_in_course(course1.pk),
+                get_user_roles(student_user, course1),
+            ]
+
+    assert run_in_request(lookups) == [True, True, False, {UserRole.ROLE_STUDENT}]
+    assert get_user_roles(AnonymousUser(), course1) == frozenset()
+
+
+@pytest.mark.django_db
+def test_roles_cached_across_requests(
+    setup_users_and_courses, django_assert_num_queries
+):
+    course1 = setup_users_and_courses["course1"]
+    student_user = setup_users_and_courses["student_user"]
+    reset_role_cache_stats()
+
+    with django_assert_num_queries(1):
+        for _ in range(3):
+            assert run_in_request(lambda: student_user.is_student_in_course(course1))
+    # Another process, with an empty in-process tier, reads the shared cache
+    local_roles.clear()
+    with django_assert_num_queries(0):
+        assert student_user.is_student_in_course(course1)
+
+    assert role_cache_stats() == {"local_hits": 2, "shared_hits": 1, "misses": 1}
+
+
+@pytest.mark.django_db
+def test_local_role_cache_eviction(setup_users_and_courses, settings):
+    settings.COURSE_ROLE_CACHE_LOCAL_SIZE = 2
+    student_user = setup_users_and_courses["student_user"]
+    courses = [setup_users_and_courses[f"course{i}"] for i in (1, 2, 3)]
+    for course in courses:
+        get_user_roles(student_user, course)
+
+    # The least recently used entry was evicted
+    assert local_roles.get((student_user.pk, courses[0].pk)) is None
+    assert local_roles.get((student_user.pk, courses[2].pk)) == set()
+
+    settings.COURSE_ROLE_CACHE_LOCAL_TIMEOUT = 0
+    get_user_roles(student_user, courses[0])
+    assert local_roles.get((student_user.pk, courses[0].pk)) is None
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda course, user: course.enroll_student(user),
+        lambda course, user: UserRole.objects.create(
+            user=user, course=course, role=UserRole.ROLE_STUDENT
+        ),
+        lambda course, user: list(enroll_roster(course, [user.username])),
+        lambda course, user: (
+            EnrollmentRequest.objects.enqueue(user, course),
+            EnrollmentRequest.objects.drain(),
+        ),
+    ],
+)
+def test_roles_forgotten_on_enrollment(setup_users_and_courses, change):
+    course1 = setup_users_and_courses["course1"]
+    regular_user = setup_users_and_courses["regular_user"]
+    assert not regular_user.is_student_in_course(course1)
+
+    change(course1, regular_user)
+
+    assert regular_user.is_student_in_course(course1)
+
+
+@pytest.mark.django_db
+def test_roles_forgotten_on_publish_and_delete(setup_users_and_courses):
+    course2 = setup_users_and_courses["course2"]
+    instructor_user = setup_users_and_courses["instructor_user"]
+    assert not instructor_user.is_instructor_in_course(course2)
+
+    Course.objects.filter(pk=course2.pk).publish()
+    assert instructor_user.is_instructor_in_course(course2)
+
+    UserRole.objects.filter(course=course2).delete()
+    assert not instructor_user.is_instructor_in_course(course2)
+
+
+@pytest.mark.django_db
+def test_roles_forgotten_after_a_write(setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    regular_user = setup_users_and_courses["regular_user"]
+
+    def enroll():
+        before = regular_user.is_student_in_course(course1)
+        course1.enroll_student(regular_user)
+        return before, regular_user.is_student_in_course(course1)
+
+    assert run_in_request(enroll) == (False, True)
+
+
+@pytest.mark.django_db
+def test_roles_forgotten_while_loading(setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    student_user = setup_users_and_courses["student_user"]
+    revoked = []
+
+    def revoke_after_read(execute, sql, params, many, context):
+        # The role is revoked between the read and the caching of its result
+        result = execute(sql, params, many, context)
+        if not revoked:
+            revoked.append(True)
+            UserRole.objects.filter(user=student_user, course=course1).delete()
+        return result
+
+    with connection.execute_wrapper(revoke_after_read):
+        assert student_user.is_student_in_course(course1)
+
+    # Another process reads the shared cache
+    local_roles.clear()
+    assert not student_user.is_student_in_course(course1)
+
+
+@pytest.mark.django_db
+def test_retrieve_lesson_num_queries(
+    api_client, setup_users_and_courses, django_assert_num_queries
+):
+    course1 = setup_users_and_courses["course1"]
+    lesson1 = setup_users_and_courses["lesson1"]
+    api_client.force_authenticate(user=setup_users_and_courses["student_user"])
+    url = reverse(
+        "course-lessons-detail", kwargs={"course_pk": course1.id, "pk": lesson1.id}
+    )
+
+    # The course with the user's roles, the validators and the lesson
+    with django_assert_num_queries(3):
+        response = api_client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
@@ -0,0 +1,183 @@
+import json
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse
+from rest_framework import status
+from courses.models import UserRole
+from courses.views import CourseViewSet
+
+User = get_user_model()
+
+
+@pytest.fixture
+def learners(db):
+    """Learners with predictable usernames and emails."""
+    return [
+        User.objects.create_user(
+            username=f"learner{i}", email=f"learner{i}@example.com"
+        )
+        for i in range(5)
+    ]
+
+
+def read_results(response):
+    content = b"".join(response.streaming_content).decode()
+    return [json.loads(line) for line in content.splitlines()]
+
+
+def students(course):
+    return set(
+        UserRole.objects.filter(course=course, role=UserRole.ROLE_STUDENT).values_list(
+            "user__username", flat=True
+        )
+    )
+
+
+@pytest.mark.django_db
+def test_roster_json_list(api_client, setup_users_and_courses, learners, monkeypatch):
+    monkeypatch.setattr(CourseViewSet, "roster_batch_size", 3)
+    course1 = setup_users_and_courses["course1"]
+    course1.publish()
+    course1.enroll_student(learners[0])
+    api_client.force_authenticate(user=course1.created_by)
+    url = reverse("course-roster", kwargs={"pk": course1.id})
+
+    response = api_client.post(
+        url,
+        ["learner0", "learner1@example.com", "learner1", "nobody", "", "learner2"],
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/x-ndjson"
+    results = read_results(response)
+    assert [result.get("status") for result in results] == [
+        "already_enrolled",
+        "enrolled",
+        "already_enrolled",
+        None,
+        "not_found",
+        "invalid",
+        "enrolled",
+        None,
+    ]
+    assert results[3]["progress"]["processed"] == 3
+    assert results[-1]["progress"] == {
+        "processed": 6,
+        "enrolled": 2,
+        "already_enrolled": 2,
+        "not_found": 1,
+        "ambiguous": 0,
+        "invalid": 1,
+    }
+    assert {"learner0", "learner1", "learner2"} <= students(course1)
+    course1.refresh_from_db()
+    assert course1.student_count == 4
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "name, content",
+    [
+        (
+            "roster.csv",
+            b"email,name\nlearner1@example.com,One\nlearner2@example.com,Two\n",
+        ),
+        ("roster.csv", b"learner1\nlearner2\n"),
+        ("roster.json", b'["learner1", "learner2@example.com"]'),
+    ],
+)
+def test_roster_upload(api_client, setup_users_and_courses, learners, name, content):
+    course1 = setup_users_and_courses["course1"]
+    api_client.force_authenticate(user=User.objects.create_user("staff", is_staff=True))
+    url = reverse("course-roster", kwargs={"pk": course1.id})
+
+    response = api_client.post(
+        url, {"file": SimpleUploadedFile(name, content)}, format="multipart"
+    )
+
+    results = read_results(response)
+    assert [result["status"] for result in results[:-1]] == ["enrolled", "enrolled"]
+    assert {"learner1", "learner2"} <= students(course1)
+
+
+@pytest.mark.django_db
+def test_roster_ambiguous_identifier(api_client, setup_users_and_courses, learners):
+    course1 = setup_users_and_courses["course1"]
+    # Another account uses learner1's username as its email
+    User.objects.create_user(username="someone", email="learner1")
+    api_client.force_authenticate(user=User.objects.create_user("staff", is_staff=True))
+
+    response = api_client.post(
+        reverse("course-roster", kwargs={"pk": course1.id}), ["learner1"], format="json"
+    )
+
+    assert read_results(response)[0]["status"] == "ambiguous"
+    assert "learner1" not in students(course1)
+
+
+@pytest.mark.django_db
+def test_roster_unreadable_file(api_client, setup_users_and_courses, learners):
+    course1 = setup_users_and_courses["course1"]
+    api_client.force_authenticate(user=User.objects.create_user("staff", is_staff=True))
+    url = reverse("course-roster", kwargs={"pk": course1.id})
+
+    response = api_client.post(
+        url, {"file": SimpleUploadedFile("roster.json", b"{}")}, format="multipart"
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = api_client.post(
+        url, {"file": SimpleUploadedFile("roster.csv", b"\xff\xfe")}, format="multipart"
+    )
+    assert "error" in read_results(response)[-1]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "user_role, expected_status",
+    [
+        ("student_user", status.HTTP_403_FORBIDDEN),
+        ("regular_user", status.HTTP_403_FORBIDDEN),
+        (None, status.HTTP_401_UNAUTHORIZED),
+    ],
+)
+def test_roster_permissions(
+    api_client, setup_users_and_courses, user_role, expected_status
+):
+    course1 = setup_users_and_courses["course1"]
+    if user_role:
+        api_client.force_authenticate(user=setup_users_and_courses[user_role])
+
+    response = api_client.post(
+        reverse("course-roster", kwargs={"pk": course1.id}), ["learner"], format="json"
+    )
+
+    assert response.status_code == expected_status
+
+
+@pytest.mark.django_db
+def test_enroll_roster_command(setup_users_and_courses, learners, tmp_path, capsys):
+    course1 = setup_users_and_courses["course1"]
+    path = tmp_path / "roster.csv"
+    path.write_text("username\nlearner1\nlearner2\nnobody\n")
+
+    call_command("enroll_roster", course1.id, str(path), batch_size=2)
+
+    output = capsys.readouterr().out
+    assert '"processed": 3' in output
+    assert '"identifier": "nobody", "status": "not_found"' in output
+    assert '"identifier": "learner1"' not in output
+    assert {"learner1", "learner2"} <= students(course1)
+
+
+@pytest.mark.django_db
+def test_enroll_roster_command_unknown_course(tmp_path):
+    path = tmp_path / "roster.csv"
+    path.write_text("learner1\n")
+
+    with pytest.raises(CommandError):
+        call_command("enroll_roster", 999999, str(path))
@@ -0,0 +1,121 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from courses.models import Course
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "user_role, query, expected_titles",
+    [
+        # Published courses matching the query
+        ("unauthenticated_user", "django", ["Course 1", "Course 2"]),
+        # Unpublished courses stay hidden from other users
+        ("regular_user", "advanced", []),
+        # The creator also finds their unpublished courses
+        ("instructor_user", "advanced", ["Course 2"]),
+        # Stemming matches "beginner" against "Beginners"
+        ("regular_user", "beginner", ["Course 3"]),
+        # No match
+        ("regular_user", "haskell", []),
+    ],
+)
+def test_course_search(
+    api_client, setup_users_and_courses, user_role, query, expected_titles
+):
+    user_instance = setup_users_and_courses.get(user_role)
+    if user_instance:
+        api_client.force_authenticate(user=user_instance)
+
+    # Make Course 2 match "django" once it is visible
+    course2 = setup_users_and_courses["course2"]
+    if user_role == "unauthenticated_user":
+        course2.is_published = True
+        course2.save()
+
+    response = api_client.get(reverse("course-search"), {"q": query})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["count"] == len(expected_titles)
+    assert sorted(course["title"] for course in response.data["results"]) == (
+        expected_titles
+    )
+
+
+@pytest.mark.django_db
+def test_course_search_ranks_title_above_description(
+    api_client, create_user, create_course
+):
+    instructor_user = create_user(
+        "instructor_user", "instructor@example.com", "1234.qaz"
+    )
+    description_match = create_course(
+        instructor_user, "Web Basics", "Build APIs with Django.", is_published=True
+    )
+    title_match = create_course(
+        instructor_user, "Django Basics", "Build web APIs.", is_published=True
+    )
+
+    response = api_client.get(reverse("course-search"), {"q": "django"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [course["id"] for course in response.data["results"]] == [
+        title_match.id,
+        description_match.id,
+    ]
+    assert "search_vector" not in response.data["results"][0]
+
+
+@pytest.mark.django_db
+def test_course_search_vector_follows_updates(create_user, create_course):
+    instructor_user = create_user(
+        "instructor_user", "instructor@example.com", "1234.qaz"
+    )
+    course = create_course(instructor_user, "Django", "Web framework.")
+    assert list(Course.objects.search("django")) == [course]
+
+    course.title = "Flask"
+    with CaptureQueriesContext(connection) as context:
+        course.save()
+
+    # The vector is written by the UPDATE of the course itself
+    assert len(context.captured_queries) == 1
+
+    assert not Course.objects.search("django").exists()
+    assert list(Course.objects.search("flask")) == [course]
+
+
+@pytest.mark.django_db
+def test_course_search_paginates(api_client, create_user, create_course):
+    instructor_user = create_user(
+        "instructor_user", "instructor@example.com", "1234.qaz"
+    )
+    for i in range(5):
+        create_course(instructor_user, f"Django {i}", "Web.", is_published=True)
+
+    response = api_client.get(reverse("course-search"), {"q": "django", "page_size": 2})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["count"] == 5
+    assert len(response.data["results"]) == 2
+    assert response.data["next"] is not None
+
+
+@pytest.mark.django_db
+def test_course_search_requires_query(api_client):
+    response = api_client.get(reverse("course-search"), {"q": "  "})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "q" in response.data
+
+
+@pytest.mark.django_db
+def test_course_admin_search(admin_client, setup_users_and_courses):
+    url = reverse("admin:courses_course_changelist")
+
+    response = admin_client.get(url, {"q": "beginner"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert list(response.context["cl"].queryset) == [setup_users_and_courses["course3"]]
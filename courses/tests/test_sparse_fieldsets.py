@@ -0,0 +1,112 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+
+def select_statements(context, table):
+    return [
+        query["sql"]
+        for query in context.captured_queries
+        if query["sql"].startswith("SELECT") and f'FROM "{table}"' in query["sql"]
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "params, expected_fields",
+    [
+        (
+            {},
+            {
+                "id",
+                "title",
+                "description",
+                "is_published",
+                "created_at",
+                "updated_at",
+                "lesson_count",
+                "student_count",
+            },
+        ),
+        ({"fields": "id,title"}, {"id", "title"}),
+        (
+            {"omit": "description"},
+            {
+                "id",
+                "title",
+                "is_published",
+                "created_at",
+                "updated_at",
+                "lesson_count",
+                "student_count",
+            },
+        ),
+        ({"fields": "id,title,description", "omit": "description"}, {"id", "title"}),
+    ],
+)
+def test_course_list_sparse_fieldsets(
+    api_client, setup_users_and_courses, params, expected_fields
+):
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(reverse("course-list"), params)
+
+    assert response.status_code == status.HTTP_200_OK
+    for course in response.data["results"]:
+        assert set(course) == expected_fields
+
+    # Columns that are not rendered are not read either
+    (statement,) = select_statements(context, "courses_course")
+    assert ('"courses_course"."description"' in statement) == (
+        "description" in expected_fields
+    )
+
+
+@pytest.mark.django_db
+def test_course_detail_sparse_fieldsets(api_client, setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    url = reverse("course-detail", kwargs={"pk": course1.id})
+
+    response = api_client.get(url, {"fields": "title"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == {"title": course1.title}
+
+
+@pytest.mark.django_db
+def test_course_sparse_fieldsets_ignored_on_write(api_client, setup_users_and_courses):
+    api_client.force_authenticate(user=setup_users_and_courses["instructor_user"])
+    url = f"{reverse('course-list')}?fields=id"
+
+    response = api_client.post(
+        url, {"title": "New Course", "description": "Description"}, format="json"
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.data["title"] == "New Course"
+
+
+@pytest.mark.django_db
+def test_course_sparse_fieldsets_unknown_field(api_client, setup_users_and_courses):
+    response = api_client.get(reverse("course-list"), {"fields": "id,created_by"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "created_by" in str(response.data)
+
+
+@pytest.mark.django_db
+def test_lesson_list_sparse_fieldsets(api_client, setup_users_and_courses):
+    course1 = setup_users_and_courses["course1"]
+    api_client.force_authenticate(user=setup_users_and_courses["student_user"])
+    url = reverse("course-lessons-list", kwargs={"course_pk": course1.id})
+
+    with CaptureQueriesContext(connection) as context:
+        response = api_client.get(url, {"omit": "content"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [set(lesson) for lesson in response.data] == [
+        {"id", "title", "order", "course", "updated_at"}
+    ] * 2
+    for statement in select_statements(context, "courses_lesson"):
+        assert '"courses_lesson"."content"' not in statement
@@ -1,16 +1,185 @@
-from rest_framework import viewsets
-from rest_framework.permissions import IsAuthenticated
+import hashlib
+from rest_framework import status, viewsets
+from rest_framework.permissions import SAFE_METHODS, IsAuthenticated
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.exceptions import PermissionDenied
-from django.db.models import Q
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.renderers import JSONRenderer
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.db.models import Count, Exists, F, Max, OuterRef, Prefetch, Q
+from django.http import Http404, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.dateparse import parse_datetime
+from django.utils.http import http_date
 
-from .models import Course, Lesson, UserRole
-from .serializers import CourseSerializer, LessonSerializer
+from .cache import cache_catalog, catalog_cache_key, get_cached_catalog
+from .models import Course, EnrollmentRequest, Lesson, UserRole
+from .pagination import CourseCursorPagination, CourseSearchPagination
+from .renderers import LessonHTMLRenderer, NDJSONRenderer
+from .lesson_archive import read_lesson_archive
+from .roles import get_user_roles, set_user_roles
+from .roster import enroll_roster, read_json_roster, read_roster
+from .serializers import (
+    CourseDetailSerializer,
+    CoursePublishSerializer,
+    CourseSerializer,
+    LessonDigestSerializer,
+    LessonHTMLSerializer,
+    LessonImportSerializer,
+    LessonReorderSerializer,
+    LessonSerializer,
+    LessonSummarySerializer,
+    MyCourseSerializer,
+    parse_field_list,
+)
 from users.permissions import IsInstructorOrReadOnly, IsAuthorizedForLesson
+from users.tokens import get_claimed_roles, get_request_roles
 
 
-class CourseViewSet(viewsets.ModelViewSet):
+class SparseFieldsetViewMixin:
+    """
+    ViewSet mixin loading only the columns needed by the requested fields.
+    - Pairs with `SparseFieldsetMixin` on the serializer.
+    - `required_fields` lists model fields always loaded, e.g. for permission checks.
+    """
+
+    required_fields = ()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+
+        model_fields = {field.name for field in queryset.model._meta.concrete_fields}
+        columns = {queryset.model._meta.pk.name, *self.required_fields}
+        for field in self.get_serializer().fields.values():
+            source = field.source.split(".")[0]
+            if source in model_fields:
+                columns.add(source)
+        return queryset.only(*columns)
+
+
+class ConditionalGetMixin:
+    """
+    ViewSet mixin answering conditional GETs (`If-None-Match`,
+    `If-Modified-Since`) with 304 Not Modified, before anything is serialized.
+    - Lists are validated from the rows they fetch anyway: the requested page,
+      or the whole queryset when not paginated. Their `Last-Modified` comes
+      from `get_list_last_modified`.
+    - Details are validated from the row count and the latest `updated_at` of
+      the queryset.
+    - Details embedding other objects are validated from the rendered body,
+      see `has_row_validators`.
+    """
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            validators = self.get_page_validators(page)
+        else:
+            queryset = list(queryset)
+            validators = self.get_row_validators(queryset)
+
+        response = get_conditional_response(request, **validators)
+        if response is None:
+            serializer = self.get_serializer(
+                queryset if page is None else page, many=True
+            )
+            if page is None:
+                response = Response(serializer.data)
+            else:
+                response = self.get_paginated_response(serializer.data)
+        return self.set_validators(response, **validators)
+
+    def retrieve(self, request, *args, **kwargs):
+        if not self.has_row_validators():
+            response = super().retrieve(request, *args, **kwargs)
+            validators = self.make_validators(response.data, None)
+            conditional = get_conditional_response(request, **validators)
+            return self.set_validators(conditional or response, **validators)
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            queryset = self.filter_queryset(self.get_queryset()).filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+            validators = self.get_queryset_validators(queryset)
+        except (TypeError, ValueError, DjangoValidationError):
+            # A malformed lookup, e.g. a non-numeric pk
+            raise Http404
+        if validators["last_modified"] is None:
+            # Not found: let get_object() raise the 404
+            return super().retrieve(request, *args, **kwargs)
+
+        response = get_conditional_response(request, **validators)
+        if response is None:
+            response = super().retrieve(request, *args, **kwargs)
+        return self.set_validators(response, **validators)
+
+    def has_row_validators(self):
+        """
+        Whether the `updated_at` of the rows covers the whole representation.
+        """
+        return True
+
+    def get_queryset_validators(self, queryset):
+        """
+        Validators from a single aggregate query over the queryset.
+        """
+        state = queryset.order_by().aggregate(
+            count=Count("pk"), last_modified=Max("updated_at")
+        )
+        return self.make_validators(state["count"], state["last_modified"])
+
+    def get_page_validators(self, page):
+        """
+        Validators from the rows of an already fetched page.
+        """
+        links = (self.paginator.get_next_link(), self.paginator.get_previous_link())
+        return self.get_row_validators(page, links)
+
+    def get_row_validators(self, objs, *state):
+        """
+        Validators from already fetched rows, and any other state.
+        """
+        rows = [(obj.pk, obj.updated_at.isoformat()) for obj in objs]
+        return self.make_validators(rows, *state, self.get_list_last_modified(objs))
+
+    def get_list_last_modified(self, objs):
+        """
+        The `Last-Modified` of a list, or None to validate it by ETag only.
+        - None by default: a row deleted or leaving the list does not advance
+          the latest `updated_at` of the remaining ones.
+        """
+        return None
+
+    def make_validators(self, *state):
+        """
+        Hashes the state with everything else that shapes the response body.
+        """
+        last_modified = state[-1]
+        key = repr((self.request.user.pk, self.request.get_full_path(), *state))
+        return {
+            "etag": quote_etag(hashlib.md5(key.encode()).hexdigest()),
+            "last_modified": last_modified and int(last_modified.timestamp()),
+        }
+
+    def set_validators(self, response, etag, last_modified):
+        if response.status_code in (200, 304):
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified)
+        return response
+
+
+class CourseViewSet(
+    ConditionalGetMixin, SparseFieldsetViewMixin, viewsets.ModelViewSet
+):
     """
     ViewSet for managing courses:
     - Instructors can create, update, or delete courses.
@@ -21,6 +190,12 @@ class CourseViewSet(viewsets.ModelViewSet):
     queryset = Course.objects.all()
     serializer_class = CourseSerializer
     permission_classes = [IsInstructorOrReadOnly]
+    pagination_class = CourseCursorPagination
+    # Read by the cursor position and the conditional GET validators
+    required_fields = ("created_at", "updated_at", "lesson_count", "student_count")
+    export_chunk_size = 2000
+    bulk_create_max_items = 1000
+    roster_batch_size = 1000
 
     def get_queryset(self):
         """
@@ -28,32 +203,401 @@ class CourseViewSet(viewsets.ModelViewSet):
         - Authenticated users: Courses they created or published courses.
         - Unauthenticated users: Published courses only.
         """
-        user = self.request.user
-        if user.is_authenticated:
-            return Course.objects.filter(
-                Q(is_published=True) | Q(created_by=user)
-            ).distinct()
-        return Course.objects.filter(is_published=True)
+        queryset = Course.objects.visible_to(self.request.user)
+        expand = self.get_expand() if self.action == "retrieve" else set()
+        if "lessons" in expand:
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "lessons",
+                    queryset=Lesson.objects.only(
+                        "course", "title", "order"
+                    ).with_positions(),
+                )
+            )
+        if "instructor" in expand:
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "roles",
+                    queryset=UserRole.objects.filter(role=UserRole.ROLE_INSTRUCTOR)
+                    .select_related("user")
+                    .order_by("pk"),
+                    to_attr="instructor_roles",
+                )
+            )
+        return queryset
+
+    def get_object(self):
+        """
+        The course of the URL.
+        - `?expand=lessons` is only allowed to the users who can list the
+          lessons themselves: instructors of the course, and students of a
+          published course.
+        """
+        course = super().get_object()
+        if self.action == "retrieve" and "lessons" in self.get_expand():
+            roles = get_request_roles(self.request, course)
+            if UserRole.ROLE_INSTRUCTOR not in roles and not (
+                UserRole.ROLE_STUDENT in roles and course.is_published
+            ):
+                self.permission_denied(
+                    self.request,
+                    message="Only instructors and enrolled students can expand lessons.",
+                )
+        return course
+
+    def get_serializer_class(self):
+        if self.action == "retrieve" and self.get_expand():
+            return CourseDetailSerializer
+        return super().get_serializer_class()
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action == "retrieve":
+            context["expand"] = self.get_expand()
+        return context
+
+    def get_expand(self, allowed=CourseDetailSerializer.expandable_fields):
+        """
+        The related objects requested with `?expand=a,b`.
+        """
+        expand = parse_field_list(self.request.query_params.get("expand", ""))
+        unknown = expand - set(allowed)
+        if unknown:
+            raise ValidationError(
+                {"expand": f"Cannot expand: {', '.join(sorted(unknown))}."}
+            )
+        return expand
+
+    def has_row_validators(self):
+        # Lessons and instructors change without touching the course row
+        return not self.get_expand()
+
+    def list(self, request, *args, **kwargs):
+        """
+        List the visible courses.
+        - The anonymous JSON catalog is the same for everyone, so its rendered
+          pages are served from the shared cache until a course or lesson changes.
+        """
+        if request.user.is_authenticated or request.accepted_renderer.format != "json":
+            return super().list(request, *args, **kwargs)
+
+        key = catalog_cache_key(request)
+        response = get_cached_catalog(request, key)
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+            if response.status_code == 200:
+                cache_catalog(key, response)
+        return response
+
+    @action(detail=False, methods=["get"], pagination_class=CourseSearchPagination)
+    def search(self, request):
+        """
+        Full-text search over the visible courses, ranked by relevance.
+        - Matches in the title rank above matches in the description.
+        """
+        text = request.query_params.get("q", "").strip()
+        if not text:
+            raise ValidationError({"q": "This query parameter is required."})
 
-    @action(detail=True, methods=["post"], permission_classes=[IsAuthenticated])
+        page = self.paginate_queryset(
+            self.filter_queryset(self.get_queryset()).search(text)
+        )
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request):
+        """
+        Create many courses in one request, as instructor of all of them.
+        - The body is a list of courses, validated together.
+        - Nothing is created unless every course is valid; errors are
+          returned per item, in the order of the input.
+        """
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=self.bulk_create_max_items,
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="publish",
+        serializer_class=CoursePublishSerializer,
+    )
+    def bulk_publish(self, request):
+        """
+        Publish many courses at once.
+        - The user must be the instructor of every listed course; otherwise
+          nothing is published.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = set(serializer.validated_data["courses"])
+
+        courses = Course.objects.filter(
+            Exists(
+                UserRole.objects.filter(
+                    user=request.user,
+                    course=OuterRef("pk"),
+                    role=UserRole.ROLE_INSTRUCTOR,
+                )
+            ),
+            pk__in=ids,
+        )
+        with transaction.atomic():
+            allowed = set(courses.select_for_update().values_list("pk", flat=True))
+            if allowed != ids:
+                raise PermissionDenied(
+                    "You are not the instructor of courses: "
+                    f"{', '.join(map(str, sorted(ids - allowed)))}."
+                )
+            published = courses.publish()
+        return Response({"published": published})
+
+    @action(
+        detail=False,
+        methods=["get"],
+        permission_classes=[IsAuthenticated],
+        serializer_class=MyCourseSerializer,
+    )
+    def mine(self, request):
+        """
+        List the courses the requesting user teaches or is enrolled in, with
+        the user's roles, in a single query.
+        - Keyset-paginated like the course list, including `?ordering=`.
+        """
+        queryset = self.filter_queryset(Course.objects.with_roles_of(request.user))
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(
+        detail=False,
+        methods=["get"],
+        renderer_classes=[NDJSONRenderer, JSONRenderer],
+        pagination_class=None,
+    )
+    def export(self, request):
+        """
+        Stream every visible course for bulk pulls, in `id` order.
+        - `?format=ndjson` (default) streams one course per line,
+          `?format=json` a single JSON array.
+        - `?expand=lessons` nests the full lessons of the courses the user has a
+          role in (all courses for staff).
+        - `?updated_since=<ISO 8601>` keeps the courses changed since then,
+          including those whose lessons changed.
+        Courses are read from a server-side cursor `export_chunk_size` rows
+        at a time, so memory use does not grow with the catalog.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).order_by("pk")
+
+        since = request.query_params.get("updated_since")
+        if since is not None:
+            since = self.parse_updated_since(since)
+            queryset = queryset.filter(
+                Q(updated_at__gte=since)
+                | Exists(
+                    Lesson.objects.filter(course=OuterRef("pk"), updated_at__gte=since)
+                )
+            )
+
+        expand = self.get_expand(allowed=("lessons",))
+        if "lessons" in expand:
+            lessons = Lesson.objects.with_positions().order_by("order")
+            if not request.user.is_staff:
+                lessons = lessons.filter(
+                    Exists(
+                        UserRole.objects.filter(
+                            user=request.user.pk, course=OuterRef("course")
+                        )
+                    )
+                )
+            queryset = queryset.prefetch_related(Prefetch("lessons", queryset=lessons))
+
+        renderer = request.accepted_renderer
+        response = StreamingHttpResponse(
+            self.stream_export(
+                queryset.iterator(chunk_size=self.export_chunk_size),
+                renderer,
+                "lessons" in expand,
+            ),
+            content_type=renderer.media_type,
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="courses.{renderer.format}"'
+        )
+        return response
+
+    def parse_updated_since(self, value):
+        try:
+            since = parse_datetime(value)
+        except ValueError:
+            since = None
+        if since is None:
+            raise ValidationError(
+                {"updated_since": "Enter a valid ISO 8601 date and time."}
+            )
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since)
+        return since
+
+    def stream_export(self, courses, renderer, include_lessons):
+        """
+        Yields the rendered courses one at a time, serialized with a single
+        serializer instance each.
+        """
+        course_serializer = self.get_serializer()
+        # No request in the context: `?fields=` applies to the courses only
+        lesson_serializer = LessonSerializer()
+
+        if renderer.format == "json":
+            yield b"["
+        for index, course in enumerate(courses):
+            data = course_serializer.to_representation(course)
+            if include_lessons:
+                data["lessons"] = [
+                    lesson_serializer.to_representation(lesson)
+                    for lesson in course.lessons.all()
+                ]
+            if renderer.format == "json":
+                yield (b"," if index else b"") + renderer.render(data)
+            else:
+                yield renderer.render_line(data)
+        if renderer.format == "json":
+            yield b"]"
+
+    @action(
+        detail=True,
+        methods=["post"],
+        permission_classes=[IsAuthenticated],
+        renderer_classes=[NDJSONRenderer, JSONRenderer],
+    )
+    def roster(self, request, pk=None):
+        """
+        Enroll a roster of users as students, for the course instructors and staff.
+        - The body is a JSON list of usernames or emails, or a multipart
+          `file` holding a CSV (a `username`/`email` column, or the first
+          one) or a `.json` list.
+        - Streams NDJSON: a result per row and a progress report per batch of
+          `roster_batch_size` rows.
+        """
+        course = get_object_or_404(Course, pk=pk)
+        if not request.user.is_staff and not UserRole.objects.is_role(
+            request.user, course, UserRole.ROLE_INSTRUCTOR
+        ):
+            raise PermissionDenied("Only instructors can enroll a roster.")
+
+        try:
+            if "file" in request.FILES:
+                upload = request.FILES["file"]
+                identifiers = read_roster(upload, upload.name)
+            else:
+                identifiers = read_json_roster(request.data)
+        except ValueError as error:
+            raise ValidationError({"file": str(error)})
+
+        results = enroll_roster(course, identifiers, self.roster_batch_size)
+        return StreamingHttpResponse(
+            (NDJSONRenderer().render_line(result) for result in results),
+            content_type=NDJSONRenderer.media_type,
+        )
+
+    @action(detail=True, methods=["get", "post"], permission_classes=[IsAuthenticated])
     def enroll(self, request, pk=None):
         """
         Enroll the requesting user as a student in the specified course.
+        - 201 with `"status": "enrolled"` for a new enrollment.
+        - 200 with `"status": "already_enrolled"` if the user was enrolled before.
+        - 202 with `"status": "pending"` when queued: with `Prefer: respond-async`
+          or the COURSE_ENROLLMENT_ASYNC setting. The queue is drained by the
+          `drain_enrollments` command. Enrolled students are not queued again.
+        GET returns the enrollment status: `enrolled`, `pending` or `not_enrolled`.
         """
         course = self.get_object()
-        course.enroll_student(request.user)
-        return Response({"status": "enrolled"})
+        if request.method == "GET":
+            return Response({"status": self.get_enrollment_status(course)})
+
+        if self.wants_async_enrollment(request):
+            if UserRole.objects.is_role(request.user, course, UserRole.ROLE_STUDENT):
+                return Response({"status": "already_enrolled"})
+            EnrollmentRequest.objects.enqueue(request.user, course)
+            status_url = request.build_absolute_uri()
+            return Response(
+                {"status": "pending", "status_url": status_url},
+                status=status.HTTP_202_ACCEPTED,
+                headers={"Location": status_url},
+            )
+
+        if course.enroll_student(request.user):
+            return Response({"status": "enrolled"}, status=status.HTTP_201_CREATED)
+        return Response({"status": "already_enrolled"})
+
+    def wants_async_enrollment(self, request):
+        prefer = request.headers.get("Prefer", "")
+        return settings.COURSE_ENROLLMENT_ASYNC or "respond-async" in prefer
+
+    def get_enrollment_status(self, course):
+        user = self.request.user
+        if UserRole.objects.is_role(user, course, UserRole.ROLE_STUDENT):
+            return "enrolled"
+        if EnrollmentRequest.objects.filter(user=user, course=course).exists():
+            return "pending"
+        return "not_enrolled"
 
 
-class LessonViewSet(viewsets.ModelViewSet):
+class LessonViewSet(
+    ConditionalGetMixin, SparseFieldsetViewMixin, viewsets.ModelViewSet
+):
     """
     ViewSet for managing lessons:
     - Instructors can create, update, or delete lessons.
     - Students can view lessons from published courses.
+    - `?view=summary` lists the lessons without their content, with its
+      length and hash instead; the detail always has the full content.
+    - `?format=html` lists or retrieves the lessons as HTML, rendered from
+      their content when it was saved.
     """
 
     serializer_class = LessonSerializer
     permission_classes = [IsAuthenticated, IsAuthorizedForLesson]
+    required_fields = ("course", "updated_at")
+    import_max_items = 1000
+
+    def get_course(self):
+        """
+        The course of the URL, or None if it does not exist.
+        - Fetched once per request, by the permission check, together with
+          the user's roles in it, which are kept for `get_user_roles`.
+        """
+        if not hasattr(self, "_course"):
+            course_pk = self.kwargs.get("course_pk")
+            self._course = (
+                Course.objects.with_user_roles(self.request.user)
+                .filter(pk=course_pk)
+                .first()
+                if course_pk
+                else None
+            )
+            if self._course:
+                set_user_roles(self.request.user, self._course, self._course.user_roles)
+        return self._course
+
+    def get_course_roles(self):
+        """
+        The user's roles in the course of the URL.
+        - Read from the access token when it claims any, without a query.
+        - Otherwise fetched together with the course, see `get_course`.
+        """
+        course_pk = self.kwargs.get("course_pk")
+        user_roles = get_claimed_roles(self.request.auth, course_pk)
+        if user_roles or not self.get_course():
+            return user_roles
+        return get_user_roles(self.request.user, self.get_course())
 
     def get_queryset(self):
         """
@@ -65,29 +609,129 @@ class LessonViewSet(viewsets.ModelViewSet):
         if not course_pk:
             return Lesson.objects.none()
 
-        course = Course.objects.filter(pk=course_pk).first()
-        if not course:
+        user_roles = self.get_course_roles()
+        if UserRole.ROLE_INSTRUCTOR in user_roles:
+            lessons = Lesson.objects.filter(course_id=course_pk)
+        elif UserRole.ROLE_STUDENT in user_roles:
+            lessons = Lesson.objects.filter(
+                course_id=course_pk, course__is_published=True
+            )
+        else:
             return Lesson.objects.none()
 
-        if UserRole.objects.is_role(
-            self.request.user, course, UserRole.ROLE_INSTRUCTOR
-        ):
-            return Lesson.objects.filter(course=course)
-        elif UserRole.objects.is_role(self.request.user, course, UserRole.ROLE_STUDENT):
-            return Lesson.objects.filter(course=course, course__is_published=True)
-        return Lesson.objects.none()
+        if self.action == "list":
+            lessons = lessons.with_positions().annotate(
+                course_updated_at=F("course__updated_at")
+            )
+        if self.is_summary():
+            return lessons.with_content_summary()
+        return lessons
+
+    def has_row_validators(self):
+        # The position of a lesson changes when an earlier one is moved
+        return False
+
+    def get_list_last_modified(self, lessons):
+        # Creating or deleting a lesson touches its course, see the counter triggers
+        return max(
+            (max(lesson.updated_at, lesson.course_updated_at) for lesson in lessons),
+            default=None,
+        )
+
+    def get_renderers(self):
+        renderers = super().get_renderers()
+        if self.action in ("list", "retrieve"):
+            renderers.append(LessonHTMLRenderer())
+        return renderers
+
+    def get_serializer_class(self):
+        renderer = getattr(self.request, "accepted_renderer", None)
+        if renderer is not None and renderer.format == "html":
+            return LessonHTMLSerializer
+        if self.is_summary():
+            return LessonDigestSerializer
+        return super().get_serializer_class()
+
+    def is_summary(self):
+        """
+        Whether the lesson list was requested with `?view=summary`.
+        """
+        view = self.request.query_params.get("view", "full")
+        if view not in ("full", "summary"):
+            raise ValidationError({"view": "Must be `full` or `summary`."})
+        return self.action == "list" and view == "summary"
 
     def perform_create(self, serializer):
         """
         Create a new lesson in the specified course.
         - Only instructors can create lessons.
         """
-        course_pk = self.kwargs.get("course_pk")
-        course = Course.objects.get(pk=course_pk)
-
-        if not UserRole.objects.is_role(
-            self.request.user, course, UserRole.ROLE_INSTRUCTOR
-        ):
+        if UserRole.ROLE_INSTRUCTOR not in self.get_course_roles():
             raise PermissionDenied("Only instructors can create lessons.")
 
-        serializer.save(course=course)
+        serializer.save(course=self.get_course())
+
+    @action(detail=False, methods=["post"], serializer_class=LessonReorderSerializer)
+    def reorder(self, request, course_pk=None):
+        """
+        Reorder the lessons of the course, for its instructors.
+        - Takes the full new order, applied with a single set-based UPDATE,
+          see `LessonQuerySet.reorder`.
+        - Or the move of one lesson to a position, which only writes that
+          lesson, see `LessonQuerySet.move`.
+        - Returns the lessons in their new order.
+        """
+        if UserRole.ROLE_INSTRUCTOR not in self.get_course_roles():
+            raise PermissionDenied("Only instructors can reorder lessons.")
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        lessons = Lesson.objects.filter(course_id=course_pk)
+        with transaction.atomic():
+            Lesson.objects.lock_course(course_pk)
+            current_ids = list(lessons.order_by("order").values_list("pk", flat=True))
+            lesson_ids = serializer.get_lesson_ids(current_ids)
+            move = serializer.validated_data
+            if "lesson" in move:
+                Lesson.objects.move(move["lesson"], move["position"])
+            else:
+                Lesson.objects.reorder(lesson_ids)
+        return Response(
+            LessonSummarySerializer(lessons.with_positions(), many=True).data
+        )
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        url_name="import",
+        serializer_class=LessonImportSerializer,
+    )
+    def import_lessons(self, request, course_pk=None):
+        """
+        Import many lessons into the course, for its instructors.
+        - The body is a JSON list of lessons, or a multipart `file` holding a
+          zip of Markdown files.
+        - The lessons are appended after the existing ones, in the order of
+          the list or of the paths in the zip. They take no `order`; it is
+          returned as the position each lesson was imported at.
+        - The lessons are validated together and created with a single
+          INSERT; nothing is created unless every lesson is valid.
+        """
+        if UserRole.ROLE_INSTRUCTOR not in self.get_course_roles():
+            raise PermissionDenied("Only instructors can import lessons.")
+
+        data = request.data
+        if "file" in request.FILES:
+            try:
+                data = read_lesson_archive(request.FILES["file"], self.import_max_items)
+            except ValueError as error:
+                raise ValidationError({"file": str(error)})
+
+        serializer = self.get_serializer(
+            data=data, many=True, allow_empty=False, max_length=self.import_max_items
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save(course=self.get_course())
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
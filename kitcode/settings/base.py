@@ -42,6 +42,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.sites",
+    "django.contrib.postgres",
     "rest_framework",
     "drf_spectacular",
     "rest_framework_simplejwt",
@@ -67,6 +68,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "courses.roles.RoleCacheMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",
@@ -111,8 +113,16 @@ AUTHENTICATION_BACKENDS = [
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=5),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
+    "TOKEN_OBTAIN_SERIALIZER": "users.serializers.CustomTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "users.serializers.CustomTokenRefreshSerializer",
 }
 
+# When true, access tokens claim the user's course roles, which the lesson and
+# course permissions trust for the token's lifetime instead of querying them.
+# Users with more roles than COURSE_ROLE_CLAIMS_MAX_ROLES get no claim.
+COURSE_ROLE_CLAIMS = env.bool("COURSE_ROLE_CLAIMS", default=False)
+COURSE_ROLE_CLAIMS_MAX_ROLES = env.int("COURSE_ROLE_CLAIMS_MAX_ROLES", default=200)
+
 # Allow email and/or username authentication
 ACCOUNT_AUTHENTICATION_METHOD = "username_email"
 ACCOUNT_EMAIL_REQUIRED = True
@@ -174,6 +184,39 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Local memory by default; point CACHE_URL at Redis in production, e.g.
+# CACHE_URL=redis://127.0.0.1:6379/1
+
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+
+# Seconds a rendered page of the public course catalog stays cached. Pages are
+# also invalidated as soon as a course or lesson changes.
+COURSE_CATALOG_CACHE_TIMEOUT = env.int("COURSE_CATALOG_CACHE_TIMEOUT", default=3600)
+
+# Users' course roles are cached in the cache above, until they change, and in
+# a bounded in-process LRU. Another process may keep serving a changed role from
+# its LRU for up to COURSE_ROLE_CACHE_LOCAL_TIMEOUT seconds.
+COURSE_ROLE_CACHE_TIMEOUT = env.int("COURSE_ROLE_CACHE_TIMEOUT", default=3600)
+COURSE_ROLE_CACHE_LOCAL_TIMEOUT = env.int("COURSE_ROLE_CACHE_LOCAL_TIMEOUT", default=5)
+COURSE_ROLE_CACHE_LOCAL_SIZE = env.int("COURSE_ROLE_CACHE_LOCAL_SIZE", default=10000)
+
+
+# Enrollment
+# When true, every enroll request is queued and answered with 202 Accepted;
+# clients can also opt in per request with `Prefer: respond-async`. The queue
+# is drained by `python manage.py drain_enrollments`.
+COURSE_ENROLLMENT_ASYNC = env.bool("COURSE_ENROLLMENT_ASYNC", default=False)
+
+
+# Lesson import
+# Zips of Markdown lessons are rejected, before anything is decompressed, when a
+# file or all of them together would take more bytes than these.
+LESSON_IMPORT_MAX_FILE_SIZE = env.int("LESSON_IMPORT_MAX_FILE_SIZE", default=1 << 20)
+LESSON_IMPORT_MAX_SIZE = env.int("LESSON_IMPORT_MAX_SIZE", default=50 << 20)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
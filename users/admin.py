@@ -20,6 +20,12 @@ class CustomUserAdmin(UserAdmin):
     search_fields = ("username", "email", "first_name", "last_name")
     ordering = ("-date_joined",)
 
+    def get_search_results(self, request, queryset, search_term):
+        # Use the trigram-indexed lookup instead of ILIKE over every column
+        if not search_term:
+            return super().get_search_results(request, queryset, search_term)
+        return queryset.lookup(search_term), False
+
     # Specify the fields for the user detail page
     fieldsets = (
         (None, {"fields": ("username", "password")}),
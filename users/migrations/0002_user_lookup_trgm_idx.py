@@ -0,0 +1,44 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:35
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+import django.db.models.functions.text
+import users.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0001_initial"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AlterModelManagers(
+            name="user",
+            managers=[
+                ("objects", users.models.CustomUserManager()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        users.models.ConcatText(
+                            "username",
+                            models.Value(" "),
+                            "email",
+                            models.Value(" "),
+                            "first_name",
+                            models.Value(" "),
+                            "last_name",
+                        )
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="user_lookup_trgm_idx",
+            ),
+        ),
+    ]
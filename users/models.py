@@ -1,7 +1,69 @@
 from django.db import models
-from django.contrib.auth.models import AbstractUser
+from django.db.models import Q, Value
+from django.db.models.functions import Upper
+from django.contrib.auth.models import AbstractUser, UserManager
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import TrigramWordSimilarity
 from django.utils.translation import gettext_lazy as _
 
+from courses.roles import get_user_roles
+
+
+class ConcatText(models.Func):
+    """
+    Concatenates text expressions with the `||` operator.
+    Unlike `Concat`, which compiles to the STABLE CONCAT() function on
+    PostgreSQL, the result may be used in an index expression.
+    """
+
+    template = "(%(expressions)s)"
+    arg_joiner = " || "
+    output_field = models.TextField()
+
+
+def lookup_document():
+    """
+    Expression combining the account fields searched by `UserQuerySet.lookup`.
+    It is indexed with pg_trgm, so it must stay identical to the index definition.
+    """
+    return Upper(
+        ConcatText(
+            "username",
+            Value(" "),
+            "email",
+            Value(" "),
+            "first_name",
+            Value(" "),
+            "last_name",
+        )
+    )
+
+
+class UserQuerySet(models.QuerySet):
+    """
+    QuerySet for the User model, providing account lookup utilities.
+    """
+
+    def lookup(self, text):
+        """
+        Finds the users whose username, email or name contains the text or
+        closely resembles one of its words (pg_trgm word similarity), best
+        match first. Both predicates are served by the trigram GIN index.
+        """
+        text = text.strip().upper()
+        return (
+            self.alias(document=lookup_document())
+            .filter(Q(document__contains=text) | Q(document__trigram_word_similar=text))
+            .annotate(similarity=TrigramWordSimilarity(text, "document"))
+            .order_by("-similarity", "username")
+        )
+
+
+class CustomUserManager(UserManager.from_queryset(UserQuerySet)):
+    """
+    Manager for the User model, exposing the UserQuerySet utilities.
+    """
+
 
 class User(AbstractUser):
     """
@@ -20,8 +82,17 @@ class User(AbstractUser):
         help_text="Profile picture of the user.",
     )
 
+    objects = CustomUserManager()
+
     class Meta:
         ordering = ("-date_joined",)
+        indexes = [
+            GinIndex(
+                OpClass(lookup_document(), name="gin_trgm_ops"),
+                name="user_lookup_trgm_idx",
+            ),
+            models.Index(fields=["email"], name="user_email_idx"),
+        ]
 
     def __str__(self):
         return self.username
@@ -37,10 +108,10 @@ class User(AbstractUser):
         """
         Check if the user is a student in the specified course.
         """
-        return self.roles.filter(course=course, role="student").exists()
+        return "student" in get_user_roles(self, course)
 
     def is_instructor_in_course(self, course):
         """
         Check if the user is an instructor in the specified course.
         """
-        return self.roles.filter(course=course, role="instructor").exists()
+        return "instructor" in get_user_roles(self, course)
@@ -1,5 +1,6 @@
 from rest_framework import permissions
 from courses.models import UserRole
+from .tokens import get_request_roles
 
 
 class IsInstructorOrReadOnly(permissions.BasePermission):
@@ -26,9 +27,7 @@ class IsInstructorOrReadOnly(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return True
 
-        return UserRole.objects.is_role(
-            user=request.user, course=obj, role=UserRole.ROLE_INSTRUCTOR
-        )
+        return UserRole.ROLE_INSTRUCTOR in get_request_roles(request, obj)
 
 
 class IsAuthorizedForLesson(permissions.BasePermission):
@@ -37,6 +36,8 @@ class IsAuthorizedForLesson(permissions.BasePermission):
     - Grants access to lessons if the user is enrolled in the course
       (as an instructor or a student).
     - Write access is restricted to instructors only.
+    - The user's roles come from the access token claims when present, else
+      they are loaded once per request, with `view.get_course()`.
     """
 
     def has_permission(self, request, view) -> bool:
@@ -46,15 +47,7 @@ class IsAuthorizedForLesson(permissions.BasePermission):
         if not request.user.is_authenticated:
             return False
 
-        course_pk = view.kwargs.get("course_pk")
-        if not course_pk:
-            return False
-
-        return UserRole.objects.filter(
-            user=request.user,
-            course_id=course_pk,
-            role__in=[UserRole.ROLE_INSTRUCTOR, UserRole.ROLE_STUDENT],
-        ).exists()
+        return bool(view.get_course_roles())
 
     def has_object_permission(self, request, view, obj) -> bool:
         """
@@ -62,13 +55,8 @@ class IsAuthorizedForLesson(permissions.BasePermission):
         - Read-only access for enrolled users.
         - Write access for instructors only.
         """
+        user_roles = get_request_roles(request, obj.course_id)
         if request.method in permissions.SAFE_METHODS:
-            return UserRole.objects.filter(
-                user=request.user,
-                course=obj.course,
-                role__in=[UserRole.ROLE_INSTRUCTOR, UserRole.ROLE_STUDENT],
-            ).exists()
+            return bool(user_roles)
 
-        return UserRole.objects.is_role(
-            user=request.user, course=obj.course, role=UserRole.ROLE_INSTRUCTOR
-        )
+        return UserRole.ROLE_INSTRUCTOR in user_roles
@@ -4,9 +4,14 @@ from django.utils.translation import gettext_lazy as _
 from django.contrib.auth import get_user_model
 from allauth.account.models import EmailAddress
 from dj_rest_auth.serializers import PasswordResetSerializer
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
 from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework.exceptions import ValidationError
 from PIL import Image
+from .tokens import CourseRoleRefreshToken
 
 User = get_user_model()
 
@@ -131,3 +136,52 @@ class CustomUserDetailsSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(_("This email is already registered"))
 
         return value
+
+
+class UserLookupSerializer(serializers.ModelSerializer):
+    """
+    Serializer for staff account lookup results.
+    - `similarity` is the trigram word similarity of the best matching field.
+    """
+
+    similarity = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = User
+        fields = [
+            "id",
+            "username",
+            "email",
+            "first_name",
+            "last_name",
+            "is_active",
+            "similarity",
+        ]
+
+
+class PublicProfileSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the public profile of a user, e.g. a course instructor.
+    - Leaves out the email address and account flags.
+    """
+
+    class Meta:
+        model = User
+        fields = ["id", "username", "first_name", "last_name", "bio", "picture"]
+        read_only_fields = fields
+
+
+class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """
+    Issues access tokens claiming the user's course roles, when enabled.
+    """
+
+    token_class = CourseRoleRefreshToken
+
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refreshes access tokens claiming the user's current course roles, when enabled.
+    """
+
+    token_class = CourseRoleRefreshToken
@@ -0,0 +1,102 @@
+import pytest
+from rest_framework import status
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+
+User = get_user_model()
+
+
+@pytest.fixture
+def staff_user(db):
+    return User.objects.create_user(
+        username="staff_user", email="staff@example.com", is_staff=True
+    )
+
+
+@pytest.fixture
+def accounts(db):
+    """Accounts with overlapping names to rank against each other."""
+    sahar = User.objects.create_user(
+        username="sahar.farahzad",
+        email="sahar@example.com",
+        first_name="Sahar",
+        last_name="Farahzad",
+    )
+    sara = User.objects.create_user(
+        username="sara_farah",
+        email="sara@example.org",
+        first_name="Sara",
+        last_name="Farah",
+    )
+    User.objects.create_user(username="john_smith", email="john@example.com")
+    return {"sahar": sahar, "sara": sara}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "query, expected_usernames",
+    [
+        # Exact username
+        ("sahar.farahzad", ["sahar.farahzad"]),
+        # Exact email domain ranks above similar domains, case-insensitive
+        ("EXAMPLE.ORG", ["sara_farah", "john_smith", "sahar.farahzad", "staff_user"]),
+        # Typo in the last name ranks the intended account first
+        ("farahzd", ["sahar.farahzad", "sara_farah"]),
+        # Whole-word match ranks above a partial one
+        ("farah", ["sara_farah", "sahar.farahzad"]),
+        # No match
+        ("zzzz", []),
+    ],
+)
+def test_user_lookup(api_client, staff_user, accounts, query, expected_usernames):
+    api_client.force_authenticate(user=staff_user)
+
+    response = api_client.get(reverse("user_lookup"), {"q": query})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [user["username"] for user in response.data] == expected_usernames
+    similarities = [user["similarity"] for user in response.data]
+    assert similarities == sorted(similarities, reverse=True)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "is_staff, is_authenticated, expected_status",
+    [
+        (False, False, status.HTTP_401_UNAUTHORIZED),
+        (False, True, status.HTTP_403_FORBIDDEN),
+        (True, True, status.HTTP_200_OK),
+    ],
+)
+def test_user_lookup_is_staff_only(
+    api_client, create_user, is_staff, is_authenticated, expected_status
+):
+    user = create_user("user@example.com", "testpassword", "some_user")
+    user.is_staff = is_staff
+    user.save()
+    if is_authenticated:
+        api_client.force_authenticate(user=user)
+
+    response = api_client.get(reverse("user_lookup"), {"q": "some"})
+
+    assert response.status_code == expected_status
+
+
+@pytest.mark.django_db
+def test_user_lookup_requires_query(api_client, staff_user):
+    api_client.force_authenticate(user=staff_user)
+
+    response = api_client.get(reverse("user_lookup"))
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "q" in response.data
+
+
+@pytest.mark.django_db
+def test_user_admin_search(admin_client, accounts):
+    url = reverse("admin:users_user_changelist")
+
+    response = admin_client.get(url, {"q": "sahar"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert list(response.context["cl"].queryset) == [accounts["sahar"]]
@@ -0,0 +1,72 @@
+from django.conf import settings
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from courses.models import UserRole
+from courses.roles import get_user_roles
+
+COURSE_ROLES_CLAIM = "course_roles"
+
+
+def add_course_role_claims(token, user_id):
+    """
+    Embeds the user's course roles in the token as
+    `{"instructor": [course ids], "student": [course ids]}`.
+    - Users with more than COURSE_ROLE_CLAIMS_MAX_ROLES roles get no claim,
+      keeping the token small; their roles are looked up as usual.
+    """
+    max_roles = settings.COURSE_ROLE_CLAIMS_MAX_ROLES
+    roles = list(
+        UserRole.objects.filter(user_id=user_id)
+        .order_by("course_id")
+        .values_list("role", "course_id")[: max_roles + 1]
+    )
+    if len(roles) > max_roles:
+        return
+
+    claim = {}
+    for role, course_id in roles:
+        claim.setdefault(role, []).append(course_id)
+    token[COURSE_ROLES_CLAIM] = claim
+
+
+def get_claimed_roles(token, course):
+    """
+    Returns the roles the access token claims in the course (an instance or
+    a pk), or an empty frozenset.
+    """
+    if token is None or not settings.COURSE_ROLE_CLAIMS:
+        return frozenset()
+
+    course_id = str(getattr(course, "pk", course))
+    claim = token.get(COURSE_ROLES_CLAIM) or {}
+    return frozenset(
+        role for role, course_ids in claim.items() if course_id in map(str, course_ids)
+    )
+
+
+def get_request_roles(request, course):
+    """
+    Returns the roles of the request's user in the course.
+    - Roles claimed by the access token are trusted, without a query; they
+      may be as old as the token, see ACCESS_TOKEN_LIFETIME.
+    - Courses the token claims nothing in are looked up with `get_user_roles`,
+      so new roles apply at once.
+    """
+    return get_claimed_roles(request.auth, course) or get_user_roles(
+        request.user, course
+    )
+
+
+class CourseRoleRefreshToken(RefreshToken):
+    """
+    Refresh token whose access tokens claim the user's course roles, with
+    the COURSE_ROLE_CLAIMS setting. The refresh token itself claims none, so
+    every refreshed access token reads the current roles.
+    """
+
+    @property
+    def access_token(self):
+        access = super().access_token
+        if settings.COURSE_ROLE_CLAIMS:
+            add_course_role_claims(access, self[api_settings.USER_ID_CLAIM])
+        return access
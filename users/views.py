@@ -1,9 +1,11 @@
 from dj_rest_auth.registration.views import ResendEmailVerificationView
 from dj_rest_auth.views import LoginView
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework import generics
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAdminUser
 from django.contrib.auth import get_user_model
-from .serializers import CustomResendEmailVerificationSerializer
-
+from .serializers import CustomResendEmailVerificationSerializer, UserLookupSerializer
+from .tokens import CourseRoleRefreshToken
 
 User = get_user_model()
 
@@ -18,7 +20,7 @@ class CustomLoginView(LoginView):
         response = super().get_response()
 
         # Generate Simple JWT tokens
-        refresh = RefreshToken.for_user(self.user)
+        refresh = CourseRoleRefreshToken.for_user(self.user)
         access_token = str(refresh.access_token)
         refresh_token = str(refresh)
 
@@ -36,3 +38,22 @@ class CustomLoginView(LoginView):
         response.data["user"] = user_data
 
         return response
+
+
+class UserLookupView(generics.ListAPIView):
+    """
+    Staff-only account lookup:
+    - Matches `q` against the username, email and name of every account.
+    - Tolerates typos and returns the closest matches first.
+    """
+
+    serializer_class = UserLookupSerializer
+    permission_classes = [IsAdminUser]
+    pagination_class = None
+    max_results = 20
+
+    def get_queryset(self):
+        text = self.request.query_params.get("q", "").strip()
+        if not text:
+            raise ValidationError({"q": "This query parameter is required."})
+        return User.objects.lookup(text)[: self.max_results]